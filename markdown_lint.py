@@ -4,42 +4,75 @@ Simplified Markdown Linter for PanoramaBridge
 Only checks for the most important markdown issues without noise.
 """
 
+import re
 import sys
 from pathlib import Path
 
+# Each check is a single compiled multiline pattern run over the whole file in C,
+# so Python only sees the lines that actually have an issue. Python's re engine
+# backtracks rather than building a DFA, so the patterns are kept separate (one
+# alternation is slower) and as cheap to attempt per character as possible.
+# Lines longer than 200 chars once trailing whitespace is ignored (match ends at the last non-space)
+LONG_LINE_PATTERN = re.compile(r"^[^\n]{200,}\S", re.MULTILINE)
+# Fence without a language; no leading ^ so re can scan for the literal backticks,
+# matches not at the start of a line are dropped in check_markdown_file
+NO_CODE_LANG_PATTERN = re.compile(r"```[^\S\n]*$", re.MULTILINE)
+# Last whitespace character of a line; the rest of the run is found by walking back
+TRAILING_SPACE_PATTERN = re.compile(r"[^\S\n]$", re.MULTILINE)
+
+
+def _numbered(data: str, matches):
+    """Pair each match with its 1-based line number, counting newlines incrementally."""
+    line_num, pos = 1, 0
+    for match in matches:
+        start = match.start()
+        line_num += data.count("\n", pos, start)
+        pos = start
+        yield line_num, match
+
 
 def check_markdown_file(filepath: Path) -> list[tuple[int, str, str]]:
     """Check a markdown file for important issues only."""
     issues = []
 
     try:
-        with open(filepath, encoding="utf-8") as f:
-            lines = f.readlines()
+        data = Path(filepath).read_text(encoding="utf-8")
     except Exception as e:
         issues.append((0, "FILE_ERROR", f"Could not read file: {e}"))
         return issues
 
-    for i, line in enumerate(lines, 1):
-        line_stripped = line.rstrip()
-
-        # Check for extremely long lines (>200 chars) - only problematic cases
-        if len(line_stripped) > 200:
-            truncated = line_stripped[:100] + "..."
-            msg = f"Line extremely long ({len(line_stripped)} chars): "
-            msg += truncated
-            issues.append((i, "LONG_LINE", msg))
-
-        # Check for fenced code blocks without language
-        if line_stripped.startswith("```") and len(line_stripped) == 3:
-            msg = "Code block missing language specification"
-            issues.append((i, "NO_CODE_LANG", msg))
-
-        # Check for trailing spaces (except markdown line breaks)
-        if line_stripped != line.rstrip() and not line_stripped.endswith("  "):
-            spaces = len(line) - len(line.rstrip())
-            msg = f"Trailing spaces ({spaces} spaces)"
-            issues.append((i, "TRAILING_SPACE", msg))
+    # Check for extremely long lines (>200 chars) - only problematic cases
+    for i, match in _numbered(data, LONG_LINE_PATTERN.finditer(data)):
+        # The match span is the stripped line, so its length needs no new string
+        length = match.end() - match.start()
+        msg = f"Line extremely long ({length} chars): "
+        msg += data[match.start() : match.start() + 100] + "..."
+        issues.append((i, "LONG_LINE", msg))
+
+    # Check for fenced code blocks without language
+    fences = (
+        match
+        for match in NO_CODE_LANG_PATTERN.finditer(data)
+        if match.start() == 0 or data[match.start() - 1] == "\n"
+    )
+    for i, _ in _numbered(data, fences):
+        msg = "Code block missing language specification"
+        issues.append((i, "NO_CODE_LANG", msg))
+
+    # Check for trailing spaces (except markdown line breaks)
+    for i, match in _numbered(data, TRAILING_SPACE_PATTERN.finditer(data)):
+        end = match.end()
+        start = end - 1
+        while start and data[start - 1] != "\n" and data[start - 1].isspace():
+            start -= 1
+        trailing = data[start:end]
+        if trailing.endswith("  "):
+            continue
+        msg = f"Trailing spaces ({len(trailing)} spaces)"
+        issues.append((i, "TRAILING_SPACE", msg))
 
+    # Report in line order; the sort is stable so same-line issues keep the check order above
+    issues.sort(key=lambda issue: issue[0])
     return issues
 
 
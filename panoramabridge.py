@@ -19,12 +19,18 @@ License: Apache License 2.0
 
 __version__ = "0.1.9rc4"
 
+import bisect  # For renumbering transfer table rows after removals
+import functools
 import hashlib  # For calculating SHA256 checksums
 import json  # For configuration file storage
+import locale  # For decoding the log file the way logging wrote it
 import logging
+import mmap  # For hashing large files without read() copies
 import os
 import pickle  # For persistent upload tracking
+import posixpath  # For building WebDAV paths
 import queue  # For thread-safe file processing queue
+import re  # For ETag normalization
 
 # Standard library imports
 import sys
@@ -32,6 +38,11 @@ import tempfile  # For temporary file operations during verification
 import threading  # For background operations
 import time  # For file stability checks and timestamps
 import xml.etree.ElementTree as ET
+from collections import defaultdict, deque
+from concurrent.futures import (  # For concurrent uploads, hashing and verification
+    CancelledError,
+    ThreadPoolExecutor,
+)
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -48,7 +59,7 @@ from PyQt6.QtCore import (
     pyqtSignal,
     pyqtSlot,
 )
-from PyQt6.QtGui import QColor, QFont, QIcon
+from PyQt6.QtGui import QColor, QFont, QIcon, QPalette, QTextCursor
 
 # Third-party imports (must be installed via pip)
 try:
@@ -67,10 +78,13 @@ try:
         QMainWindow,
         QMenu,
         QMessageBox,
-        QProgressBar,
+        QPlainTextEdit,
         QPushButton,
         QRadioButton,
         QSpinBox,
+        QStyle,
+        QStyledItemDelegate,
+        QStyleOptionProgressBar,
         QTableWidget,
         QTableWidgetItem,
         QTabWidget,
@@ -83,12 +97,31 @@ try:
 except ImportError:
     print("PyQt6 is not installed. Please install it with: pip install PyQt6")
     sys.exit(1)
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+from urllib3.util.retry import Retry
 from watchdog.events import FileSystemEventHandler
 
 # File monitoring using watchdog library
 from watchdog.observers import Observer
 
+
+class RecentLogHandler(logging.Handler):
+    """Keep the last few formatted log lines in memory so error dialogs need not read the log file"""
+
+    def __init__(self, capacity: int = 10):
+        super().__init__()
+        self.lines = deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.lines.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+recent_log_handler = RecentLogHandler()
+
 # Configure comprehensive logging to both console and file
 logging.basicConfig(
     level=logging.DEBUG,
@@ -96,6 +129,7 @@ logging.basicConfig(
     handlers=[
         logging.StreamHandler(),  # Console output for real-time monitoring
         logging.FileHandler("panoramabridge.log", mode="a"),  # Persistent log file
+        recent_log_handler,  # Tail of the log for error dialogs
     ],
 )
 logger = logging.getLogger(__name__)
@@ -114,6 +148,293 @@ except ImportError:
     logger.warning("Keyring not available - credential saving will be disabled")
 
 
+# Servers that use a hex content digest as the ETag can be verified without a .checksum sidecar.
+# Digest length identifies the algorithm; adding a format is a one-line change here.
+_ETAG_DIGEST_ALGORITHMS = {64: "sha256", 40: "sha1", 32: "md5"}
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Strips surrounding whitespace, the weak-validator prefix and quotes from an ETag in one pass
+_ETAG_MATCH = re.compile(r'^\s*(?:W/)?"?([^"]*?)"?\s*$').match
+
+
+def _normalize_etag(etag: str) -> str:
+    """Return the opaque part of an ETag header value, e.g. 'W/"abc"' -> 'abc'"""
+    match = _ETAG_MATCH(etag)
+    return match.group(1) if match else etag
+
+
+@functools.lru_cache(maxsize=4096)
+def _dav_url(base_url: str, path: str) -> str:
+    """
+    Return the request URL for a remote path, memoized.
+
+    The same few thousand paths are requested over and over (directory listings,
+    file info lookups, uploads), and quote() plus urljoin() are comparatively slow
+    pure-Python string processing.
+    """
+    return urljoin(base_url, quote(path))
+
+
+# Clark-notation DAV: tags; find()/iter() with a plain tag skip ElementPath parsing
+_DAV_RESPONSE_TAG = "{DAV:}response"
+_DAV_HREF_TAG = "{DAV:}href"
+_DAV_PROP_TAG = "{DAV:}prop"
+_DAV_RESOURCETYPE_TAG = "{DAV:}resourcetype"
+_DAV_COLLECTION_TAG = "{DAV:}collection"
+_DAV_CONTENTLENGTH_TAG = "{DAV:}getcontentlength"
+_DAV_ETAG_TAG = "{DAV:}getetag"
+_DAV_LASTMODIFIED_TAG = "{DAV:}getlastmodified"
+_PROPFIND_FEED_SIZE = 64 * 1024  # Bytes of XML handed to the pull parser at a time
+WALK_MAX_ENTRIES = 5000  # Larger Depth infinity listings are not cached by WebDAVClient.walk()
+
+# PROPFIND request bodies, pre-encoded so requests sends them as-is with a fixed Content-Length
+# Directory listings (list_directory, walk)
+_LISTING_PROPFIND_BODY = (
+    b'<?xml version="1.0" encoding="utf-8"?>'
+    b'<propfind xmlns="DAV:"><prop>'
+    b"<displayname/><resourcetype/><getcontentlength/><getlastmodified/>"
+    b"</prop></propfind>"
+)
+# Size/ETag lookups (get_file_info, prefetch_directory_info)
+_FILE_INFO_PROPFIND_BODY = (
+    b'<?xml version="1.0" encoding="utf-8"?>'
+    b'<propfind xmlns="DAV:"><prop>'
+    b"<displayname/><getcontentlength/><getlastmodified/><getetag/>"
+    b"</prop></propfind>"
+)
+
+
+def _iter_propfind_responses(xml_body: str | bytes):
+    """
+    Yield each DAV:response element of a PROPFIND body as soon as it is parsed.
+
+    Feeds the body to an incremental pull parser in slices and clears every
+    response element once the caller has handled it, so a listing with
+    thousands of entries never holds more than a slice's worth of parsed tree.
+    Raises ET.ParseError on malformed XML, like ET.fromstring().
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    for start in range(0, len(xml_body), _PROPFIND_FEED_SIZE):
+        parser.feed(xml_body[start : start + _PROPFIND_FEED_SIZE])
+        for _, elem in parser.read_events():
+            if elem.tag == _DAV_RESPONSE_TAG:
+                yield elem
+                elem.clear()
+    parser.close()
+    for _, elem in parser.read_events():
+        if elem.tag == _DAV_RESPONSE_TAG:
+            yield elem
+            elem.clear()
+
+
+# Files at least this large are hashed through mmap so the kernel can read ahead
+# and the digests consume page-cache memory directly instead of a copied buffer
+MMAP_HASH_THRESHOLD = 64 * 1024 * 1024  # 64MB; mapped hashing measured ~10% faster than read()
+_MMAP_HASH_WINDOW = 64 * 1024 * 1024  # Feed mapped files in windows so all digests stay cache-hot
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes per read/write when downloading whole files
+MMAP_UPLOAD_THRESHOLD = 1024 * 1024  # Files up to 1MB are PUT from a memory map in one send
+# Files modified more recently than this are read, never memory-mapped (see _safe_to_map).
+# It exceeds the longest file stability timeout the settings allow
+MMAP_QUIET_SECONDS = 60.0
+HASH_LOOKAHEAD_DEPTH = 2  # Queued files FileProcessor hashes ahead of the current upload
+LOG_VIEW_TAIL_BYTES = 1024 * 1024  # How much of panoramabridge.log the log viewer loads
+MAX_CONCURRENT_UPLOADS = 4  # Files FileProcessor processes at once (shares the pooled session)
+# Digests taken from the bytes of each upload; MD5 serves servers that use it as the ETag
+UPLOAD_DIGEST_ALGORITHMS = ("sha256", "md5")
+
+
+_HASH_PROTOTYPES = {}  # algorithm name -> pristine hashlib object to copy()
+
+
+def _new_hash(algorithm: str):
+    """
+    Return a fresh hashlib object, copying a cached prototype instead of a name lookup.
+
+    hashlib.new() resolves to OpenSSL's EVP implementation, which picks SHA-NI/ARMv8
+    instructions at runtime when the CPU has them. usedforsecurity=False marks these
+    as integrity checksums, so OpenSSL in FIPS mode still allows MD5 for ETag checks.
+    """
+    prototype = _HASH_PROTOTYPES.get(algorithm)
+    if prototype is None:
+        prototype = _HASH_PROTOTYPES.setdefault(
+            algorithm, hashlib.new(algorithm, usedforsecurity=False)
+        )
+    return prototype.copy()
+
+
+class _UploadHasher:
+    """Feeds the bytes of an upload to one hash object per UPLOAD_DIGEST_ALGORITHMS entry"""
+
+    def __init__(self):
+        self._hashes = {algorithm: _new_hash(algorithm) for algorithm in UPLOAD_DIGEST_ALGORITHMS}
+
+    def update(self, data):
+        for hash_obj in self._hashes.values():
+            hash_obj.update(data)
+
+    def hexdigests(self) -> dict[str, str]:
+        return {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in self._hashes.items()}
+
+
+def _advise_sequential(fd: int):
+    """
+    Tell the kernel a file will be read front to back.
+
+    On Linux this doubles the readahead window, so disk reads for upcoming chunks
+    overlap with hashing or sending the current one. The pages are left cached because
+    the upload that follows a hash reads the same file again. Not available on
+    Windows/macOS; on Windows files opened with _sequential_opener get the same hint.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _sequential_opener(path: str, flags: int) -> int:
+    """
+    open() opener that marks the file for sequential access where the platform supports it.
+
+    On Windows os.O_SEQUENTIAL opens the file with FILE_FLAG_SEQUENTIAL_SCAN, which makes
+    the cache manager read ahead more aggressively; elsewhere the flag does not exist and
+    _advise_sequential() is used on the descriptor instead.
+    """
+    return os.open(path, flags | getattr(os, "O_SEQUENTIAL", 0))
+
+
+def _safe_to_map(stat: os.stat_result) -> bool:
+    """
+    Whether a file has been left alone long enough to memory-map it.
+
+    Reading a mapped page past the end of a file that was truncated after mapping
+    raises SIGBUS, which kills the process instead of raising an exception. Files
+    written within MMAP_QUIET_SECONDS may still be growing or being rewritten, so
+    they are read with buffered reads instead. This narrows the window but cannot
+    close it: another program can still truncate an old file while it is mapped.
+    """
+    return time.time() - stat.st_mtime >= MMAP_QUIET_SECONDS
+
+
+def _hash_file_digests(
+    filepath: str, algorithms: tuple[str, ...] = ("sha256",), chunk_size: int = 1024 * 1024
+) -> dict[str, str]:
+    """
+    Stream a file through one or more hashlib digests in a single read pass.
+
+    Reads into a single preallocated buffer with readinto() and feeds every
+    digest from the same memoryview, so memory use stays bounded by chunk_size
+    regardless of file size and the file is only read once however many
+    digests are requested. Files of MMAP_HASH_THRESHOLD bytes or more are
+    memory-mapped with sequential access advice instead of read(), unless they
+    were modified recently enough that a truncation could fault the mapping
+    (see _safe_to_map). A single digest of a smaller file is handed to
+    hashlib.file_digest() when available.
+    Read paths advise the kernel of sequential access so readahead fetches the
+    next chunks while the current one is being hashed.
+
+    Args:
+        filepath: Path to file to hash
+        algorithms: Algorithm names accepted by hashlib.new()
+        chunk_size: Size of the reusable read buffer in bytes (default: 1MB)
+
+    Returns:
+        Dict mapping each algorithm name to its hexadecimal digest
+    """
+    hash_objs = {algorithm: _new_hash(algorithm) for algorithm in algorithms}
+    updaters = [hash_obj.update for hash_obj in hash_objs.values()]
+    with open(filepath, "rb", buffering=0, opener=_sequential_opener) as f:
+        stat = os.fstat(f.fileno())
+        file_size = stat.st_size
+        if file_size >= MMAP_HASH_THRESHOLD and _safe_to_map(stat):
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)  # Not available on Windows
+                with memoryview(mm) as view:
+                    for offset in range(0, file_size, _MMAP_HASH_WINDOW):
+                        with view[offset : offset + _MMAP_HASH_WINDOW] as chunk:
+                            for update in updaters:
+                                update(chunk)
+        elif len(hash_objs) == 1 and hasattr(hashlib, "file_digest"):
+            _advise_sequential(f.fileno())
+            # Python 3.11+: hashlib drives the readinto loop over its own buffer
+            (hash_obj,) = hash_objs.values()
+            hashlib.file_digest(f, lambda: hash_obj)
+        else:
+            _advise_sequential(f.fileno())
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                chunk = view[:n]
+                for update in updaters:
+                    update(chunk)
+    return {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in hash_objs.items()}
+
+
+def _hash_file(filepath: str, algorithm: str = "sha256", chunk_size: int = 1024 * 1024) -> str:
+    """Stream a file through a single hashlib digest and return the hexadecimal digest"""
+    return _hash_file_digests(filepath, (algorithm,), chunk_size)[algorithm]
+
+
+def _remote_join(remote_base: str, relative_path: str) -> str:
+    """
+    Join a local relative path onto a remote base directory as an absolute WebDAV path.
+
+    Local separators become forward slashes and normpath collapses duplicate slashes
+    in the same pass, e.g. ("/data/", "run1\\a.raw") -> "/data/run1/a.raw" on Windows.
+    """
+    return posixpath.normpath(posixpath.join("/", remote_base, relative_path.replace(os.sep, "/")))
+
+
+def _read_log_tail(path: str, max_bytes: int) -> tuple[str, bool]:
+    """
+    Read at most the last max_bytes of a text log, starting at a line boundary.
+
+    Returns:
+        Tuple of (decoded text, whether earlier content was left out)
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        truncated = size > max_bytes
+        f.seek(size - max_bytes if truncated else 0)
+        data = f.read()
+    if truncated:
+        # Drop the partial first line
+        data = data[data.find(b"\n") + 1 :]
+    # logging.FileHandler writes with the locale's preferred encoding
+    return data.decode(locale.getpreferredencoding(False), errors="replace"), truncated
+
+
+_clock_hms_cache = (None, "")  # (epoch second, "HH:MM:SS") of the last formatted time
+
+
+def _clock_hms() -> str:
+    """
+    Current local time as HH:MM:SS for activity log lines.
+
+    The string only changes once a second, so it is formatted once per second and reused
+    by every line logged within it. The cache is a single tuple, replaced atomically, so
+    concurrent callers at worst format the same second twice.
+    """
+    global _clock_hms_cache
+    second = int(time.time())
+    cached_second, text = _clock_hms_cache
+    if second != cached_second:
+        text = time.strftime("%H:%M:%S", time.localtime(second))
+        _clock_hms_cache = (second, text)
+    return text
+
+
+def _checksum_cache_key(filepath: str, stat: os.stat_result) -> str:
+    """
+    Build the local checksum cache key for a file state.
+
+    Uses nanosecond mtime so a rewrite of the same size within the same second
+    still invalidates the cached digest.
+    """
+    return f"{filepath}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
 class WebDAVClient:
     """
     WebDAV client with chunked upload support and comprehensive file operations.
@@ -129,6 +450,35 @@ class WebDAVClient:
     Supports both Basic and Digest authentication methods.
     """
 
+    # Remote items hidden from directory listings; a tuple so str.startswith()
+    # checks every prefix in one call
+    SYSTEM_ITEM_PREFIXES = (
+        "copy_directory_fileroot_change_",
+        "copy_directory_",
+        "copy_direct",
+        ".norcrawl",
+        ".htaccess",
+        ".DS_Store",
+        "Thumbs.db",
+        "__pycache__",
+    )
+    # Lowercase directory names hidden from listings
+    SYSTEM_DIR_NAMES = frozenset(
+        {
+            "nextflow",
+            "output",
+            "proteome",
+            ".git",
+            ".svn",
+            "__pycache__",
+            ".tmp",
+            "temp",
+            "cache",
+            ".trash",
+            ".recycle",
+        }
+    )
+
     def __init__(self, url: str, username: str, password: str, auth_type: str = "basic"):
         """
         Initialize WebDAV client with connection parameters.
@@ -153,6 +503,33 @@ class WebDAVClient:
         self.session = requests.Session()
         self.session.auth = self.auth
 
+        # Keep enough pooled connections for the upload thread plus concurrent integrity
+        # checks so none are dropped and re-handshaken. Only idempotent requests without
+        # a streamed body are retried here; upload_file_chunked() retries PUTs itself
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS", "PROPFIND"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Short-lived cache of Depth 1 PROPFIND results so that checking many files
+        # in the same directory costs one round trip instead of one per file
+        self.file_info_cache_ttl = 30.0  # seconds
+        self._dir_info_cache = {}  # remote_dir -> (monotonic timestamp, {name: file info})
+        self._dir_prefetch_refused = False  # Server rejected Depth 1 file info listings
+        self._listing_cache = {}  # remote_dir -> (monotonic timestamp, list_directory() items)
+
+        # Digest challenges are answered per thread, so the client tracks per thread
+        # whether one has completed (see _ensure_auth_negotiated)
+        self._auth_state = threading.local()
+        self._options_unchallenged = False  # Server answers OPTIONS without a challenge
+        self.session.hooks["response"].append(self._note_auth_round_trip)
+
     def test_connection(self) -> bool:
         """
         Test WebDAV server connectivity with automatic endpoint detection.
@@ -195,31 +572,32 @@ class WebDAVClient:
     def list_directory(self, path: str = "/") -> list[dict]:
         """List contents of a WebDAV directory"""
         logger.info(f"list_directory called with path: {path}")
-        url = urljoin(self.url, quote(path))
+
+        # Answer from a recent listing of this folder, or walk() of an enclosing subtree
+        cache_key = path.rstrip("/") or "/"
+        cached = self._listing_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.file_info_cache_ttl:
+            logger.info(f"Directory listing for {path} served from cache ({len(cached[1])} items)")
+            return list(cached[1])
+
+        url = _dav_url(self.url, path)
         logger.info(f"Requesting directory listing for URL: {url}")
 
         headers = {"Depth": "1", "Content-Type": "application/xml"}
 
-        # PROPFIND request body
-        body = """<?xml version="1.0" encoding="utf-8"?>
-        <propfind xmlns="DAV:">
-            <prop>
-                <displayname/>
-                <resourcetype/>
-                <getcontentlength/>
-                <getlastmodified/>
-            </prop>
-        </propfind>"""
-
         try:
             logger.info(f"Sending PROPFIND request to: {url}")
-            response = self.session.request("PROPFIND", url, headers=headers, data=body)
+            response = self.session.request("PROPFIND", url, headers=headers, data=_LISTING_PROPFIND_BODY)
             logger.info(f"PROPFIND response status: {response.status_code}")
             if response.status_code == 207:  # Multi-Status
                 logger.info(f"PROPFIND successful for {path}, parsing response...")
-                items = self._parse_propfind_response(response.text, path)
+                # Raw bytes let the XML parser honour the document's declared encoding
+                # and skip requests' charset detection over the whole listing
+                items = self._parse_propfind_response(response.content, path)
                 logger.info(f"Directory listing for {path} returned {len(items)} items")
-                return items
+                # Revisiting the folder in the remote browser is then answered locally
+                self._listing_cache[cache_key] = (time.monotonic(), items)
+                return list(items)
             else:
                 logger.error(f"Failed to list directory {path}: HTTP {response.status_code}")
                 logger.error(f"Response body: {response.text[:500]}")  # First 500 chars
@@ -236,60 +614,28 @@ class WebDAVClient:
             return False
 
         # Hide common system/backup files - be more specific about patterns
-        system_patterns = [
-            "copy_directory_fileroot_change_",
-            "copy_directory_",
-            "copy_direct",
-            ".norcrawl",
-            ".htaccess",
-            ".DS_Store",
-            "Thumbs.db",
-            "__pycache__",
-        ]
-
-        for pattern in system_patterns:
-            if item_name.startswith(pattern):
-                logger.debug(f"Filtering out system item: {item_name}")
-                return False
+        if item_name.startswith(self.SYSTEM_ITEM_PREFIXES):
+            logger.debug(f"Filtering out system item: {item_name}")
+            return False
 
         # Hide common system directories - be more restrictive for directories
-        if is_dir:
-            system_dirs = [
-                "nextflow",
-                "output",
-                "proteome",
-                ".git",
-                ".svn",
-                "__pycache__",
-                ".tmp",
-                "temp",
-                "cache",
-                ".trash",
-                ".recycle",
-            ]
-            # Case-insensitive comparison for system directories
-            if item_name.lower() in [d.lower() for d in system_dirs]:
-                logger.debug(f"Filtering out system directory: {item_name}")
-                return False
+        # Case-insensitive comparison for system directories
+        if is_dir and item_name.lower() in self.SYSTEM_DIR_NAMES:
+            logger.debug(f"Filtering out system directory: {item_name}")
+            return False
 
         logger.debug(f"Including item: {item_name} (is_dir: {is_dir})")
         return True
 
-    def _parse_propfind_response(self, xml_response: str, base_path: str) -> list[dict]:
+    def _parse_propfind_response(self, xml_response: str | bytes, base_path: str) -> list[dict]:
         """Parse PROPFIND XML response"""
         logger.info(f"Parsing PROPFIND response for base_path: {base_path}")
         items = []
+        response_count = 0
         try:
-            root = ET.fromstring(xml_response)
-
-            # Define namespace
-            ns = {"d": "DAV:"}
-
-            responses = root.findall(".//d:response", ns)
-            logger.info(f"Found {len(responses)} response elements in XML")
-
-            for i, response in enumerate(responses):
-                href = response.find("d:href", ns)
+            for i, response in enumerate(_iter_propfind_responses(xml_response)):
+                response_count += 1
+                href = response.find(_DAV_HREF_TAG)
                 if href is None:
                     logger.debug(f"Response {i}: No href element found, skipping")
                     continue
@@ -308,27 +654,11 @@ class WebDAVClient:
                     logger.debug(f"Response {i}: Skipping base path itself: {unquoted_href}")
                     continue
 
-                props = response.find(".//d:prop", ns)
-                if props is None:
+                item = self._parse_listing_item(response, href_text)
+                if item is None:
                     logger.debug(f"Response {i}: No properties found, skipping")
                     continue
 
-                item_name = os.path.basename(unquoted_href)
-                logger.debug(f"Response {i}: Item name extracted: '{item_name}'")
-
-                item = {"name": item_name, "path": unquote(href_text), "is_dir": False, "size": 0}
-
-                # Check if it's a directory
-                resourcetype = props.find("d:resourcetype", ns)
-                if resourcetype is not None:
-                    collection = resourcetype.find("d:collection", ns)
-                    item["is_dir"] = collection is not None
-
-                # Get size
-                size = props.find("d:getcontentlength", ns)
-                if size is not None and size.text:
-                    item["size"] = int(size.text)
-
                 logger.debug(
                     f"Response {i}: Item details: name='{item['name']}', is_dir={item['is_dir']}, size={item['size']}"
                 )
@@ -345,68 +675,297 @@ class WebDAVClient:
 
         except Exception as e:
             logger.error(f"Error parsing PROPFIND response: {e}")
-            logger.error(f"XML response (first 1000 chars): {xml_response[:1000]}")
+            logger.error(f"XML response (first 1000 chars): {xml_response[:1000]!r}")
 
+        logger.info(f"Found {response_count} response elements in XML")
         logger.info(f"Total items returned for {base_path}: {len(items)}")
         return items
 
-    def get_file_info(self, path: str) -> dict | None:
-        """Get information about a remote file"""
-        url = urljoin(self.url, quote(path))
+    def _parse_listing_item(self, response_elem, href_text: str) -> dict | None:
+        """Build a directory listing item from a single PROPFIND <response> element"""
+        props = next(response_elem.iter(_DAV_PROP_TAG), None)
+        if props is None:
+            return None
 
-        headers = {"Depth": "0", "Content-Type": "application/xml"}
+        path = unquote(href_text)
+        item = {"name": os.path.basename(path.rstrip("/")), "path": path, "is_dir": False, "size": 0}
 
-        # PROPFIND request body
-        body = """<?xml version="1.0" encoding="utf-8"?>
-        <propfind xmlns="DAV:">
-            <prop>
-                <displayname/>
-                <getcontentlength/>
-                <getlastmodified/>
-                <getetag/>
-            </prop>
-        </propfind>"""
+        # Check if it's a directory
+        resourcetype = props.find(_DAV_RESOURCETYPE_TAG)
+        if resourcetype is not None:
+            collection = resourcetype.find(_DAV_COLLECTION_TAG)
+            item["is_dir"] = collection is not None
+
+        # Get size
+        size = props.find(_DAV_CONTENTLENGTH_TAG)
+        if size is not None and size.text:
+            item["size"] = int(size.text)
+
+        return item
+
+    def walk(self, path: str = "/") -> bool:
+        """
+        Cache the listings of a whole remote subtree with a single Depth infinity PROPFIND.
+
+        Responses are grouped by parent directory and stored for file_info_cache_ttl
+        seconds, so list_directory() can answer navigation within the subtree without
+        a round trip per folder. Directories with a current cached listing are left
+        alone, since they were listed or updated while the walk was in flight.
+
+        Args:
+            path: Root of the subtree to list
+
+        Returns:
+            bool: True if the subtree was cached, False if the server refused Depth
+            infinity (commonly 403 or 507) or returned more than WALK_MAX_ENTRIES
+            items, in which case list_directory() keeps using Depth 1 requests
+        """
+        root = path.rstrip("/") or "/"
+        url = _dav_url(self.url, root + "/" if root != "/" else root)
+        headers = {"Depth": "infinity", "Content-Type": "application/xml"}
 
         try:
-            response = self.session.request("PROPFIND", url, headers=headers, data=body)
-            if response.status_code == 207:  # Multi-Status
-                # Parse the response to get file info
-                root = ET.fromstring(response.text)
-                ns = {"d": "DAV:"}
+            response = self.session.request("PROPFIND", url, headers=headers, data=_LISTING_PROPFIND_BODY)
+            if response.status_code != 207:
+                logger.debug(f"Depth infinity listing not available for {root}: HTTP {response.status_code}")
+                return False
 
-                for response_elem in root.findall(".//d:response", ns):
-                    href = response_elem.find("d:href", ns)
-                    if href is None:
-                        continue
+            listings = defaultdict(list)
+            for count, response_elem in enumerate(_iter_propfind_responses(response.content), 1):
+                if count > WALK_MAX_ENTRIES:
+                    logger.debug(f"Subtree under {root} exceeds {WALK_MAX_ENTRIES} items, not caching")
+                    return False
+                href = response_elem.find(_DAV_HREF_TAG)
+                if href is None or href.text is None:
+                    continue
+                item = self._parse_listing_item(response_elem, href.text)
+                if item is None:
+                    continue
+                item_path = item["path"].rstrip("/") or "/"
+                if item["is_dir"]:
+                    # Every directory in the subtree gets an entry, even when empty
+                    listings[item_path]
+                if item_path == root or not self._should_show_item(item["name"], item["is_dir"]):
+                    continue
+                listings[os.path.dirname(item_path)].append(item)
+
+            now = time.monotonic()
+            for dir_path, items in listings.items():
+                cached = self._listing_cache.get(dir_path)
+                if cached is None or now - cached[0] >= self.file_info_cache_ttl:
+                    self._listing_cache[dir_path] = (now, items)
+            logger.info(f"Cached listings for {len(listings)} directories under {root}")
+            return True
 
-                    props = response_elem.find(".//d:prop", ns)
-                    if props is None:
-                        continue
+        except Exception as e:
+            logger.debug(f"Error walking remote subtree {root}: {e}")
+            return False
 
-                    info = {
-                        "path": unquote(href.text) if href.text else path,
-                        "exists": True,
-                        "size": 0,
-                        "etag": None,
-                        "last_modified": None,
-                    }
+    def _record_listing_item(self, path: str, is_dir: bool, size: int = 0):
+        """
+        Apply a successful PUT or MKCOL to the cached listing of its parent directory.
+
+        Keeps cached listings current while files are uploaded into the folder, so the
+        remote browser does not have to re-list a folder just to see new entries. The
+        entry keeps the listing's original timestamp, so the TTL still bounds staleness.
+        """
+        path = path.rstrip("/")
+        parent = os.path.dirname(path) or "/"
+        cached = self._listing_cache.get(parent)
+        if cached is None:
+            return
+
+        item = {"name": os.path.basename(path), "path": path, "is_dir": is_dir, "size": size}
+        if not self._should_show_item(item["name"], is_dir):
+            return
+        items = [existing for existing in cached[1] if existing["name"] != item["name"]]
+        items.append(item)
+        self._listing_cache[parent] = (cached[0], items)
+        if is_dir:
+            # A new directory is known to be empty
+            self._listing_cache.setdefault(path, (cached[0], []))
+
+    def clear_listing_cache(self):
+        """Forget cached directory listings so the next list_directory() hits the server"""
+        self._listing_cache.clear()
+
+    def _parse_file_info(self, response_elem, default_path: str) -> dict | None:
+        """Build a file info dict from a single PROPFIND <response> element"""
+        href = response_elem.find(_DAV_HREF_TAG)
+        if href is None:
+            return None
+
+        props = next(response_elem.iter(_DAV_PROP_TAG), None)
+        if props is None:
+            return None
+
+        info = {
+            "path": unquote(href.text) if href.text else default_path,
+            "exists": True,
+            "size": 0,
+            "etag": None,
+            "last_modified": None,
+        }
+
+        # Get size
+        size_elem = props.find(_DAV_CONTENTLENGTH_TAG)
+        if size_elem is not None and size_elem.text:
+            info["size"] = int(size_elem.text)
+
+        # Get ETag (often contains checksum info)
+        etag_elem = props.find(_DAV_ETAG_TAG)
+        if etag_elem is not None and etag_elem.text:
+            info["etag"] = _normalize_etag(etag_elem.text)
+
+        # Get last modified
+        modified_elem = props.find(_DAV_LASTMODIFIED_TAG)
+        if modified_elem is not None and modified_elem.text:
+            info["last_modified"] = modified_elem.text
+
+        return info
+
+    def prefetch_directory_info(self, remote_dir: str) -> bool:
+        """
+        Fetch size/ETag information for every file in a remote directory with one request.
+
+        Issues a single Depth 1 PROPFIND and caches the result for file_info_cache_ttl
+        seconds. While cached, get_file_info() for paths in this directory is answered
+        locally, including "not found" for names absent from the listing.
+
+        Args:
+            remote_dir: Remote directory path to list
+
+        Returns:
+            bool: True if the listing was cached, False if the server refused it
+            (e.g. 403/501 for Depth 1) and callers should use per-file lookups
+        """
+        remote_dir = remote_dir.rstrip("/") or "/"
+        url = _dav_url(self.url, remote_dir + "/" if remote_dir != "/" else remote_dir)
+
+        headers = {"Depth": "1", "Content-Type": "application/xml"}
+
+        try:
+            response = self.session.request("PROPFIND", url, headers=headers, data=_FILE_INFO_PROPFIND_BODY)
+            if response.status_code != 207:
+                logger.debug(
+                    f"Directory prefetch not available for {remote_dir}: HTTP {response.status_code}"
+                )
+                if response.status_code in (403, 405, 501):
+                    self._dir_prefetch_refused = True
+                return False
+
+            entries = {}
+            for response_elem in _iter_propfind_responses(response.content):
+                info = self._parse_file_info(response_elem, remote_dir)
+                if info is None:
+                    continue
+                # Skip the directory itself (compare unquoted paths like list_directory does)
+                item_path = info["path"].rstrip("/")
+                if item_path == remote_dir.rstrip("/"):
+                    continue
+                entries[os.path.basename(item_path)] = info
+
+            self._dir_info_cache[remote_dir] = (time.monotonic(), entries)
+            logger.debug(f"Prefetched info for {len(entries)} items in {remote_dir}")
+            return True
+
+        except Exception as e:
+            logger.debug(f"Error prefetching directory info for {remote_dir}: {e}")
+            return False
+
+    def _get_cached_file_info(self, path: str) -> dict | None:
+        """Answer a file info lookup from a recent directory prefetch, if any"""
+        remote_dir, _, name = path.rstrip("/").rpartition("/")
+        remote_dir = remote_dir or "/"
+        cached = self._dir_info_cache.get(remote_dir)
+        if cached is None:
+            return None
+        timestamp, entries = cached
+        if time.monotonic() - timestamp > self.file_info_cache_ttl:
+            self._dir_info_cache.pop(remote_dir, None)
+            return None
+        return entries.get(name, {"exists": False, "path": path})
+
+    def _ensure_auth_negotiated(self):
+        """
+        Complete the Digest challenge on this thread before a streamed upload.
+
+        requests keeps the Digest nonce per thread and only learns it from a 401.
+        A streamed PUT that draws the 401 has already sent its body and cannot be
+        rewound to retry, so the first upload on each thread would be sent twice
+        or fail. One bodiless OPTIONS request settles the challenge up front; Basic
+        auth sends credentials preemptively and needs nothing.
+
+        Threads that have already completed a 401 round trip skip this. If the
+        server answers OPTIONS without a challenge, the warm-up cannot help and is
+        not sent again.
+        """
+        if not isinstance(self.auth, HTTPDigestAuth) or self._options_unchallenged:
+            return
+        if getattr(self._auth_state, "negotiated", False):
+            return
+        try:
+            response = self.session.request("OPTIONS", self.url, timeout=10)
+            if not any(r.status_code == 401 for r in (*response.history, response)):
+                self._options_unchallenged = True
+                logger.debug("Server does not challenge OPTIONS, skipping Digest warm-up from now on")
+            else:
+                logger.debug(f"Digest auth negotiated for upload thread: HTTP {response.status_code}")
+        except Exception as e:
+            logger.debug(f"Digest auth warm-up failed, upload will negotiate itself: {e}")
+
+    def _note_auth_round_trip(self, response, *args, **kwargs):
+        """Session response hook: remember when this thread has answered an auth challenge"""
+        if response.status_code != 401 and any(r.status_code == 401 for r in response.history):
+            self._auth_state.negotiated = True
+
+    def invalidate_file_info(self, path: str):
+        """
+        Forget the cached info for one remote path so its next lookup asks the server.
 
-                    # Get size
-                    size_elem = props.find("d:getcontentlength", ns)
-                    if size_elem is not None and size_elem.text:
-                        info["size"] = int(size_elem.text)
+        Only the entry itself is marked unknown; the rest of the directory listing stays
+        cached, so uploading a batch into one folder does not force a re-list per file.
+        """
+        remote_dir, _, name = path.rstrip("/").rpartition("/")
+        cached = self._dir_info_cache.get(remote_dir or "/")
+        if cached is not None:
+            cached[1][name] = None
 
-                    # Get ETag (often contains checksum info)
-                    etag_elem = props.find("d:getetag", ns)
-                    if etag_elem is not None and etag_elem.text:
-                        info["etag"] = etag_elem.text.strip('"')
+    def get_file_info(self, path: str, prefetch_directory: bool = False) -> dict | None:
+        """
+        Get information about a remote file.
 
-                    # Get last modified
-                    modified_elem = props.find("d:getlastmodified", ns)
-                    if modified_elem is not None and modified_elem.text:
-                        info["last_modified"] = modified_elem.text
+        With prefetch_directory, a cache miss lists the whole parent directory with one
+        Depth 1 PROPFIND (see prefetch_directory_info), so lookups for the other files
+        queued into the same folder are answered without a round trip each.
+        """
+        cached_info = self._get_cached_file_info(path)
+        if cached_info is not None:
+            return cached_info
+
+        remote_dir = path.rstrip("/").rpartition("/")[0] or "/"
+        if (
+            prefetch_directory
+            and not self._dir_prefetch_refused
+            and remote_dir not in self._dir_info_cache
+            and self.prefetch_directory_info(remote_dir)
+        ):
+            cached_info = self._get_cached_file_info(path)
+            if cached_info is not None:
+                return cached_info
+
+        url = _dav_url(self.url, path)
+
+        headers = {"Depth": "0", "Content-Type": "application/xml"}
 
-                    return info
+        try:
+            response = self.session.request("PROPFIND", url, headers=headers, data=_FILE_INFO_PROPFIND_BODY)
+            if response.status_code == 207:  # Multi-Status
+                # Parse the response to get file info
+                for response_elem in _iter_propfind_responses(response.content):
+                    info = self._parse_file_info(response_elem, path)
+                    if info is not None:
+                        return info
 
             elif response.status_code == 404:
                 return {"exists": False, "path": path}
@@ -420,32 +979,66 @@ class WebDAVClient:
 
     def download_file_head(self, path: str, size: int = 8192) -> bytes | None:
         """Download the first few bytes of a remote file for checksum comparison"""
-        url = urljoin(self.url, quote(path))
+        url = _dav_url(self.url, path)
 
         headers = {"Range": f"bytes=0-{size - 1}"}
 
         try:
-            response = self.session.get(url, headers=headers)
-            if response.status_code in [200, 206]:  # OK or Partial Content
-                return response.content
-            else:
-                logger.warning(f"Failed to download file head for {path}: {response.status_code}")
-                return None
+            # Stream so a server that ignores Range (200) doesn't send us the whole file
+            with self.session.get(url, headers=headers, stream=True, timeout=(10, 30)) as response:
+                if response.status_code in [200, 206]:  # OK or Partial Content
+                    return response.raw.read(size, decode_content=True)
+                elif response.status_code == 416:  # Range Not Satisfiable: file exists but is empty
+                    return b""
+                else:
+                    logger.warning(f"Failed to download file head for {path}: {response.status_code}")
+                    return None
         except Exception as e:
             logger.error(f"Error downloading file head for {path}: {e}")
             return None
 
+    def verify_unchanged(self, path: str, etag: str) -> bool:
+        """
+        Confirm a remote file is readable and still has the given ETag without downloading it.
+
+        Sends a conditional GET with If-None-Match and a one-byte Range, so the server
+        answers 304 Not Modified (headers only) when the ETag still matches.
+
+        Args:
+            path: Remote file path
+            etag: ETag previously reported for this file (without quotes)
+
+        Returns:
+            bool: True if the server confirmed the file is unchanged, False otherwise
+        """
+        url = _dav_url(self.url, path)
+
+        headers = {"If-None-Match": f'"{etag}"', "Range": "bytes=0-0"}
+
+        try:
+            with self.session.get(url, headers=headers, stream=True, timeout=30) as response:
+                if response.status_code == 304:  # Not Modified
+                    return True
+                if response.status_code in [200, 206]:
+                    # Server ignored the condition; accept if it reports the same ETag
+                    return _normalize_etag(response.headers.get("ETag", "")) == etag
+                logger.debug(f"Conditional GET for {path} returned {response.status_code}")
+                return False
+        except Exception as e:
+            logger.debug(f"Conditional GET failed for {path}: {e}")
+            return False
+
     def download_file(self, remote_path: str, local_path: str) -> tuple[bool, str]:
         """Download a complete file from the WebDAV server
         Returns: (success, error_message)
         """
-        url = urljoin(self.url, quote(remote_path))
+        url = _dav_url(self.url, remote_path)
 
         try:
             response = self.session.get(url, stream=True)
             if response.status_code == 200:
                 with open(local_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         if chunk:
                             f.write(chunk)
                 return True, ""
@@ -457,7 +1050,16 @@ class WebDAVClient:
 
     def create_directory(self, path: str) -> bool:
         """Create a directory on the WebDAV server"""
-        url = urljoin(self.url, quote(path))
+        return self.create_directory_with_status(path)[0]
+
+    def create_directory_with_status(self, path: str) -> tuple[bool, int | None]:
+        """
+        Create a directory on the WebDAV server and report the MKCOL status.
+
+        Returns:
+            (success, HTTP status code); the status is None if the request itself failed
+        """
+        url = _dav_url(self.url, path)
         try:
             logger.info(f"Creating directory at: {url}")
             response = self.session.request("MKCOL", url)
@@ -465,35 +1067,71 @@ class WebDAVClient:
 
             if response.status_code in [201, 204]:
                 logger.info(f"Directory created successfully: {path}")
-                return True
+                self._record_listing_item(path, is_dir=True)
+                return True, response.status_code
             elif response.status_code == 405:
                 logger.info(f"Directory already exists: {path}")
-                return True
+                return True, response.status_code
             elif response.status_code == 403:
                 logger.error(f"Permission denied creating directory: {path}")
-                return False
+                return False, response.status_code
             elif response.status_code == 409:
                 logger.error(f"Conflict creating directory (parent may not exist): {path}")
-                return False
+                return False, response.status_code
             else:
                 logger.error(
                     f"Failed to create directory {path}: {response.status_code} - {response.reason}"
                 )
                 if response.text:
                     logger.error(f"Response body: {response.text}")
-                return False
+                return False, response.status_code
 
         except Exception as e:
             logger.error(f"Error creating directory {path}: {e}")
-            return False
+            return False, None
+
+    def _put_mapped_file(
+        self, url: str, local_path: str, file_size: int, timeout: float, hash_data: bool = False
+    ) -> tuple[requests.Response, str | None]:
+        """
+        PUT a small file straight from a read-only memory map.
+
+        The mapped pages are handed to the socket as one memoryview, so the body is
+        neither copied into Python bytes objects nor read in 8-16KB blocks. Callers
+        only use it for files that pass _safe_to_map(), as a file truncated while it
+        is mapped faults the process instead of failing the upload.
+
+        Returns:
+            tuple: (response, hex digests of the sent bytes keyed by algorithm, or None
+            if hash_data is False)
+        """
+        with open(local_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as body:
+                digests = None
+                if hash_data:
+                    hasher = _UploadHasher()
+                    hasher.update(body)
+                    digests = hasher.hexdigests()
+                headers = {"Content-Length": str(file_size)}
+                response = self.session.put(url, data=body, headers=headers, timeout=timeout)
+        return response, digests
 
     def upload_file_chunked(
-        self, local_path: str, remote_path: str, progress_callback=None
+        self, local_path: str, remote_path: str, progress_callback=None, checksum_callback=None
     ) -> tuple[bool, str]:
-        """Upload a file in chunks with progress callback using manual HTTP chunking"""
+        """
+        Upload a file in chunks with progress callback using manual HTTP chunking.
+
+        If checksum_callback is given, the bytes are hashed as they are sent and the
+        callback receives the hex digests of the complete upload on success, keyed by
+        UPLOAD_DIGEST_ALGORITHMS, so callers do not need a separate read of the file
+        to checksum it.
+        """
+        self.invalidate_file_info(remote_path)
+        self._ensure_auth_negotiated()
         try:
             file_size = os.path.getsize(local_path)
-            url = urljoin(self.url, quote(remote_path))
+            url = _dav_url(self.url, remote_path)
 
             # Determine optimal chunk size based on file size
             def get_optimal_chunk_size(total_size):
@@ -531,9 +1169,14 @@ class WebDAVClient:
 
                 # Test if server supports Range requests by trying a small upload first
                 try:
-                    with open(local_path, "rb") as file:
+                    with open(local_path, "rb", opener=_sequential_opener) as file:
+                        _advise_sequential(file.fileno())
+                        hasher = _UploadHasher() if checksum_callback else None
+
                         # Read first chunk
                         first_chunk = file.read(chunk_size)
+                        if hasher:
+                            hasher.update(first_chunk)
 
                         # Send first chunk with Range header
                         headers = {
@@ -579,6 +1222,8 @@ class WebDAVClient:
                                     break
 
                                 bytes_uploaded += len(chunk)
+                                if hasher:
+                                    hasher.update(chunk)
                                 if progress_callback:
                                     # Don't report 100% during chunked upload - let FileProcessor handle completion
                                     report_bytes = (
@@ -591,6 +1236,9 @@ class WebDAVClient:
                             # Check if we completed the chunked upload
                             if bytes_uploaded >= file_size:
                                 logger.info("Chunked upload completed successfully")
+                                if hasher and bytes_uploaded == file_size:
+                                    checksum_callback(hasher.hexdigests())
+                                self._record_listing_item(remote_path, is_dir=False, size=file_size)
                                 return True, ""
 
                         # If we get here, chunked upload failed, fall back to regular upload
@@ -608,20 +1256,25 @@ class WebDAVClient:
             # Create a file-like object that gives periodic progress updates
             # This reads from disk in chunks and reports progress as data is SENT over network
             class TimedProgressFile:
-                def __init__(self, filepath, progress_callback, total_size):
+                def __init__(self, filepath, progress_callback, total_size, hash_data=False):
                     self.filepath = filepath
                     self.progress_callback = progress_callback
                     self.total_size = total_size
                     self.bytes_read = 0
+                    self.hasher = _UploadHasher() if hash_data else None
                     self._file = None
-                    self.last_report_time = time.time()
-                    self.report_interval = 0.25  # Report every 0.25 seconds for smoother progress
-                    self.last_reported_bytes = 0
+                    self.last_report_time = time.monotonic()
+                    # Each report is a queued Qt signal that wakes the GUI thread, so reports
+                    # are paced by time alone rather than by bytes sent
+                    self.report_interval = 0.25
                     # Use larger chunk size for better network performance
                     self.chunk_size = 1 * 1024 * 1024  # 1MB chunks for streaming
+                    # Reused for every read; the sender is done with a block before asking for the next
+                    self._buffer = bytearray(self.chunk_size)
 
                 def __enter__(self):
-                    self._file = open(self.filepath, "rb")
+                    self._file = open(self.filepath, "rb", opener=_sequential_opener)
+                    _advise_sequential(self._file.fileno())
                     return self
 
                 def __exit__(self, exc_type, exc_val, exc_tb):
@@ -632,24 +1285,31 @@ class WebDAVClient:
                     """
                     Read method called by requests library to get data to send.
                     This is called repeatedly as data is sent over the network.
+
+                    http.client asks for only its 8-16KB block size but sends whatever
+                    is returned, so small requests are served a full chunk_size block.
+                    That keeps the per-read Python overhead (hashing call, clock check,
+                    progress bookkeeping) to one call per megabyte instead of per block.
+                    Blocks are read into one reused buffer and returned as a memoryview,
+                    so no new bytes object is allocated per megabyte sent.
                     """
                     if not self._file:
                         return b""
 
-                    # Use larger chunks for better performance
                     # requests will call this repeatedly until we return empty bytes
-                    chunk_to_read = self.chunk_size if size == -1 else min(size, self.chunk_size)
-                    data = self._file.read(chunk_to_read)
+                    if size is not None and size > self.chunk_size:
+                        data = self._file.read(size)
+                    else:
+                        data = memoryview(self._buffer)[: self._file.readinto(self._buffer)]
 
                     if data:
                         self.bytes_read += len(data)
-                        current_time = time.time()
-                        bytes_changed = self.bytes_read - self.last_reported_bytes
-                        time_elapsed = current_time - self.last_report_time
+                        if self.hasher:
+                            self.hasher.update(data)
+                        current_time = time.monotonic()
 
-                        # Report progress frequently for smooth updates
-                        # Report if: enough time passed OR significant data sent
-                        if time_elapsed >= self.report_interval or bytes_changed >= (512 * 1024):  # 512KB threshold
+                        # At most one report per interval; the final one is sent at EOF below
+                        if current_time - self.last_report_time >= self.report_interval:
                             if self.progress_callback:
                                 # Don't report 100% until file is completely read
                                 report_bytes = self.bytes_read
@@ -661,7 +1321,6 @@ class WebDAVClient:
                                 self.progress_callback(report_bytes, self.total_size)
 
                             self.last_report_time = current_time
-                            self.last_reported_bytes = self.bytes_read
 
                     # Always report final progress when file is completely read
                     if not data and self.bytes_read > 0 and self.progress_callback:
@@ -694,16 +1353,31 @@ class WebDAVClient:
 
             while retry_count <= max_retries:
                 try:
-                    with TimedProgressFile(local_path, progress_callback, file_size) as progress_file:
-                        # Important: Set Content-Length header to enable proper streaming
-                        # Without this, requests might buffer the entire file
-                        headers = {"Content-Length": str(file_size)}
-                        response = self.session.put(url, data=progress_file, headers=headers, timeout=timeout)
+                    if 0 < file_size <= MMAP_UPLOAD_THRESHOLD and _safe_to_map(os.stat(local_path)):
+                        response, sent_digests = self._put_mapped_file(
+                            url, local_path, file_size, timeout, hash_data=checksum_callback is not None
+                        )
+                    else:
+                        with TimedProgressFile(
+                            local_path, progress_callback, file_size, hash_data=checksum_callback is not None
+                        ) as progress_file:
+                            # Important: Set Content-Length header to enable proper streaming
+                            # Without this, requests might buffer the entire file
+                            headers = {"Content-Length": str(file_size)}
+                            response = self.session.put(url, data=progress_file, headers=headers, timeout=timeout)
+                        sent_digests = (
+                            progress_file.hasher.hexdigests()
+                            if progress_file.hasher and progress_file.bytes_read == file_size
+                            else None
+                        )
 
                     # Check if upload was successful
                     if response.status_code in [200, 201, 204]:
                         if retry_count > 0:
                             logger.info(f"Upload succeeded after {retry_count} retry/retries")
+                        if sent_digests:
+                            checksum_callback(sent_digests)
+                        self._record_listing_item(remote_path, is_dir=False, size=file_size)
                         return True, ""
 
                     # Handle transient server errors that should be retried
@@ -779,6 +1453,7 @@ class WebDAVClient:
             # Store checksum as extended attribute or in a companion .checksum file
             checksum_path = f"{file_path}.checksum"
             url = urljoin(self.url + "/", checksum_path.lstrip("/"))
+            self.invalidate_file_info(checksum_path)
 
             # Upload checksum as a small text file
             response = self.session.put(url, data=checksum.encode("utf-8"))
@@ -820,6 +1495,129 @@ class WebDAVClient:
             return None
 
 
+# Guards the check-and-insert on queued_files/processing_files, which is shared
+# between the watchdog thread and the Qt polling timer
+_QUEUE_CLAIM_LOCK = threading.Lock()
+
+
+def _claim_queue_slot(queued_files: set, processing_files: set, filepath: str) -> str | None:
+    """
+    Atomically reserve filepath in queued_files unless it is already queued or processing.
+
+    Returns:
+        None if the slot was claimed, otherwise "queued" or "processing"
+    """
+    with _QUEUE_CLAIM_LOCK:
+        if filepath in queued_files:
+            return "queued"
+        if filepath in processing_files:
+            return "processing"
+        queued_files.add(filepath)
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_extension(ext: str) -> str:
+    """Lowercase an extension and give it a leading dot, e.g. 'RAW' -> '.raw'"""
+    ext = ext.lower()
+    return ext if ext.startswith(".") else f".{ext}"
+
+
+def _normalize_extensions(extensions) -> tuple[str, ...]:
+    """
+    Normalize a list of extensions, e.g. ["RAW", ".mzML"] -> (".raw", ".mzml").
+
+    The monitoring scope check runs this for every upload history entry with the same
+    handful of extensions, so each distinct spelling is only normalized once.
+    """
+    return tuple(map(_normalize_extension, extensions))
+
+
+_SKIP_FILE_PREFIXES = (".", "~")  # Hidden files and editor/Office lock files are never queued
+
+
+def _iter_directory_files(directory: str, recursive: bool):
+    """
+    Yield a DirEntry for every regular file in directory, optionally descending into subfolders.
+
+    scandir() reports names, file types and (on POSIX) inode numbers straight from the
+    directory read, so no per-file stat or path join is needed to filter entries. Files
+    are yielded before subfolders, as os.walk() does, and in inode order within each
+    folder: inode order roughly follows on-disk layout, so queueing a batch this way
+    turns scattered seeks into mostly sequential reads. Windows file IDs do not track
+    layout and cost a stat each, so the listing order is kept there.
+
+    Like os.walk(), symlinked folders are not followed and unreadable subfolders are
+    skipped; an unreadable top-level directory raises OSError.
+    """
+    with os.scandir(directory) as entries:
+        entries = list(entries)
+    if os.name != "nt":
+        entries.sort(key=lambda entry: entry.inode())
+
+    subdirectories = []
+    for entry in entries:
+        try:
+            if entry.is_file():
+                yield entry
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+        except OSError:
+            continue
+
+    for subdirectory in subdirectories:
+        try:
+            yield from _iter_directory_files(subdirectory, True)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {subdirectory}: {e}")
+
+
+class PollScheduler:
+    """
+    Truncated exponential backoff for the backup polling timer.
+
+    Each idle poll stretches the delay by poll_backoff_base until it reaches
+    poll_backoff_max; a poll that finds new files, or any other queue activity,
+    resets it to poll_backoff_min.
+    This keeps polling responsive while files are arriving and cuts wakeups
+    (and directory walks on network mounts) while the directory is quiet.
+    """
+
+    def __init__(
+        self,
+        poll_backoff_min: float,
+        poll_backoff_max: float | None = None,
+        poll_backoff_base: float = 2.0,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            poll_backoff_min: Delay after activity, in milliseconds
+            poll_backoff_max: Upper bound on the delay (default: 4x poll_backoff_min)
+            poll_backoff_base: Growth factor applied per idle poll
+        """
+        self.poll_backoff_min = poll_backoff_min
+        self.poll_backoff_max = (
+            poll_backoff_max if poll_backoff_max is not None else 4 * poll_backoff_min
+        )
+        self.poll_backoff_base = poll_backoff_base
+        self.current_delay = poll_backoff_min
+
+    def next_delay(self) -> float:
+        """Grow and return the delay to wait after an idle poll"""
+        self.current_delay = min(self.poll_backoff_max, self.current_delay * self.poll_backoff_base)
+        return self.current_delay
+
+    def reset(self) -> float:
+        """Return to the minimum delay after activity"""
+        self.current_delay = self.poll_backoff_min
+        return self.current_delay
+
+
+STABILITY_CHECK_INTERVAL = 0.5  # Seconds between passes of the shared stability check worker
+
+
 class FileMonitorHandler(FileSystemEventHandler):
     """
     Handles file system events for real-time file monitoring.
@@ -837,7 +1635,7 @@ class FileMonitorHandler(FileSystemEventHandler):
     def __init__(
         self,
         extensions: list[str],
-        file_queue: queue.Queue,
+        file_queue: queue.SimpleQueue | queue.Queue,
         monitor_subdirs: bool = True,
         app_instance=None,
     ):
@@ -851,13 +1649,17 @@ class FileMonitorHandler(FileSystemEventHandler):
             app_instance: Reference to main application for duplicate tracking
         """
         # Normalize extensions to lowercase with leading dots
-        self.extensions = [
-            ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions
-        ]
+        self.extensions = list(_normalize_extensions(extensions))
+        # str.endswith() accepts a tuple and checks every suffix in one call
+        self._extension_suffixes = tuple(self.extensions)
         self.file_queue = file_queue
         self.monitor_subdirs = monitor_subdirs
         self.app_instance = app_instance
-        self.pending_files = {}  # Track files being written with timestamps
+        self.pending_files = {}  # filepath -> (size, first_seen, mtime_ns) for files being written
+        # Delayed stability checks and monitoring retries, run by one shared worker thread
+        self._scheduled_checks = {}  # filepath -> (due monotonic time, callback)
+        self._schedule_lock = threading.Lock()
+        self._schedule_thread = None
 
         # Log configuration for debugging
         logger.info(f"FileMonitorHandler initialized with extensions: {self.extensions}")
@@ -899,6 +1701,110 @@ class FileMonitorHandler(FileSystemEventHandler):
                 exc_info=True,
             )
 
+    def _enqueue_file(self, filepath: str):
+        """Put a stable file on the upload queue, add it to the transfer table and stop tracking it"""
+        self.file_queue.put(filepath)
+        # Add to transfer table safely using QMetaObject.invokeMethod for thread-safe UI calls
+        if self.app_instance:
+            try:
+                # Use QMetaObject.invokeMethod for safe cross-thread UI calls
+                QMetaObject.invokeMethod(
+                    self.app_instance,
+                    "add_queued_file_to_table",
+                    Qt.ConnectionType.QueuedConnection,
+                    Q_ARG(str, filepath),
+                )
+                logger.debug(
+                    f"Successfully scheduled UI update for {filepath} via QMetaObject.invokeMethod"
+                )
+                self.app_instance.queue_changed.emit()
+            except Exception as ui_error:
+                logger.error(f"Error scheduling UI table update for {filepath}: {ui_error}")
+        self.pending_files.pop(filepath, None)
+
+    def _check_pending_file(self, filepath: str):
+        """Queue a newly seen file if its size is unchanged since it was first recorded"""
+        if filepath not in self.pending_files:
+            return
+        try:
+            # Check if file still exists
+            try:
+                current_size = os.stat(filepath).st_size
+            except FileNotFoundError:
+                logger.info(f"File no longer exists during stability check: {filepath}")
+                self.pending_files.pop(filepath, None)
+                return
+
+            stored_info = self.pending_files.get(filepath)
+            if stored_info and current_size == stored_info[0]:
+                # File hasn't changed, check for duplicates before queueing
+                if self._should_queue_file(filepath):
+                    logger.info(
+                        f"Stability check: Queuing stable file: {filepath} (size: {current_size} bytes)"
+                    )
+                    self._enqueue_file(filepath)
+                    logger.info(
+                        f"File queued for transfer after stability check: {filepath} (queue size now: {self.file_queue.qsize()})"
+                    )
+                else:
+                    self.pending_files.pop(filepath, None)
+                    logger.info(f"File already queued or processing, skipping: {filepath}")
+        except (OSError, PermissionError) as e:
+            logger.warning(f"File access error during stability check for {filepath}: {e}")
+            # Keep monitoring, file might become available later
+        except Exception as e:
+            logger.error(
+                f"Unexpected error in stability check for {filepath}: {e}", exc_info=True
+            )
+            # Clean up to prevent repeated errors
+            self.pending_files.pop(filepath, None)
+
+    def _retry_monitoring(self, filepath: str):
+        """Start monitoring a file that could not be opened when its first event arrived"""
+        if os.path.exists(filepath) and filepath not in self.pending_files:
+            self._handle_file(filepath)  # Retry monitoring
+
+    def _schedule_check(self, filepath: str, delay: float, callback):
+        """
+        Run callback(filepath) after roughly delay seconds on the shared check thread.
+
+        A single worker services every scheduled check, so a burst of new files
+        does not start a thread per file. Scheduling a file again replaces its
+        pending check. The worker exits once nothing is left to run.
+        """
+        with self._schedule_lock:
+            self._scheduled_checks[filepath] = (time.monotonic() + delay, callback)
+            if self._schedule_thread is None:
+                self._schedule_thread = threading.Thread(
+                    target=self._run_scheduled_checks, name="file-stability-checks", daemon=True
+                )
+                self._schedule_thread.start()
+
+    def _run_scheduled_checks(self):
+        """Worker loop for _schedule_check()"""
+        while True:
+            time.sleep(STABILITY_CHECK_INTERVAL)
+            now = time.monotonic()
+            with self._schedule_lock:
+                due = [
+                    (path, callback)
+                    for path, (when, callback) in self._scheduled_checks.items()
+                    if when <= now
+                ]
+                for path, _ in due:
+                    del self._scheduled_checks[path]
+                if not self._scheduled_checks and not due:
+                    self._schedule_thread = None
+                    return
+
+            for path, callback in due:
+                try:
+                    callback(path)
+                except Exception as e:
+                    logger.error(f"Critical error in scheduled check for {path}: {e}", exc_info=True)
+                    # Ensure cleanup even on critical errors
+                    self.pending_files.pop(path, None)
+
     def _handle_file(self, filepath):
         """
         Process file events and queue stable files for upload.
@@ -913,54 +1819,41 @@ class FileMonitorHandler(FileSystemEventHandler):
         try:
             # Skip hidden files and system files (start with . or ~)
             filename = os.path.basename(filepath)
-            if filename.startswith(".") or filename.startswith("~"):
+            if filename.startswith(_SKIP_FILE_PREFIXES):
                 return
 
             # Check if file extension matches our monitored list
-            if any(filepath.lower().endswith(ext) for ext in self.extensions):
+            if filepath.lower().endswith(self._extension_suffixes):
                 current_time = time.time()
                 logger.info(f"File event detected: {filepath}")
 
                 if filepath in self.pending_files:
                     # Check if file size is stable
                     try:
-                        # Check if file still exists before accessing
-                        if not os.path.exists(filepath):
+                        # One stat both checks existence and gives the size
+                        try:
+                            stat = os.stat(filepath)
+                        except FileNotFoundError:
                             logger.warning(
                                 f"File no longer exists, removing from monitoring: {filepath}"
                             )
                             self.pending_files.pop(filepath, None)
                             return
 
-                        current_size = os.path.getsize(filepath)
-                        last_size, last_time = self.pending_files[filepath]
+                        current_size = stat.st_size
+                        last_size, last_time, *last_mtime_ns = self.pending_files[filepath]
+                        unchanged = current_size == last_size and (
+                            not last_mtime_ns or last_mtime_ns[0] == stat.st_mtime_ns
+                        )
 
                         # Reduced stability timeout for faster detection
-                        if current_size == last_size and current_time - last_time > 1:
+                        if unchanged and current_time - last_time > 1:
                             # File is stable, check for duplicates before queueing
                             if self._should_queue_file(filepath):
                                 logger.info(
                                     f"Queuing stable file: {filepath} (size: {current_size} bytes)"
                                 )
-                                self.file_queue.put(filepath)
-                                # Add to transfer table safely using QMetaObject.invokeMethod for thread-safe UI calls
-                                if self.app_instance:
-                                    try:
-                                        # Use QMetaObject.invokeMethod for safe cross-thread UI calls
-                                        QMetaObject.invokeMethod(
-                                            self.app_instance,
-                                            "add_queued_file_to_table",
-                                            Qt.ConnectionType.QueuedConnection,
-                                            Q_ARG(str, filepath),
-                                        )
-                                        logger.debug(
-                                            f"Successfully scheduled UI update for {filepath} via QMetaObject.invokeMethod"
-                                        )
-                                    except Exception as ui_error:
-                                        logger.error(
-                                            f"Error scheduling UI table update for {filepath}: {ui_error}"
-                                        )
-                                self.pending_files.pop(filepath, None)
+                                self._enqueue_file(filepath)
                                 logger.info(
                                     f"File queued for transfer: {filepath} (queue size now: {self.file_queue.qsize()})"
                                 )
@@ -969,9 +1862,13 @@ class FileMonitorHandler(FileSystemEventHandler):
                                 logger.info(
                                     f"File already queued or processing, skipping: {filepath}"
                                 )
+                        elif unchanged:
+                            # Same size and mtime as last seen: keep the original timestamp so
+                            # repeated events don't keep pushing the stability window back
+                            logger.debug(f"File unchanged, waiting for stability window: {filepath}")
                         else:
                             # Update tracking
-                            self.pending_files[filepath] = (current_size, current_time)
+                            self.pending_files[filepath] = (current_size, current_time, stat.st_mtime_ns)
                             logger.debug(f"File size changed, continuing to monitor: {filepath}")
                     except (OSError, PermissionError) as e:
                         # Handle file access errors gracefully - common during copying
@@ -992,7 +1889,9 @@ class FileMonitorHandler(FileSystemEventHandler):
                     # New file, start tracking
                     try:
                         # Check if file exists and is accessible
-                        if not os.path.exists(filepath):
+                        try:
+                            stat = os.stat(filepath)
+                        except FileNotFoundError:
                             logger.warning(f"New file event for non-existent file: {filepath}")
                             # Clean up queued_files if file was previously queued but no longer exists
                             if self.app_instance and filepath in self.app_instance.queued_files:
@@ -1002,176 +1901,18 @@ class FileMonitorHandler(FileSystemEventHandler):
                                 )
                             return
 
-                        size = os.path.getsize(filepath)
-                        self.pending_files[filepath] = (size, current_time)
+                        size = stat.st_size
+                        self.pending_files[filepath] = (size, current_time, stat.st_mtime_ns)
                         logger.info(f"Started monitoring new file: {filepath} (size: {size} bytes)")
 
                         # For moved/copied files that are already complete,
                         # schedule a stability check in a few seconds
-                        def delayed_check():
-                            try:
-                                time.sleep(1.5)  # Reduced from 3 to 1.5 seconds for faster response
-                                # Use a safer check to avoid race conditions in tests
-                                if (
-                                    hasattr(self, "pending_files")
-                                    and filepath in self.pending_files
-                                ):
-                                    try:
-                                        # Check if file still exists
-                                        if not os.path.exists(filepath):
-                                            logger.info(
-                                                f"File no longer exists during delayed check: {filepath}"
-                                            )
-                                            if hasattr(self, "pending_files"):
-                                                self.pending_files.pop(filepath, None)
-                                            return
-
-                                        current_size = os.path.getsize(filepath)
-                                        stored_info = self.pending_files.get(filepath)
-                                        if stored_info and current_size == stored_info[0]:
-                                            # File hasn't changed, check for duplicates before queueing
-                                            if self._should_queue_file(filepath):
-                                                logger.info(
-                                                    f"Delayed check: Queuing stable file: {filepath} (size: {current_size} bytes)"
-                                                )
-                                                self.file_queue.put(filepath)
-                                                # Add to transfer table safely using QMetaObject.invokeMethod for thread-safe UI calls
-                                                if self.app_instance:
-                                                    try:
-                                                        # Use QMetaObject.invokeMethod for safe cross-thread UI calls
-                                                        QMetaObject.invokeMethod(
-                                                            self.app_instance,
-                                                            "add_queued_file_to_table",
-                                                            Qt.ConnectionType.QueuedConnection,
-                                                            Q_ARG(str, filepath),
-                                                        )
-                                                        logger.debug(
-                                                            f"Successfully scheduled UI update for {filepath} via QMetaObject.invokeMethod"
-                                                        )
-                                                    except Exception as ui_error:
-                                                        logger.error(
-                                                            f"Error scheduling UI table update for {filepath}: {ui_error}"
-                                                        )
-                                                if hasattr(self, "pending_files"):
-                                                    self.pending_files.pop(filepath, None)
-                                                logger.info(
-                                                    f"File queued for transfer after stability check: {filepath} (queue size now: {self.file_queue.qsize()})"
-                                                )
-                                            else:
-                                                if hasattr(self, "pending_files"):
-                                                    self.pending_files.pop(filepath, None)
-                                                logger.info(
-                                                    f"File already queued or processing, skipping: {filepath}"
-                                                )
-                                    except (OSError, PermissionError) as e:
-                                        logger.warning(
-                                            f"File access error during delayed check for {filepath}: {e}"
-                                        )
-                                        # Keep monitoring, file might become available later
-                                    except Exception as e:
-                                        logger.error(
-                                            f"Unexpected error in delayed stability check for {filepath}: {e}",
-                                            exc_info=True,
-                                        )
-                                        # Clean up to prevent repeated errors
-                                        if hasattr(self, "pending_files"):
-                                            self.pending_files.pop(filepath, None)
-                            except Exception as e:
-                                logger.error(
-                                    f"Critical error in delayed check thread for {filepath}: {e}",
-                                    exc_info=True,
-                                )
-                                # Ensure cleanup even on critical errors
-                                if hasattr(self, "pending_files"):
-                                    self.pending_files.pop(filepath, None)
-
-                        # Only start delayed check thread if not in test environment
-                        # Check if we're running in pytest
-                        import sys
-
                         if "pytest" not in sys.modules:
-                            check_thread = threading.Thread(target=delayed_check, daemon=True)
-                            check_thread.start()
+                            # Reduced from 3 to 1.5 seconds for faster response
+                            self._schedule_check(filepath, 1.5, self._check_pending_file)
                         else:
-                            # In test environment, call delayed check directly without threading
-                            # but without the sleep to make tests run faster
-                            def immediate_check():
-                                try:
-                                    # Use a safer check to avoid race conditions in tests
-                                    if (
-                                        hasattr(self, "pending_files")
-                                        and filepath in self.pending_files
-                                    ):
-                                        try:
-                                            # Check if file still exists
-                                            if not os.path.exists(filepath):
-                                                logger.info(
-                                                    f"File no longer exists during immediate check: {filepath}"
-                                                )
-                                                if hasattr(self, "pending_files"):
-                                                    self.pending_files.pop(filepath, None)
-                                                return
-
-                                            current_size = os.path.getsize(filepath)
-                                            stored_info = self.pending_files.get(filepath)
-                                            if stored_info and current_size == stored_info[0]:
-                                                # File hasn't changed, check for duplicates before queueing
-                                                if self._should_queue_file(filepath):
-                                                    logger.info(
-                                                        f"Immediate check: Queuing stable file: {filepath} (size: {current_size} bytes)"
-                                                    )
-                                                    self.file_queue.put(filepath)
-                                                    # Add to transfer table safely using QMetaObject.invokeMethod for thread-safe UI calls
-                                                    if self.app_instance:
-                                                        try:
-                                                            # Use QMetaObject.invokeMethod for safe cross-thread UI calls
-                                                            QMetaObject.invokeMethod(
-                                                                self.app_instance,
-                                                                "add_queued_file_to_table",
-                                                                Qt.ConnectionType.QueuedConnection,
-                                                                Q_ARG(str, filepath),
-                                                            )
-                                                            logger.debug(
-                                                                f"Successfully scheduled UI update for {filepath} via QMetaObject.invokeMethod"
-                                                            )
-                                                        except Exception as ui_error:
-                                                            logger.error(
-                                                                f"Error scheduling UI table update for {filepath}: {ui_error}"
-                                                            )
-                                                    if hasattr(self, "pending_files"):
-                                                        self.pending_files.pop(filepath, None)
-                                                    logger.info(
-                                                        f"File queued for transfer after immediate check: {filepath} (queue size now: {self.file_queue.qsize()})"
-                                                    )
-                                                else:
-                                                    if hasattr(self, "pending_files"):
-                                                        self.pending_files.pop(filepath, None)
-                                                    logger.info(
-                                                        f"File already queued or processing, skipping: {filepath}"
-                                                    )
-                                        except (OSError, PermissionError) as e:
-                                            logger.warning(
-                                                f"File access error during immediate check for {filepath}: {e}"
-                                            )
-                                            # Keep monitoring, file might become available later
-                                        except Exception as e:
-                                            logger.error(
-                                                f"Unexpected error in immediate stability check for {filepath}: {e}",
-                                                exc_info=True,
-                                            )
-                                            # Clean up to prevent repeated errors
-                                            if hasattr(self, "pending_files"):
-                                                self.pending_files.pop(filepath, None)
-                                except Exception as e:
-                                    logger.error(
-                                        f"Critical error in immediate check for {filepath}: {e}",
-                                        exc_info=True,
-                                    )
-                                    # Ensure cleanup even on critical errors
-                                    if hasattr(self, "pending_files"):
-                                        self.pending_files.pop(filepath, None)
-
-                            immediate_check()
+                            # In test environment, run the check directly without the delay
+                            self._check_pending_file(filepath)
                             logger.debug(
                                 f"Test environment detected, using immediate check for {filepath}"
                             )
@@ -1180,20 +1921,8 @@ class FileMonitorHandler(FileSystemEventHandler):
                         logger.warning(
                             f"File access error when starting to monitor {filepath} (likely being copied): {e}"
                         )
-
-                        # Schedule a retry for files that might be in the process of being copied
-                        def retry_monitoring():
-                            try:
-                                time.sleep(2.0)  # Wait a bit longer for copy to complete
-                                if os.path.exists(filepath) and filepath not in self.pending_files:
-                                    self._handle_file(filepath)  # Retry monitoring
-                            except Exception as retry_error:
-                                logger.error(
-                                    f"Error in retry monitoring for {filepath}: {retry_error}"
-                                )
-
-                        retry_thread = threading.Thread(target=retry_monitoring, daemon=True)
-                        retry_thread.start()
+                        # Retry once the copy has had a bit longer to complete
+                        self._schedule_check(filepath, 2.0, self._retry_monitoring)
                     except Exception as e:
                         logger.error(
                             f"Unexpected error starting to monitor file {filepath}: {e}",
@@ -1225,11 +1954,15 @@ class FileMonitorHandler(FileSystemEventHandler):
             True if file should be queued, False if already queued/processing or unchanged
         """
         if self.app_instance:
-            # Check if file is already queued or being processed
-            if filepath in self.app_instance.queued_files:
+            # Claim the file before the (possibly slow) checksum so a concurrent
+            # event or poll for the same path cannot queue it a second time
+            busy = _claim_queue_slot(
+                self.app_instance.queued_files, self.app_instance.processing_files, filepath
+            )
+            if busy == "queued":
                 logger.debug(f"File already queued, skipping: {filepath}")
                 return False
-            if filepath in self.app_instance.processing_files:
+            if busy == "processing":
                 logger.debug(f"File currently processing, skipping: {filepath}")
                 return False
 
@@ -1243,6 +1976,7 @@ class FileMonitorHandler(FileSystemEventHandler):
 
                     if current_checksum == stored_checksum:
                         logger.info(f"File unchanged since last upload, skipping: {filepath}")
+                        self.app_instance.queued_files.discard(filepath)
                         return False
                     else:
                         logger.info(f"File modified since last upload, will re-upload: {filepath}")
@@ -1250,14 +1984,16 @@ class FileMonitorHandler(FileSystemEventHandler):
                     logger.warning(f"Error checking file checksum for {filepath}: {e}")
                     # Continue with upload if we can't verify the checksum
 
-            # Add to queued files tracking
-            self.app_instance.queued_files.add(filepath)
             return True
         else:
             # Fallback if no app instance - always queue (original behavior)
             return True
 
 
+# Queued by FileProcessor.stop() so the blocking queue read in run() returns at once
+_STOP_PROCESSING = object()
+
+
 class FileProcessor(QThread):
     """
     Background thread for processing file transfers to WebDAV server.
@@ -1285,8 +2021,12 @@ class FileProcessor(QThread):
     conflict_resolution_needed = pyqtSignal(
         str, str, str, dict
     )  # filename, filepath, remote_path, conflict_details
+    queue_changed = pyqtSignal()  # Files were taken from the queue
+    locked_file_retry_scheduled = pyqtSignal(
+        str, str, str, int, int
+    )  # filepath, remote_path, filename, wait_ms, retry_count
 
-    def __init__(self, file_queue: queue.Queue, app_instance=None):
+    def __init__(self, file_queue: queue.SimpleQueue | queue.Queue, app_instance=None):
         """
         Initialize file processor thread.
 
@@ -1304,6 +2044,20 @@ class FileProcessor(QThread):
         self.local_base_path = ""  # Local directory base path
         self.conflict_resolution: str | None = None  # User's conflict resolution choice
         self.apply_to_all = False  # Apply resolution to all conflicts
+        # Files taken from the queue early so their checksums are computed while the
+        # current file uploads; each entry is (file_item, checksum future or None)
+        self._lookahead: deque = deque()
+        self._hash_pool: ThreadPoolExecutor | None = None
+        # Files are processed on a worker pool; each in-flight item holds one slot
+        self._upload_slots = threading.BoundedSemaphore(MAX_CONCURRENT_UPLOADS)
+        self._upload_pool: ThreadPoolExecutor | None = None
+        # Locked-file retry counts are updated from upload workers, so they are only
+        # touched under _locked_retry_lock. Their timers are built on the thread that
+        # owns this object, which runs an event loop, via locked_file_retry_scheduled
+        self.locked_file_retries: dict[str, int] = {}
+        self.progress_timers: dict[str, dict] = {}
+        self._locked_retry_lock = threading.Lock()
+        self.locked_file_retry_scheduled.connect(self._start_locked_file_retry_timer)
 
     def set_webdav_client(self, client: WebDAVClient, remote_path: str):
         """
@@ -1346,10 +2100,9 @@ class FileProcessor(QThread):
             # Get file stats for cache key
             stat = os.stat(filepath)
             file_size = stat.st_size
-            file_mtime = stat.st_mtime
 
             # Create cache key (file path + size + mtime)
-            cache_key = f"{filepath}|{file_size}|{file_mtime:.0f}"
+            cache_key = _checksum_cache_key(filepath, stat)
 
             # Check if we have a cached checksum for this exact file state
             if self.app_instance and hasattr(self.app_instance, "local_checksum_cache"):
@@ -1360,6 +2113,21 @@ class FileProcessor(QThread):
                     )
                     return cached
 
+            # Fall back to the persisted upload history, which survives restarts and is not
+            # size-capped; it only records the mtime for checksums taken of that exact state
+            history = getattr(self.app_instance, "upload_history", None)
+            entry = history.get(filepath) if isinstance(history, dict) else None
+            if (
+                algorithm == "sha256"
+                and entry
+                and entry.get("checksum")
+                and entry.get("file_mtime_ns") == stat.st_mtime_ns
+                and entry.get("file_size") == file_size
+            ):
+                logger.debug(f"Using upload history checksum for {os.path.basename(filepath)}")
+                self._cache_checksum(filepath, cache_key, entry["checksum"])
+                return entry["checksum"]
+
             # Calculate new checksum
             logger.debug(
                 f"Calculating new checksum for {os.path.basename(filepath)} ({file_size:,} bytes)"
@@ -1368,27 +2136,10 @@ class FileProcessor(QThread):
             if chunk_size is None:
                 chunk_size = 256 * 1024  # 256KB chunks - optimal balance of speed and memory
 
-            hash_obj = hashlib.new(algorithm)
-            with open(filepath, "rb") as f:
-                while chunk := f.read(chunk_size):
-                    hash_obj.update(chunk)
-
-            checksum = hash_obj.hexdigest()
+            checksum = _hash_file(filepath, algorithm, chunk_size)
 
             # Cache the result
-            if self.app_instance and hasattr(self.app_instance, "local_checksum_cache"):
-                self.app_instance.local_checksum_cache[cache_key] = checksum
-                logger.debug(f"Cached checksum for {os.path.basename(filepath)}: {checksum[:8]}...")
-
-                # Limit cache size to prevent memory issues
-                if len(self.app_instance.local_checksum_cache) > 1000:
-                    # Remove oldest entries (simple cleanup)
-                    cache_items = list(self.app_instance.local_checksum_cache.items())
-                    for key, _ in cache_items[:100]:  # Remove first 100 entries
-                        del self.app_instance.local_checksum_cache[key]
-                    logger.debug(
-                        f"Cleaned checksum cache, now {len(self.app_instance.local_checksum_cache)} entries"
-                    )
+            self._cache_checksum(filepath, cache_key, checksum)
 
             return checksum
 
@@ -1396,73 +2147,283 @@ class FileProcessor(QThread):
             logger.error(f"Error calculating checksum for {filepath}: {e}")
             raise
 
+    def get_cached_checksum(self, filepath: str, stat: os.stat_result | None = None) -> str | None:
+        """
+        Return the cached SHA256 for the file's current state without reading the file.
+
+        Args:
+            filepath: Path to file
+            stat: Result of os.stat(filepath), if the caller already has it
+
+        Returns:
+            Hexadecimal checksum string, or None if not cached
+        """
+        if not (self.app_instance and hasattr(self.app_instance, "local_checksum_cache")):
+            return None
+        if stat is None:
+            stat = os.stat(filepath)
+        return self.app_instance.local_checksum_cache.get(_checksum_cache_key(filepath, stat))
+
+    def get_cached_digest(
+        self, filepath: str, algorithm: str, stat: os.stat_result | None = None
+    ) -> str | None:
+        """
+        Return a cached digest for the file's current state without reading the file.
+
+        SHA256 comes from local_checksum_cache, other algorithms from local_digest_cache.
+
+        Returns:
+            Hexadecimal digest string, or None if not cached
+        """
+        if algorithm == "sha256":
+            return self.get_cached_checksum(filepath, stat)
+        digest_cache = getattr(self.app_instance, "local_digest_cache", None)
+        if not isinstance(digest_cache, dict):
+            return None
+        if stat is None:
+            stat = os.stat(filepath)
+        return digest_cache.get(_checksum_cache_key(filepath, stat), {}).get(algorithm)
+
+    def _cache_digests(self, filepath: str, cache_key: str, digests: dict[str, str]):
+        """Store digests of one file state, SHA256 in local_checksum_cache and the rest in local_digest_cache"""
+        if "sha256" in digests:
+            self._cache_checksum(filepath, cache_key, digests["sha256"])
+        others = {a: d for a, d in digests.items() if a != "sha256"}
+        digest_cache = getattr(self.app_instance, "local_digest_cache", None)
+        if others and isinstance(digest_cache, dict):
+            digest_cache.setdefault(cache_key, {}).update(others)
+            # Limit cache size to prevent memory issues
+            if len(digest_cache) > 1000:
+                for key in list(digest_cache)[:100]:
+                    digest_cache.pop(key, None)
+
+    def _cache_checksum(self, filepath: str, cache_key: str, checksum: str):
+        """Store a checksum in local_checksum_cache, trimming the oldest entries when full"""
+        if self.app_instance and hasattr(self.app_instance, "local_checksum_cache"):
+            self.app_instance.local_checksum_cache[cache_key] = checksum
+            logger.debug(f"Cached checksum for {os.path.basename(filepath)}: {checksum[:8]}...")
+
+            # Limit cache size to prevent memory issues
+            if len(self.app_instance.local_checksum_cache) > 1000:
+                # Remove oldest entries (simple cleanup)
+                cache_items = list(self.app_instance.local_checksum_cache.items())
+                for key, _ in cache_items[:100]:  # Remove first 100 entries
+                    # pop() as the lookahead hash thread may be trimming concurrently
+                    self.app_instance.local_checksum_cache.pop(key, None)
+                logger.debug(
+                    f"Cleaned checksum cache, now {len(self.app_instance.local_checksum_cache)} entries"
+                )
+
+    def calculate_digests(
+        self, filepath: str, algorithms: tuple[str, ...] = ("sha256", "md5")
+    ) -> dict[str, str]:
+        """
+        Calculate several digests of a file in a single read pass with local caching.
+
+        SHA256 results share local_checksum_cache with calculate_checksum(); other
+        algorithms are cached in local_digest_cache under the same key. Only the
+        digests missing from the caches are computed, all from one read of the file.
+
+        Args:
+            filepath: Path to file to hash
+            algorithms: Algorithm names accepted by hashlib.new()
+
+        Returns:
+            Dict mapping each requested algorithm to its hexadecimal digest
+        """
+        stat = os.stat(filepath)
+        cache_key = _checksum_cache_key(filepath, stat)
+
+        checksum_cache = getattr(self.app_instance, "local_checksum_cache", None)
+        digest_cache = getattr(self.app_instance, "local_digest_cache", None)
+
+        digests = {}
+        if digest_cache is not None:
+            digests.update(digest_cache.get(cache_key, {}))
+        # Single get() calls, as another thread may trim the caches between lookups
+        cached_checksum = checksum_cache.get(cache_key) if checksum_cache is not None else None
+        if cached_checksum:
+            digests["sha256"] = cached_checksum
+
+        missing = tuple(algorithm for algorithm in algorithms if algorithm not in digests)
+        if missing:
+            logger.debug(
+                f"Calculating {', '.join(missing)} for {os.path.basename(filepath)} ({stat.st_size:,} bytes)"
+            )
+            computed = _hash_file_digests(filepath, missing, 256 * 1024)
+            digests.update(computed)
+
+            self._cache_digests(filepath, cache_key, computed)
+
+        return {algorithm: digests[algorithm] for algorithm in algorithms}
+
+    def _remote_path_for(self, filepath: str) -> str:
+        """Remote path a local file uploads to under the current settings"""
+        if self.preserve_structure and self.local_base_path:
+            return _remote_join(self.remote_base_path, os.path.relpath(filepath, self.local_base_path))
+        return f"{self.remote_base_path}/{os.path.basename(filepath)}"
+
+    def _prefetch_checksum(self, filepath: str):
+        """
+        Warm the checksum cache for a queued file whose remote copy already exists.
+
+        Only those files are compared by checksum before uploading. New files are
+        hashed while they upload, so hashing them here would read them twice. The
+        existence check is normally answered from the directory listing cache.
+        Errors are left to process_file().
+        """
+        try:
+            remote_info = self.webdav_client.get_file_info(
+                self._remote_path_for(filepath), prefetch_directory=True
+            )
+            if not remote_info or not remote_info.get("exists", True):
+                return
+            self.calculate_checksum(filepath)
+        except OSError as e:
+            logger.debug(f"Lookahead checksum skipped for {filepath}: {e}")
+
+    def _next_file_item(self):
+        """
+        Return the next item to process and its lookahead checksum future (or None),
+        and start hashing the items queued behind it.
+
+        Up to HASH_LOOKAHEAD_DEPTH items are pulled from the queue ahead of time and
+        their checksums computed on a pool with one worker per lookahead slot, so the
+        queued files are hashed on separate cores while the current one uploads.
+        hashlib releases the GIL while digesting and uploads block on the socket, so
+        all of them make progress together. The future is awaited by the upload
+        worker, never here, so a slow hash does not hold up dispatching.
+
+        Blocks until an item arrives; stop() wakes it with _STOP_PROCESSING.
+        """
+        if self._lookahead:
+            file_item, checksum_future = self._lookahead.popleft()
+        else:
+            file_item, checksum_future = self.file_queue.get(), None
+
+        while len(self._lookahead) < HASH_LOOKAHEAD_DEPTH:
+            try:
+                next_item = self.file_queue.get_nowait()
+            except queue.Empty:
+                break
+            future = None
+            # The stop marker also passes through the lookahead, keeping its place in line
+            if isinstance(next_item, str) and self.webdav_client:
+                if self._hash_pool is None:
+                    self._hash_pool = ThreadPoolExecutor(
+                        max_workers=HASH_LOOKAHEAD_DEPTH, thread_name_prefix="checksum-lookahead"
+                    )
+                future = self._hash_pool.submit(self._prefetch_checksum, next_item)
+            self._lookahead.append((next_item, future))
+
+        self.queue_changed.emit()
+        return file_item, checksum_future
+
     def run(self):
-        """Main processing loop"""
+        """
+        Main processing loop.
+
+        Items are handed to a pool of MAX_CONCURRENT_UPLOADS workers so one file's
+        network round trips overlap another's disk reads. A slot is claimed before an
+        item is taken from the queue, leaving the rest queued for the lookahead hasher.
+        """
         logger.info("FileProcessor thread started - beginning queue processing")
         while self.running:
             try:
-                # Get file from queue (timeout allows checking self.running)
-                file_item = self.file_queue.get(timeout=1)
+                # Timeout allows checking self.running while all workers are busy
+                if not self._upload_slots.acquire(timeout=1):
+                    continue
+                try:
+                    file_item, checksum_future = self._next_file_item()
+                except BaseException:
+                    self._upload_slots.release()
+                    raise
+                if file_item is _STOP_PROCESSING:
+                    self._upload_slots.release()
+                    break
                 logger.info(f"FileProcessor: Retrieved item from queue: {file_item}")
 
-                if self.webdav_client:
-                    try:
-                        # Handle both string paths and dict objects with resolution info
-                        if isinstance(file_item, dict):
-                            logger.info(f"Processing conflict resolution item: {file_item}")
-                            self.process_file_with_resolution(file_item)
-                        else:
-                            logger.info(f"Processing regular file item: {file_item}")
-                            self.process_file(file_item)
-                    except Exception as process_error:
-                        logger.error(
-                            f"Error processing file item {file_item}: {process_error}",
-                            exc_info=True,
-                        )
-                        # Update status to show error
-                        filename = "Unknown"
-                        filepath = ""
-                        try:
-                            if isinstance(file_item, dict):
-                                filename = file_item.get("filename", "Unknown")
-                                filepath = file_item.get("filepath", "")
-                            else:
-                                filename = os.path.basename(file_item)
-                                filepath = file_item
-                        except Exception as name_error:
-                            logger.error(f"Error extracting filename from file_item: {name_error}")
-
-                        # Clean up tracking and notify UI of failure
-                        if filepath and self.app_instance:
-                            self.app_instance.queued_files.discard(filepath)
-                            self.app_instance.processing_files.discard(filepath)
-
-                        self.status_update.emit(filename, "Error", filepath)
-                        self.transfer_complete.emit(
-                            filename, filepath, False, f"Processing error: {str(process_error)}"
-                        )
-                else:
-                    logger.warning(
-                        "FileProcessor: No WebDAV client configured - cannot process files"
+                if self._upload_pool is None:
+                    self._upload_pool = ThreadPoolExecutor(
+                        max_workers=MAX_CONCURRENT_UPLOADS, thread_name_prefix="file-upload"
                     )
-                    # Remove from queued files if processing failed
-                    if isinstance(file_item, str) and self.app_instance:
-                        self.app_instance.queued_files.discard(file_item)
-                        # Update status in table
-                        filename = os.path.basename(file_item)
-                        self.status_update.emit(filename, "Failed", file_item)
-                        self.transfer_complete.emit(
-                            filename, file_item, False, "No WebDAV connection configured"
-                        )
+                self._upload_pool.submit(self._process_item_in_slot, file_item, checksum_future)
 
-            except queue.Empty:
-                # No items in queue, continue loop
-                continue
             except Exception as e:
                 logger.error(f"Critical error in FileProcessor main loop: {e}", exc_info=True)
                 # Don't break the loop - continue processing other files
                 continue
 
+        # stop() only cancels uploads that have not started; let the running ones finish
+        # so wait() on this thread also covers them
+        if self._upload_pool is not None:
+            self._upload_pool.shutdown(wait=True)
+
+    def _process_item_in_slot(self, file_item, checksum_future=None):
+        """Process one queue item on an upload worker, then free its slot"""
+        try:
+            if checksum_future is not None:
+                # Let a lookahead hash still in progress finish rather than reading the file again
+                try:
+                    checksum_future.result()
+                except CancelledError:
+                    pass
+            self._process_item(file_item)
+        finally:
+            self._upload_slots.release()
+
+    def _process_item(self, file_item):
+        """Process a single queue item, reporting any failure to the UI"""
+        if self.webdav_client:
+            try:
+                # Handle both string paths and dict objects with resolution info
+                if isinstance(file_item, dict):
+                    logger.info(f"Processing conflict resolution item: {file_item}")
+                    self.process_file_with_resolution(file_item)
+                else:
+                    logger.info(f"Processing regular file item: {file_item}")
+                    self.process_file(file_item)
+            except Exception as process_error:
+                logger.error(
+                    f"Error processing file item {file_item}: {process_error}",
+                    exc_info=True,
+                )
+                # Update status to show error
+                filename = "Unknown"
+                filepath = ""
+                try:
+                    if isinstance(file_item, dict):
+                        filename = file_item.get("filename", "Unknown")
+                        filepath = file_item.get("filepath", "")
+                    else:
+                        filename = os.path.basename(file_item)
+                        filepath = file_item
+                except Exception as name_error:
+                    logger.error(f"Error extracting filename from file_item: {name_error}")
+
+                # Clean up tracking and notify UI of failure
+                if filepath and self.app_instance:
+                    self.app_instance.queued_files.discard(filepath)
+                    self.app_instance.processing_files.discard(filepath)
+
+                self.status_update.emit(filename, "Error", filepath)
+                self.transfer_complete.emit(
+                    filename, filepath, False, f"Processing error: {str(process_error)}"
+                )
+        else:
+            logger.warning(
+                "FileProcessor: No WebDAV client configured - cannot process files"
+            )
+            # Remove from queued files if processing failed
+            if isinstance(file_item, str) and self.app_instance:
+                self.app_instance.queued_files.discard(file_item)
+                # Update status in table
+                filename = os.path.basename(file_item)
+                self.status_update.emit(filename, "Failed", file_item)
+                self.transfer_complete.emit(
+                    filename, file_item, False, "No WebDAV connection configured"
+                )
+
     def process_file_with_resolution(self, file_item: dict):
         """Process a file that already has conflict resolution"""
         filepath = file_item["filepath"]
@@ -1483,8 +2444,7 @@ class FileProcessor(QThread):
                 return
             elif resolution == "rename" and new_name:
                 # Update remote path and filename for rename
-                remote_dir = os.path.dirname(remote_path)
-                remote_path = f"{remote_dir}/{new_name}".replace("//", "/")
+                remote_path = posixpath.join(posixpath.dirname(remote_path), new_name)
                 filename = new_name
             # For 'overwrite', use original remote_path
 
@@ -1517,13 +2477,15 @@ class FileProcessor(QThread):
         self, filepath: str, remote_path: str, filename: str, access_error: str
     ):
         """Schedule a retry for a locked file after appropriate wait time"""
-        if not hasattr(self, "locked_file_retries"):
-            self.locked_file_retries = {}
-
         # Track retry count for this file
         retry_key = filepath
-        retry_count = self.locked_file_retries.get(retry_key, 0)
         max_retries = self.app_instance.max_retries_spin.value()
+        with self._locked_retry_lock:
+            retry_count = self.locked_file_retries.get(retry_key, 0)
+            if retry_count >= max_retries:
+                self.locked_file_retries.pop(retry_key, None)
+            else:
+                self.locked_file_retries[retry_key] = retry_count + 1
 
         if retry_count >= max_retries:
             # Give up after max retries
@@ -1533,7 +2495,6 @@ class FileProcessor(QThread):
                 False,
                 f"File remained locked after {max_retries} attempts over {int((self.app_instance.initial_wait_spin.value() * 60 + max_retries * self.app_instance.retry_interval_spin.value()) / 60)} minutes. File may still be in use by instrument or analysis software.",
             )
-            self.locked_file_retries.pop(retry_key, None)
             return
 
         # Calculate wait time and create user-friendly status messages
@@ -1557,10 +2518,21 @@ class FileProcessor(QThread):
         # Update status with clear, user-friendly message
         self.status_update.emit(filename, status_msg, filepath)
 
-        # Schedule retry using QTimer
-        self.locked_file_retries[retry_key] = retry_count + 1
+        # Upload workers have no event loop, so the retry timer is started by
+        # _start_locked_file_retry_timer on the thread that owns this object
+        self.locked_file_retry_scheduled.emit(
+            filepath, remote_path, filename, wait_time_ms, retry_count
+        )
+
+        logger.info(
+            f"Scheduled locked file retry for {filename} (attempt {retry_count + 1}) in {wait_time_ms / 1000:.1f}s"
+        )
 
-        retry_timer = QTimer()
+    def _start_locked_file_retry_timer(
+        self, filepath: str, remote_path: str, filename: str, wait_time_ms: int, retry_count: int
+    ):
+        """Start the single-shot retry timer for a locked file (GUI thread)"""
+        retry_timer = QTimer(self)
         retry_timer.setSingleShot(True)
         retry_timer.timeout.connect(
             lambda: self.retry_locked_file(filepath, remote_path, filename, retry_timer)
@@ -1574,10 +2546,6 @@ class FileProcessor(QThread):
                 filepath, filename, wait_time_ms, wait_minutes, "minutes"
             )
 
-        logger.info(
-            f"Scheduled locked file retry for {filename} (attempt {retry_count + 1}) in {wait_time_ms / 1000:.1f}s"
-        )
-
     def _start_progress_countdown(
         self,
         filepath: str,
@@ -1587,14 +2555,11 @@ class FileProcessor(QThread):
         time_unit: str,
     ):
         """Start a countdown timer to show progress during file lock wait"""
-        if not hasattr(self, "progress_timers"):
-            self.progress_timers = {}
-
         # Update every 10 seconds for minutes, every second for seconds
         update_interval_ms = 10000 if time_unit == "minutes" else 1000
         elapsed_time = 0
 
-        progress_timer = QTimer()
+        progress_timer = QTimer(self)
         progress_timer.timeout.connect(
             lambda: self._update_progress_countdown(
                 filepath,
@@ -1661,51 +2626,29 @@ class FileProcessor(QThread):
         # Check if file still exists
         if not os.path.exists(filepath):
             self.transfer_complete.emit(filename, filepath, False, "File no longer exists")
-            self.locked_file_retries.pop(retry_key, None)
+            with self._locked_retry_lock:
+                self.locked_file_retries.pop(retry_key, None)
             return
 
         # Check if we still have retry info
-        if retry_key not in self.locked_file_retries:
+        with self._locked_retry_lock:
+            has_retry_info = retry_key in self.locked_file_retries
+        if not has_retry_info:
             logger.warning(f"No retry info found for {filename}, attempting upload anyway")
             self.upload_file(filepath, remote_path, filename)
             return
 
-        retry_info = self.locked_file_retries[retry_key]
-        retry_info["attempts"] += 1
-
-        # Clean up any existing progress timer
-        if "progress_timer_id" in retry_info:
-            timer_id = retry_info.pop("progress_timer_id")
-            if (
-                hasattr(self.app_instance, "progress_timers")
-                and timer_id in self.app_instance.progress_timers
-            ):
-                self.app_instance.progress_timers[timer_id].stop()
-                del self.app_instance.progress_timers[timer_id]
-
         # Check if file is still accessible
         accessible, access_error = self.is_file_accessible(filepath)
         if not accessible:
-            # Still locked, check max retries
-            if retry_info["attempts"] >= retry_info["max_retries"]:
-                # Clean up retry info
-                self.locked_file_retries.pop(retry_key, None)
-                # Update status to failed
-                self.status_update.emit(filename, "File locked - max retries exceeded", filepath)
-                self.transfer_complete.emit(
-                    filename,
-                    filepath,
-                    False,
-                    f"File remained locked after {retry_info['attempts']} attempts: {access_error}",
-                )
-                return
-            else:
-                # Schedule another retry
-                self.schedule_locked_file_retry(filepath, remote_path, filename, access_error)
-                return
+            # Still locked; schedule_locked_file_retry counts the attempt and gives
+            # up once max retries is reached
+            self.schedule_locked_file_retry(filepath, remote_path, filename, access_error)
+            return
 
         # File is now accessible, clean up retry tracking
-        self.locked_file_retries.pop(retry_key, None)
+        with self._locked_retry_lock:
+            self.locked_file_retries.pop(retry_key, None)
 
         # Try uploading again
         logger.info(f"Retrying locked file: {filename}")
@@ -1716,30 +2659,30 @@ class FileProcessor(QThread):
         try:
             # Always check if file is accessible (locked file handling always enabled)
             accessible, access_error = self.is_file_accessible(filepath)
-            local_size = os.path.getsize(filepath)
-            local_date = datetime.fromtimestamp(os.path.getmtime(filepath))
+            # One stat serves the size, date and checksum cache key below
+            pre_upload_stat = os.stat(filepath)
+            local_size = pre_upload_stat.st_size
+            local_date = datetime.fromtimestamp(pre_upload_stat.st_mtime)
             if not accessible:
                 # File is locked, schedule retry
                 self.schedule_locked_file_retry(filepath, remote_path, filename, access_error)
                 return
 
-            # Calculate checksum for verification - this will also fail if file is locked
-            self.status_update.emit(filename, "Calculating checksum...", filepath)
-            try:
-                local_checksum = self.calculate_checksum(filepath)
-            except (OSError, PermissionError) as e:
-                # File became locked during checksum calculation (locked file handling always enabled)
-                error_msg = f"File locked during checksum: {str(e)}"
-                self.schedule_locked_file_retry(filepath, remote_path, filename, error_msg)
-                return
+            # Reuse a cached checksum if we have one; otherwise hash the bytes as they
+            # are uploaded instead of reading the whole file a second time. The upload
+            # also yields the MD5 that verification compares with digest ETags
+            local_checksum = self.get_cached_checksum(filepath, pre_upload_stat)
+            hash_upload = not (
+                local_checksum and self.get_cached_digest(filepath, "md5", pre_upload_stat)
+            )
+            upload_digests = []
 
             # Create remote directory if needed (check cache to avoid redundant attempts)
             remote_dir = os.path.dirname(remote_path)
             if remote_dir and remote_dir != "/" and self._should_create_directory(remote_dir):
                 logger.info(f"Creating remote directory: {remote_dir}")
-                success = self.webdav_client.create_directory(remote_dir)
-                if success and self.app_instance:
-                    self.app_instance.created_directories.add(remote_dir)
+                if self.webdav_client.create_directory(remote_dir):
+                    self._mark_directory_created(remote_dir)
 
             # Upload file with detailed progress and status tracking
             self.status_update.emit(filename, "Preparing upload...", filepath)
@@ -1784,16 +2727,34 @@ class FileProcessor(QThread):
             self.status_update.emit(filename, "Reading file...", filepath)
 
             success, error = self.webdav_client.upload_file_chunked(
-                filepath, remote_path, progress_callback
+                filepath,
+                remote_path,
+                progress_callback,
+                checksum_callback=upload_digests.append if hash_upload else None,
             )
 
+            if success and upload_digests:
+                if not local_checksum:
+                    local_checksum = upload_digests[-1]["sha256"]
+                # Only cache them if the file did not change while it was being sent
+                post_upload_stat = os.stat(filepath)
+                if (post_upload_stat.st_size, post_upload_stat.st_mtime_ns) == (
+                    pre_upload_stat.st_size,
+                    pre_upload_stat.st_mtime_ns,
+                ):
+                    self._cache_digests(
+                        filepath,
+                        _checksum_cache_key(filepath, pre_upload_stat),
+                        upload_digests[-1],
+                    )
+            elif success and not local_checksum:
+                local_checksum = self.calculate_checksum(filepath)
+
             if success:
                 # Mark upload as completed so progress can show 100%
                 upload_completed = True
                 # Show 100% completion now that upload is truly done
-                self.progress_update.emit(
-                    filepath, os.path.getsize(filepath), os.path.getsize(filepath)
-                )
+                self.progress_update.emit(filepath, local_size, local_size)
                 self.status_update.emit(filename, "Upload complete", filepath)
 
                 # Store checksum for future reference
@@ -1883,6 +2844,11 @@ class FileProcessor(QThread):
                         f"Uploaded successfully (checksum: {local_checksum[:8]}...)",
                     )
             else:
+                # Without a separate checksum pass, a file locked mid-upload surfaces here
+                accessible, access_error = self.is_file_accessible(filepath)
+                if not accessible:
+                    self.schedule_locked_file_retry(filepath, remote_path, filename, access_error)
+                    return
                 self.transfer_complete.emit(filename, filepath, False, f"Upload failed: {error}")
 
         except Exception as e:
@@ -1907,14 +2873,10 @@ class FileProcessor(QThread):
 
         try:
             # Determine remote path first (needed for locked file retry)
+            remote_path = self._remote_path_for(filepath)
             if self.preserve_structure and self.local_base_path:
-                rel_path = os.path.relpath(filepath, self.local_base_path)
-                remote_path = f"{self.remote_base_path}/{rel_path}".replace("\\", "/")
-                logger.info(
-                    f"Preserve structure: {filepath} -> {remote_path} (rel_path: {rel_path})"
-                )
+                logger.info(f"Preserve structure: {filepath} -> {remote_path}")
             else:
-                remote_path = f"{self.remote_base_path}/{filename}"
                 logger.info(f"No structure preservation: {filepath} -> {remote_path}")
 
             # Always check if file is accessible (locked file handling always enabled)
@@ -1924,16 +2886,6 @@ class FileProcessor(QThread):
                 self.schedule_locked_file_retry(filepath, remote_path, filename, access_error)
                 return
 
-            # Calculate local checksum
-            self.status_update.emit(filename, "Calculating checksum...", filepath)
-            try:
-                local_checksum = self.calculate_checksum(filepath)
-            except (OSError, PermissionError) as e:
-                # File became locked during checksum calculation - always handle locked files
-                error_msg = f"File locked during checksum: {str(e)}"
-                self.schedule_locked_file_retry(filepath, remote_path, filename, error_msg)
-                return
-
             # Create remote directories if needed (check cache to avoid redundant attempts)
             remote_dir = os.path.dirname(remote_path)
             if (
@@ -1941,9 +2893,8 @@ class FileProcessor(QThread):
                 and remote_dir != self.remote_base_path
                 and self._should_create_directory(remote_dir)
             ):
-                success = self.webdav_client.create_directory(remote_dir)
-                if success and self.app_instance:
-                    self.app_instance.created_directories.add(remote_dir)
+                if self.webdav_client.create_directory(remote_dir):
+                    self._mark_directory_created(remote_dir)
 
             # Check for duplicate upload attempts to same remote path
             if self.app_instance:
@@ -1967,7 +2918,7 @@ class FileProcessor(QThread):
 
             # Check if remote file exists and get info
             self.status_update.emit(filename, "Checking remote file...", filepath)
-            remote_info = self.webdav_client.get_file_info(remote_path)
+            remote_info = self.webdav_client.get_file_info(remote_path, prefetch_directory=True)
 
             if remote_info is None:
                 # Error getting remote info, proceed with upload
@@ -1977,6 +2928,17 @@ class FileProcessor(QThread):
                 remote_info = {"exists": False}
 
             if remote_info.get("exists", True):
+                # Remote file exists, so the local checksum is needed up front for comparison.
+                # New files skip this pass; upload_file() hashes them while uploading.
+                self.status_update.emit(filename, "Calculating checksum...", filepath)
+                try:
+                    local_checksum = self.calculate_checksum(filepath)
+                except (OSError, PermissionError) as e:
+                    # File became locked during checksum calculation - always handle locked files
+                    error_msg = f"File locked during checksum: {str(e)}"
+                    self.schedule_locked_file_retry(filepath, remote_path, filename, error_msg)
+                    return
+
                 # Remote file exists, perform comparison
                 logger.debug(f"Remote file exists, comparing: {remote_path}")
                 comparison_result, reason = self.app_instance.verify_remote_file_integrity(filepath, remote_path, local_checksum)
@@ -2028,8 +2990,7 @@ class FileProcessor(QThread):
                         return
                     elif resolution == "rename" and new_name:
                         # Update remote path with new name
-                        remote_dir = os.path.dirname(remote_path)
-                        remote_path = f"{remote_dir}/{new_name}".replace("//", "/")
+                        remote_path = posixpath.join(posixpath.dirname(remote_path), new_name)
                         filename = new_name  # Update filename for status updates
                     # For 'overwrite', continue with original remote_path
             else:
@@ -2065,9 +3026,29 @@ class FileProcessor(QThread):
             # Fallback if no app instance - always attempt creation (original behavior)
             return True
 
+    def _mark_directory_created(self, remote_dir: str):
+        """
+        Record a remote directory, and every parent above it, as existing.
+
+        A directory can only exist inside existing parents, so files in shallower
+        folders of the same tree skip their MKCOL round trip as well.
+        """
+        if not self.app_instance:
+            return
+        created_directories = self.app_instance.created_directories
+        while remote_dir not in ("", "/") and remote_dir not in created_directories:
+            created_directories.add(remote_dir)
+            remote_dir = posixpath.dirname(remote_dir)
+
     def stop(self):
         """Stop the processor thread"""
         self.running = False
+        # Wake run() if it is blocked waiting for the next item
+        self.file_queue.put(_STOP_PROCESSING)
+        if self._hash_pool is not None:
+            self._hash_pool.shutdown(wait=False, cancel_futures=True)
+        if self._upload_pool is not None:
+            self._upload_pool.shutdown(wait=False, cancel_futures=True)
 
 
 class IntegrityCheckThread(QThread):
@@ -2076,6 +3057,8 @@ class IntegrityCheckThread(QThread):
     finished_signal = pyqtSignal(dict, dict)  # results dict, error_details dict
     file_issue_signal = pyqtSignal(str, str, str)  # filepath, issue_type, details
 
+    max_workers = 8  # Concurrent remote verifications (network-bound, so threads overlap well)
+
     def __init__(self, files_to_check, main_window):
         super().__init__()
         self.files_to_check = files_to_check
@@ -2097,135 +3080,242 @@ class IntegrityCheckThread(QThread):
         }
 
     def run(self):
-        """Perform the integrity check - ensure ALL local files are on remote server and intact"""
-        for i, filepath in enumerate(self.files_to_check, 1):
-            try:
-                self.progress_signal.emit(filepath, i, self.results['total'], "Checking...")
-
-                # Check if local file still exists
-                if not os.path.exists(filepath):
-                    filename = os.path.basename(filepath)
-                    self.progress_signal.emit(filepath, i, self.results['total'], "Local file missing - removing from tracking")
-                    # Remove from history if it exists
-                    if filepath in self.main_window.upload_history:
-                        del self.main_window.upload_history[filepath]
-                    # This isn't really an error, just cleanup
-                    continue
+        """Perform the integrity check - ensure ALL local files are on remote server and intact
 
-                # Calculate current checksum for this local file
-                current_checksum = self.main_window.file_processor.calculate_checksum(filepath)
-
-                # Determine remote path for this file
-                if filepath in self.main_window.upload_history:
-                    # File has been uploaded before - use tracked remote path
-                    history_entry = self.main_window.upload_history[filepath]
-                    remote_path = history_entry.get("remote_path")
-                    stored_checksum = history_entry.get("checksum")
-                else:
-                    # File not uploaded yet - determine where it should go
-                    remote_path = self.main_window.get_remote_path_for_file(filepath)
-                    stored_checksum = None
-
-                if not remote_path:
-                    # Can't determine remote path - this is an error
-                    filename = os.path.basename(filepath)
-                    self.progress_signal.emit(filepath, i, self.results['total'], "Cannot determine remote path")
-                    self.results['errors'] += 1
-                    self.error_details['other_errors'].append({
-                        'filepath': filepath,
-                        'filename': filename,
-                        'reason': 'Unable to determine remote path for file'
-                    })
-                    continue
+        Local checksums are computed on this thread while the remote verifications, which are
+        dominated by network round trips, run concurrently on a small worker pool. Results are
+        then reported in the original file order.
+        """
+        prefetched_dirs = set()  # Remote directories already listed with a single PROPFIND
+        pending = []  # (index, filepath, current_checksum, stored_checksum, future) awaiting results
 
-                # Verify remote file integrity
-                # Use the stored checksum if available, otherwise use current checksum
-                checksum_for_verification = stored_checksum if stored_checksum else current_checksum
-                remote_ok, reason = self.main_window.verify_remote_file_integrity(
-                    filepath, remote_path, checksum_for_verification
-                )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i, filepath in enumerate(self.files_to_check, 1):
+                try:
+                    self.progress_signal.emit(filepath, i, self.results['total'], "Checking...")
+
+                    # Check if local file still exists
+                    if not os.path.exists(filepath):
+                        self.progress_signal.emit(filepath, i, self.results['total'], "Local file missing - removing from tracking")
+                        # Remove from history if it exists
+                        self.main_window.forget_upload(filepath)
+                        # This isn't really an error, just cleanup
+                        continue
 
-                if remote_ok:
-                    # File is intact on remote server
-                    if stored_checksum and stored_checksum.lower() != "unknown":
-                        checksum_short = stored_checksum[:12]
-                        verification_msg = f"Remote file verified by {reason} (upload checksum: {checksum_short}...)"
-                    else:
-                        # No stored checksum - using current file checksum for verification
-                        checksum_short = current_checksum[:12]
-                        verification_msg = f"Remote file verified by {reason} (current checksum: {checksum_short}...)"
+                    # Calculate current checksum for this local file
+                    current_checksum = self.main_window.file_processor.calculate_checksum(filepath)
 
-                    self.progress_signal.emit(filepath, i, self.results['total'], verification_msg)
-                    self.results['verified'] += 1
-                else:
-                    # File is missing or corrupted on remote server
-                    filename = os.path.basename(filepath)
-                    if "not found" in reason.lower():
-                        # File is missing from remote server
-                        if self.main_window.is_file_in_upload_queue(filepath):
-                            # File is already queued for upload - that's good!
-                            self.progress_signal.emit(filepath, i, self.results['total'],
-                                                    "Missing from remote - already queued for upload")
-                            # This isn't an error - it's expected behavior
-                        else:
-                            # File is missing but not queued - this needs attention
-                            self.progress_signal.emit(filepath, i, self.results['total'],
-                                                    "Missing from remote - adding to upload queue")
-                            self.results['missing'] += 1
-                            self.error_details['missing_remote'].append({
-                                'filepath': filepath,
-                                'filename': filename,
-                                'reason': 'File missing from remote server and not in upload queue'
-                            })
-                            # Emit signal to notify UI about missing file
-                            self.file_issue_signal.emit(filepath, "missing", "File not found on remote server")
-                            # Add to upload queue
-                            self.main_window.queue_file_for_upload(filepath, "missing from remote during integrity check")
+                    # Determine remote path for this file (one lookup; upload workers may change the history)
+                    history_entry = self.main_window.upload_history.get(filepath)
+                    if history_entry:
+                        # File has been uploaded before - use tracked remote path
+                        remote_path = history_entry.get("remote_path")
+                        stored_checksum = history_entry.get("checksum")
                     else:
-                        # File exists on remote but differs from expected
-                        # We cannot determine if it's corruption or legitimate change
-                        # Always treat as a conflict and use conflict resolution settings
-
-                        if stored_checksum and current_checksum.lower() != stored_checksum.lower():
-                            # Both local and remote have changed - definitely a conflict
-                            conflict_reason = "Both local and remote files have changed since last sync"
-                        else:
-                            # Local unchanged, remote different - could be corruption or server-side change
-                            conflict_reason = "Remote file differs from expected (possible corruption or server-side change)"
-
-                        self.progress_signal.emit(filepath, i, self.results['total'],
-                                                "File conflict detected - applying conflict resolution")
-                        self.results['changed'] += 1
-                        self.error_details['changed_local'].append({
+                        # File not uploaded yet - determine where it should go
+                        remote_path = self.main_window.get_remote_path_for_file(filepath)
+                        stored_checksum = None
+
+                    if not remote_path:
+                        # Can't determine remote path - this is an error
+                        filename = os.path.basename(filepath)
+                        self.progress_signal.emit(filepath, i, self.results['total'], "Cannot determine remote path")
+                        self.results['errors'] += 1
+                        self.error_details['other_errors'].append({
                             'filepath': filepath,
                             'filename': filename,
-                            'reason': conflict_reason
+                            'reason': 'Unable to determine remote path for file'
                         })
-                        # Always trigger conflict resolution - let user decide what to do
-                        self.file_issue_signal.emit(filepath, "changed", conflict_reason)
+                        continue
 
-            except Exception as e:
-                filename = os.path.basename(filepath)
-                logger.error(f"Error checking integrity of {filepath}: {e}")
-                self.progress_signal.emit(filepath, i, self.results['total'], f"Error: {str(e)}")
-                self.results['errors'] += 1
-                # Categorize the error based on the exception type/message
-                error_msg = str(e).lower()
-                if any(net_term in error_msg for net_term in ['connection', 'timeout', 'network', 'http']):
-                    self.error_details['network_errors'].append({
-                        'filepath': filepath,
-                        'filename': filename,
-                        'reason': f'Network error: {str(e)}'
-                    })
+                    # List the remote directory once so per-file lookups are served from the listing
+                    remote_dir = remote_path.rpartition("/")[0] or "/"
+                    if remote_dir not in prefetched_dirs and self.main_window.webdav_client:
+                        prefetched_dirs.add(remote_dir)
+                        self.main_window.webdav_client.prefetch_directory_info(remote_dir)
+
+                    # Verify remote file integrity in the background
+                    # Use the stored checksum if available, otherwise use current checksum
+                    checksum_for_verification = stored_checksum if stored_checksum else current_checksum
+                    future = executor.submit(
+                        self.main_window.verify_remote_file_integrity,
+                        filepath, remote_path, checksum_for_verification
+                    )
+                    pending.append((i, filepath, current_checksum, stored_checksum, future))
+
+                except Exception as e:
+                    self._record_error(i, filepath, e)
+
+            for i, filepath, current_checksum, stored_checksum, future in pending:
+                try:
+                    remote_ok, reason = future.result()
+                    self._handle_verification_result(
+                        i, filepath, current_checksum, stored_checksum, remote_ok, reason
+                    )
+                except Exception as e:
+                    self._record_error(i, filepath, e)
+
+        # Pass the detailed error information to the finished signal
+        self.finished_signal.emit(self.results, self.error_details)
+
+    def _handle_verification_result(self, i, filepath, current_checksum, stored_checksum, remote_ok, reason):
+        """Report the outcome of a single remote verification"""
+        if remote_ok:
+            # File is intact on remote server
+            if stored_checksum and stored_checksum.lower() != "unknown":
+                checksum_short = stored_checksum[:12]
+                verification_msg = f"Remote file verified by {reason} (upload checksum: {checksum_short}...)"
+            else:
+                # No stored checksum - using current file checksum for verification
+                checksum_short = current_checksum[:12]
+                verification_msg = f"Remote file verified by {reason} (current checksum: {checksum_short}...)"
+
+            self.progress_signal.emit(filepath, i, self.results['total'], verification_msg)
+            self.results['verified'] += 1
+        else:
+            # File is missing or corrupted on remote server
+            filename = os.path.basename(filepath)
+            if "not found" in reason.lower():
+                # File is missing from remote server
+                if self.main_window.is_file_in_upload_queue(filepath):
+                    # File is already queued for upload - that's good!
+                    self.progress_signal.emit(filepath, i, self.results['total'],
+                                            "Missing from remote - already queued for upload")
+                    # This isn't an error - it's expected behavior
                 else:
-                    self.error_details['other_errors'].append({
+                    # File is missing but not queued - this needs attention
+                    self.progress_signal.emit(filepath, i, self.results['total'],
+                                            "Missing from remote - adding to upload queue")
+                    self.results['missing'] += 1
+                    self.error_details['missing_remote'].append({
                         'filepath': filepath,
                         'filename': filename,
-                        'reason': f'Unexpected error: {str(e)}'
+                        'reason': 'File missing from remote server and not in upload queue'
                     })
+                    # Emit signal to notify UI about missing file
+                    self.file_issue_signal.emit(filepath, "missing", "File not found on remote server")
+                    # Add to upload queue
+                    self.main_window.queue_file_for_upload(filepath, "missing from remote during integrity check")
+            else:
+                # File exists on remote but differs from expected
+                # We cannot determine if it's corruption or legitimate change
+                # Always treat as a conflict and use conflict resolution settings
 
-        # Pass the detailed error information to the finished signal
-        self.finished_signal.emit(self.results, self.error_details)
+                if stored_checksum and current_checksum != stored_checksum:
+                    # Both local and remote have changed - definitely a conflict
+                    conflict_reason = "Both local and remote files have changed since last sync"
+                else:
+                    # Local unchanged, remote different - could be corruption or server-side change
+                    conflict_reason = "Remote file differs from expected (possible corruption or server-side change)"
+
+                self.progress_signal.emit(filepath, i, self.results['total'],
+                                        "File conflict detected - applying conflict resolution")
+                self.results['changed'] += 1
+                self.error_details['changed_local'].append({
+                    'filepath': filepath,
+                    'filename': filename,
+                    'reason': conflict_reason
+                })
+                # Always trigger conflict resolution - let user decide what to do
+                self.file_issue_signal.emit(filepath, "changed", conflict_reason)
+
+    def _record_error(self, i, filepath, e):
+        """Count and categorize an unexpected error while checking a file"""
+        filename = os.path.basename(filepath)
+        logger.error(f"Error checking integrity of {filepath}: {e}")
+        self.progress_signal.emit(filepath, i, self.results['total'], f"Error: {str(e)}")
+        self.results['errors'] += 1
+        # Categorize the error based on the exception type/message
+        error_msg = str(e).lower()
+        if any(net_term in error_msg for net_term in ['connection', 'timeout', 'network', 'http']):
+            self.error_details['network_errors'].append({
+                'filepath': filepath,
+                'filename': filename,
+                'reason': f'Network error: {str(e)}'
+            })
+        else:
+            self.error_details['other_errors'].append({
+                'filepath': filepath,
+                'filename': filename,
+                'reason': f'Unexpected error: {str(e)}'
+            })
+
+
+class ExistingFileScanThread(QThread):
+    """Thread that finds files already in the monitored folder when monitoring starts
+
+    Walking a large tree and checking each match against the upload history (which can
+    mean a checksum and a remote verification per file) used to run on the UI thread.
+    Results are sent back in small batches so the UI can queue them, and uploads can
+    start, while the rest of the tree is still being scanned.
+    """
+    files_found_signal = pyqtSignal(list)  # [(filepath, is_uploaded, reason), ...]
+    finished_signal = pyqtSignal(int, int, float)  # files_found, entries_scanned, elapsed seconds
+
+    batch_size = 100  # Files per batch sent to the UI
+    batch_interval = 0.5  # Seconds before a partial batch is sent anyway
+
+    def __init__(self, directory, extensions, recursive, main_window):
+        super().__init__()
+        self.directory = directory
+        self.recursive = recursive
+        self.main_window = main_window
+        # Convert extensions to the same format as FileMonitorHandler
+        self.extensions = _normalize_extensions(extensions)
+
+    def run(self):
+        """Walk the directory and report matching files, checking each against the upload history"""
+        logger.info(f"Scanning existing files in {self.directory}")
+        logger.info(f"Recursive scanning: {self.recursive}")
+        logger.info(f"Scanning for extensions: {self.extensions}")
+
+        files_found = 0
+        entries_scanned = 0
+        scan_start = time.monotonic()
+        batch = []
+        last_emit = scan_start
+
+        # Files that are skipped or don't match are only counted: the root logger runs
+        # at DEBUG, so a log call per non-matching file dominated large scans
+        try:
+            logger.info("Starting recursive scan" if self.recursive else "Starting non-recursive scan")
+            for entry in _iter_directory_files(self.directory, self.recursive):
+                if self.isInterruptionRequested():
+                    logger.info("Scan of existing files cancelled")
+                    break
+                entries_scanned += 1
+                name = entry.name
+
+                # Skip hidden/system files
+                if name.startswith(_SKIP_FILE_PREFIXES):
+                    continue
+
+                if name.lower().endswith(self.extensions):
+                    filepath = entry.path
+                    files_found += 1
+                    logger.info(f"Found existing file: {filepath}")
+
+                    is_uploaded, reason = self.main_window.is_file_already_uploaded(filepath)
+                    batch.append((filepath, is_uploaded, reason))
+
+                    now = time.monotonic()
+                    if len(batch) >= self.batch_size or now - last_emit >= self.batch_interval:
+                        self.files_found_signal.emit(batch)
+                        batch = []
+                        last_emit = now
+        except OSError as e:
+            logger.error(f"Error listing directory {self.directory}: {e}")
+        except Exception as e:
+            logger.error(f"Error scanning directory {self.directory}: {e}")
+
+        if batch:
+            self.files_found_signal.emit(batch)
+
+        elapsed = time.monotonic() - scan_start
+        logger.info(
+            f"Scan complete: {files_found} matching of {entries_scanned} entries in {elapsed:.2f}s"
+        )
+        self.finished_signal.emit(files_found, entries_scanned, elapsed)
 
 
 class FileConflictDialog(QDialog):
@@ -2415,6 +3505,19 @@ class FileConflictDialog(QDialog):
 class RemoteBrowserDialog(QDialog):
     """Dialog for browsing remote WebDAV directories"""
 
+    # Explanations shown when MKCOL fails, keyed by HTTP status
+    CREATE_FOLDER_ERRORS = {
+        403: (
+            "Permission Denied (HTTP 403)\n\n"
+            "This means you don't have write permissions to create folders in this directory.\n\n"
+            "Possible solutions:\n"
+            "• Contact your Panorama administrator to request write access\n"
+            "• Try creating the folder in a different directory where you have permissions\n"
+            "• Check if you're in the correct user folder\n\n"
+        ),
+        409: "Path Conflict (HTTP 409)\n\nThe parent directory may not exist.\n\n",
+    }
+
     def __init__(self, webdav_client: WebDAVClient, parent=None, initial_path: str = "/"):
         super().__init__(parent)
         self.webdav_client = webdav_client
@@ -2426,6 +3529,15 @@ class RemoteBrowserDialog(QDialog):
 
         self.setup_ui()
         self.refresh_listing()
+        # Fetch the starting folder's whole subtree in the background so browsing into
+        # its subfolders needs no further requests, while the first level is shown from
+        # a Depth 1 listing right away. The server root is skipped since on a shared
+        # server it spans every project
+        if self.current_path != "/":
+            threading.Thread(
+                target=self.webdav_client.walk, args=(self.current_path,),
+                name="remote-browser-walk", daemon=True,
+            ).start()
 
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -2439,7 +3551,7 @@ class RemoteBrowserDialog(QDialog):
         path_layout.addStretch()
 
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.clicked.connect(self.refresh_listing)
+        self.refresh_btn.clicked.connect(self.reload_listing)
         path_layout.addWidget(self.refresh_btn)
 
         layout.addLayout(path_layout)
@@ -2502,6 +3614,11 @@ class RemoteBrowserDialog(QDialog):
 
         logging.info(f"GUI: Tree widget now has {self.tree.topLevelItemCount()} total items")
 
+    def reload_listing(self):
+        """Re-read the current directory from the server, bypassing cached listings"""
+        self.webdav_client.clear_listing_cache()
+        self.refresh_listing()
+
     def on_item_double_click(self, item, column):
         """Handle double-click on item"""
         path = item.data(0, Qt.ItemDataRole.UserRole)
@@ -2525,43 +3642,31 @@ class RemoteBrowserDialog(QDialog):
             new_path = f"{self.current_path.rstrip('/')}/{name}"
             logger.info(f"Attempting to create folder: {new_path}")
 
-            if self.webdav_client.create_directory(new_path):
+            created, status = self.webdav_client.create_directory_with_status(new_path)
+            if created:
                 QMessageBox.information(self, "Success", f"Created folder: {name}")
                 self.refresh_listing()
             else:
-                # Provide more detailed error message based on the log
+                # Explain the failure from the MKCOL status
                 error_msg = f"Failed to create folder: {name}\n\n"
 
-                # Check recent log entries for specific error details
-                try:
-                    with open("panoramabridge.log") as f:
-                        log_lines = f.readlines()
-                        recent_errors = [
-                            line
-                            for line in log_lines[-10:]
-                            if "ERROR" in line and "creating directory" in line
-                        ]
-
-                        if recent_errors:
-                            latest_error = recent_errors[-1]
-                            if "Permission denied" in latest_error:
-                                error_msg += "Permission Denied (HTTP 403)\n\n"
-                                error_msg += "This means you don't have write permissions to create folders in this directory.\n\n"
-                                error_msg += "Possible solutions:\n"
-                                error_msg += "• Contact your Panorama administrator to request write access\n"
-                                error_msg += "• Try creating the folder in a different directory where you have permissions\n"
-                                error_msg += "• Check if you're in the correct user folder\n\n"
-                            elif "Conflict" in latest_error:
-                                error_msg += "Path Conflict (HTTP 409)\n\n"
-                                error_msg += "The parent directory may not exist.\n\n"
-                            else:
-                                error_msg += "Server Error\n\n"
-                        else:
-                            error_msg += "Possible reasons:\n"
-                            error_msg += "• You may not have write permissions\n"
-                            error_msg += "• The folder name may contain invalid characters\n"
-                            error_msg += "• The server may have restrictions on folder creation\n\n"
-                except Exception:
+                # Without a response the logged exception is the only detail available
+                recent_errors = []
+                if status is None:
+                    recent_errors = [
+                        line
+                        for line in list(recent_log_handler.lines)  # Snapshot; other threads keep logging
+                        if "ERROR" in line and "creating directory" in line
+                    ]
+
+                if status is not None:
+                    error_msg += self.CREATE_FOLDER_ERRORS.get(
+                        status, f"Server Error (HTTP {status})\n\n"
+                    )
+                elif recent_errors:
+                    # Drop the "time - logger - level - " prefix of the formatted record
+                    error_msg += f"{recent_errors[-1].split(' - ', 3)[-1]}\n\n"
+                else:
                     error_msg += "Possible reasons:\n"
                     error_msg += "• You may not have write permissions\n"
                     error_msg += "• The folder name may contain invalid characters\n"
@@ -2582,6 +3687,43 @@ class RemoteBrowserDialog(QDialog):
         return self.selected_path
 
 
+# Item data roles of the transfer table's Progress column, drawn by ProgressBarDelegate
+PROGRESS_ROLE = Qt.ItemDataRole.UserRole  # Percent complete, or None while no bar is shown
+PROGRESS_FAILED_ROLE = Qt.ItemDataRole.UserRole + 1  # True once the transfer has failed
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """
+    Paints the transfer table's Progress column as a progress bar from the cell's data.
+
+    A QProgressBar cell widget per row made adding rows slow and kept a live widget for
+    every file ever queued; a painted bar costs nothing for rows scrolled out of view,
+    and updating one is a setData() on the item.
+    """
+
+    def paint(self, painter, option, index):
+        progress = index.data(PROGRESS_ROLE)
+        if progress is None:
+            super().paint(painter, option, index)
+            return
+
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(2, 2, -2, -2)
+        bar.state = option.state | QStyle.StateFlag.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = progress
+        bar.text = f"{progress}%"
+        bar.textVisible = True
+        palette = QPalette(option.palette)
+        if index.data(PROGRESS_FAILED_ROLE):
+            palette.setColor(QPalette.ColorRole.Highlight, QColor("red"))
+        bar.palette = palette
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, option.widget)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window for PanoramaBridge.
@@ -2600,6 +3742,8 @@ class MainWindow(QMainWindow):
     3. Transfer Status - View active transfers and progress
     """
 
+    queue_changed = pyqtSignal()  # Emitted (from any thread) after files are added to file_queue
+
     def __init__(self):
         """Initialize the main application window and components."""
         super().__init__()
@@ -2610,10 +3754,17 @@ class MainWindow(QMainWindow):
         self.setup_application_icon()
 
         # Core application components
-        self.file_queue = queue.Queue()  # Thread-safe queue for file processing
+        # Thread-safe queue for file processing; SimpleQueue is implemented in C and
+        # nothing here uses Queue's task_done()/join() bookkeeping
+        self.file_queue = queue.SimpleQueue()
         self.file_processor = FileProcessor(self.file_queue, self)  # Background processing thread
         self.monitor_handler = None  # File system event handler
         self.observer = None  # Watchdog observer for file monitoring
+        self.scan_thread = None  # Background scan for files present when monitoring starts
+        # Directory, normalized extensions and recursion the current monitoring session uses
+        self.monitored_directory = ""
+        self.monitored_extensions = ()
+        self.monitored_recursive = False
         self.webdav_client = None  # WebDAV client instance
         self.transfer_rows = {}  # Track UI table rows for updates
         self.queued_files = set()  # Track files already queued to prevent duplicates
@@ -2622,7 +3773,10 @@ class MainWindow(QMainWindow):
         self.failed_files = {}  # Track files that failed verification for re-upload
         self.file_remote_paths = {}  # Track filepath -> remote_path mappings to prevent duplicate uploads
         self.local_checksum_cache = {}  # Local checksum cache to avoid recalculation
+        self.local_digest_cache = {}  # Non-SHA256 digests (e.g. MD5 for ETag checks), same keys as above
+        self.remote_verification_cache = {}  # filepath -> (size, mtime, etag, checksum, reason) of last verified state
         self.upload_history = {}  # Persistent tracking of successfully uploaded files {filepath: {checksum, timestamp, remote_path}}
+        self.upload_history_lock = threading.RLock()  # Upload workers and scan threads change upload_history too
 
         # Load persistent upload history
         self.load_upload_history()
@@ -2640,16 +3794,21 @@ class MainWindow(QMainWindow):
         self.file_processor.status_update.connect(self.on_status_update)
         self.file_processor.transfer_complete.connect(self.on_transfer_complete)
         self.file_processor.conflict_resolution_needed.connect(self.on_conflict_resolution_needed)
+        self.file_processor.queue_changed.connect(self.schedule_queue_size_update)
         self.file_processor.start()
 
-        # Setup periodic UI updates
-        self.queue_timer = QTimer()
-        self.queue_timer.timeout.connect(self.update_queue_size)
-        self.queue_timer.start(1000)  # Update queue size display every second
+        # Refresh the queue size display when files are queued or dequeued instead of polling
+        self.queue_update_pending = False
+        self.queue_status_logged_at = 0.0
+        self.queue_changed.connect(self.schedule_queue_size_update)
 
         # Setup periodic file polling as backup to watchdog events
         self.poll_timer = QTimer()
         self.poll_timer.timeout.connect(self.poll_for_new_files)
+        self.poll_scheduler = None  # Created with the timer when monitoring begins
+        # Files moving through the queue mean the directory is active again
+        self.queue_changed.connect(self.reset_poll_backoff)
+        self.file_processor.queue_changed.connect(self.reset_poll_backoff)
         # Timer will be started when monitoring begins
 
         # Setup periodic cache saving (every 5 minutes)
@@ -3083,6 +4242,7 @@ class MainWindow(QMainWindow):
         header.resizeSection(2, 80)  # Status
         header.resizeSection(3, 100)  # Progress
         header.setStretchLastSection(True)  # Message column stretches
+        self.transfer_table.setItemDelegateForColumn(2, ProgressBarDelegate(self.transfer_table))
 
         # Add context menu for re-upload
         self.transfer_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -3102,11 +4262,19 @@ class MainWindow(QMainWindow):
         log_controls.addStretch()
         log_layout.addLayout(log_controls)
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(150)
+        self.log_text.setMaximumBlockCount(500)  # Oldest lines are dropped so the log can't grow unbounded
         log_layout.addWidget(self.log_text)
 
+        # Lines are buffered and written in one update so bursts don't re-layout per line
+        self.log_buffer = []
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(100)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+
         log_group.setLayout(log_layout)
         layout.addWidget(log_group)
 
@@ -3114,14 +4282,34 @@ class MainWindow(QMainWindow):
         return widget
 
     def get_transfer_table_key(self, filename: str, filepath: str) -> str:
-        """Generate consistent unique key for transfer table tracking"""
-        # Use relative path from monitored directory for consistency
-        if self.dir_input.text() and filepath.startswith(self.dir_input.text()):
-            relative_path = os.path.relpath(filepath, self.dir_input.text())
-            if not relative_path.startswith(".."):
-                return f"{relative_path}|{filepath}"
-        # Fallback to filename|filepath for files outside monitored directory
-        return f"{filename}|{filepath}"
+        """Generate consistent unique key for transfer table tracking
+
+        The absolute path alone identifies a file (the filename is derived from it), so it is
+        used directly as the key. This avoids building and re-parsing a composite string for
+        every table update and lets path lookups in transfer_rows be plain dict hits.
+        """
+        return filepath
+
+    def _display_path(self, filepath: str) -> str:
+        """Return filepath relative to the monitored directory, or unchanged if outside it"""
+        root = self.dir_input.text().rstrip("/\\")
+        # A plain prefix slice gives the same result as os.path.relpath for paths under root
+        if root and filepath.startswith(root) and filepath[len(root) : len(root) + 1] in ("/", os.sep):
+            return filepath[len(root) + 1 :]
+        return filepath
+
+    def append_log(self, message: str):
+        """Add a line to the activity log; buffered lines are written out within 100ms"""
+        self.log_buffer.append(message)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def flush_log(self):
+        """Write all buffered activity log lines to the log view at once"""
+        if not self.log_buffer:
+            return
+        self.log_text.appendPlainText("\n".join(self.log_buffer))
+        self.log_buffer.clear()
 
     @pyqtSlot(str)
     def add_queued_file_to_table(self, filepath: str):
@@ -3147,11 +4335,7 @@ class MainWindow(QMainWindow):
         self.transfer_table.insertRow(row_count)
 
         # Create display path (relative to monitored directory if possible)
-        display_path = filepath
-        if self.dir_input.text() and filepath.startswith(self.dir_input.text()):
-            relative_path = os.path.relpath(filepath, self.dir_input.text())
-            if not relative_path.startswith(".."):
-                display_path = relative_path
+        display_path = self._display_path(filepath)
 
         # Set basic info in the new bottom row
         # Use display_path in File column (combines path and filename)
@@ -3159,11 +4343,10 @@ class MainWindow(QMainWindow):
         # Column 1 is now Status (was Path)
         self.transfer_table.setItem(row_count, 1, QTableWidgetItem("Queued"))
 
-        # Add empty progress bar (now in column 2)
-        progress_bar = QProgressBar()
-        progress_bar.setValue(0)
-        progress_bar.setVisible(False)  # Hide progress bar for queued files
-        self.transfer_table.setCellWidget(row_count, 2, progress_bar)
+        # Add progress cell (now in column 2), without a bar for queued files
+        progress_item = QTableWidgetItem()
+        progress_item.setData(PROGRESS_ROLE, None)
+        self.transfer_table.setItem(row_count, 2, progress_item)
 
         # Set message (now in column 3)
         self.transfer_table.setItem(row_count, 3, QTableWidgetItem("Waiting for processing..."))
@@ -3191,10 +4374,16 @@ class MainWindow(QMainWindow):
         log_content.setReadOnly(True)
         log_content.setFont(QFont("Courier", 9))
 
-        # Try to read the log file
+        # Try to read the log file; only its tail, so a long-running log can't stall the UI
         try:
-            with open("panoramabridge.log") as f:
-                log_content.setText(f.read())
+            log_text, truncated = _read_log_tail("panoramabridge.log", LOG_VIEW_TAIL_BYTES)
+            if truncated:
+                info_label.setText(
+                    f"Most recent {LOG_VIEW_TAIL_BYTES // (1024 * 1024)}MB of application logs "
+                    "(full log saved to panoramabridge.log)"
+                )
+            log_content.setPlainText(log_text)
+            log_content.moveCursor(QTextCursor.MoveOperation.End)
         except FileNotFoundError:
             log_content.setText(
                 "No log file found yet. Logs will appear here as the application runs."
@@ -3287,8 +4476,8 @@ class MainWindow(QMainWindow):
         if self.connect_webdav():
             url = self.webdav_client.url if self.webdav_client else "Unknown"
             QMessageBox.information(self, "Success", f"Connection successful\nConnected to: {url}")
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Connected to WebDAV server at {url}"
+            self.append_log(
+                f"{_clock_hms()} - Connected to WebDAV server at {url}"
             )
         else:
             QMessageBox.warning(
@@ -3296,7 +4485,7 @@ class MainWindow(QMainWindow):
                 "Failed",
                 "Could not connect to WebDAV server.\nCheck your URL, username, and password.",
             )
-            self.log_text.append(f"{datetime.now().strftime('%H:%M:%S')} - Connection failed")
+            self.append_log(f"{_clock_hms()} - Connection failed")
 
     def toggle_monitoring(self):
         """Start or stop monitoring"""
@@ -3306,10 +4495,11 @@ class MainWindow(QMainWindow):
             self.observer.join()
             self.observer = None
             self.poll_timer.stop()  # Stop polling timer
+            self.stop_existing_file_scan()
             self.start_btn.setText("Start Monitoring")
             self.status_label.setText("Not monitoring")
             self.status_label.setStyleSheet("font-weight: bold; color: red;")
-            self.log_text.append(f"{datetime.now().strftime('%H:%M:%S')} - Stopped monitoring")
+            self.append_log(f"{_clock_hms()} - Stopped monitoring")
 
             # Improved queue management when stopping monitoring
             self.clear_queue_on_stop()
@@ -3368,6 +4558,7 @@ class MainWindow(QMainWindow):
 
                 self.observer.start()
                 logger.info(f"Started OS-level file monitoring for: {directory}")
+                self.set_monitored_settings(directory, extensions, self.subdirs_check.isChecked())
             except Exception as monitor_error:
                 logger.error(f"Failed to start file monitoring: {monitor_error}", exc_info=True)
                 QMessageBox.critical(
@@ -3389,6 +4580,7 @@ class MainWindow(QMainWindow):
                 polling_interval_ms = (
                     self.polling_interval_spin.value() * 60 * 1000
                 )  # Convert minutes to ms
+                self.poll_scheduler = PollScheduler(polling_interval_ms)
                 self.poll_timer.start(polling_interval_ms)
                 logger.info(
                     f"Started backup polling every {self.polling_interval_spin.value()} minutes"
@@ -3399,7 +4591,7 @@ class MainWindow(QMainWindow):
             # Clear the transfer status table for a fresh start
             self.clear_transfer_table()
 
-            # Scan for existing files in the directory
+            # Scan for existing files in the directory (runs in the background)
             self.scan_existing_files(directory, extensions, self.subdirs_check.isChecked())
 
             # Verify remote integrity of previously uploaded files
@@ -3411,123 +4603,86 @@ class MainWindow(QMainWindow):
             self.status_label.setText("Monitoring active")
             self.status_label.setStyleSheet("font-weight: bold; color: green;")
 
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Started monitoring {directory}"
+            self.append_log(
+                f"{_clock_hms()} - Started monitoring {directory}"
             )
-            self.log_text.append(f"Extensions: {', '.join(extensions)}")
+            self.append_log(f"Extensions: {', '.join(extensions)}")
 
             # Show upload history status
             if self.upload_history:
-                self.log_text.append(
-                    f"{datetime.now().strftime('%H:%M:%S')} - Upload history: {len(self.upload_history)} files previously uploaded"
+                self.append_log(
+                    f"{_clock_hms()} - Upload history: {len(self.upload_history)} files previously uploaded"
                 )
 
             # Log the actual monitoring configuration
             if self.enable_polling_check.isChecked():
                 polling_interval = self.polling_interval_spin.value()
-                self.log_text.append(
-                    f"{datetime.now().strftime('%H:%M:%S')} - OS file events + backup polling every {polling_interval} minutes"
+                self.append_log(
+                    f"{_clock_hms()} - OS file events + backup polling every {polling_interval} minutes"
                 )
             else:
-                self.log_text.append(
-                    f"{datetime.now().strftime('%H:%M:%S')} - OS file events only (backup polling disabled)"
+                self.append_log(
+                    f"{_clock_hms()} - OS file events only (backup polling disabled)"
                 )
 
-    def scan_existing_files(self, directory: str, extensions: list[str], recursive: bool):
-        """Scan directory for existing files and add them to the queue"""
-        logger.info(f"Scanning existing files in {directory}")
-        logger.info(f"Recursive scanning: {recursive}")
-
-        # Convert extensions to the same format as FileMonitorHandler
-        formatted_extensions = [
-            ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions
-        ]
-        logger.info(f"Scanning for extensions: {formatted_extensions}")
-
-        files_found = 0
+    def set_monitored_settings(self, directory: str, extensions: list[str], recursive: bool):
+        """Remember the settings monitoring was started with, parsed once for the backup poll"""
+        self.monitored_directory = directory
+        self.monitored_extensions = _normalize_extensions(extensions)
+        self.monitored_recursive = recursive
 
+    def scan_existing_files(self, directory: str, extensions: list[str], recursive: bool):
+        """Scan directory for existing files in the background and add them to the queue"""
+        self.stop_existing_file_scan()
+
+        self.scan_thread = ExistingFileScanThread(directory, extensions, recursive, self)
+        self.scan_thread.files_found_signal.connect(self.on_existing_files_found)
+        self.scan_thread.finished_signal.connect(self.on_existing_file_scan_finished)
+        self.scan_thread.start()
+
+    def stop_existing_file_scan(self):
+        """Cancel a scan of existing files that is still running and wait for it to exit"""
+        if self.scan_thread and self.scan_thread.isRunning():
+            self.scan_thread.requestInterruption()
+            self.scan_thread.wait()
+
+    def on_existing_files_found(self, batch):
+        """Queue a batch of existing files reported by the scan thread"""
+        if self.sender() is not self.scan_thread or not (self.observer and self.observer.is_alive()):
+            return  # Monitoring was stopped or restarted after this batch was sent
+
+        # Repaint the table once for the whole batch rather than once per added row
+        self.transfer_table.setUpdatesEnabled(False)
         try:
-            if recursive:
-                # Recursively scan all subdirectories
-                logger.info("Starting recursive scan using os.walk")
-                for root, dirs, files in os.walk(directory):
-                    logger.debug(f"Scanning directory: {root}")
-                    for file in files:
-                        filepath = os.path.join(root, file)
-                        logger.debug(f"Checking file: {filepath}")
-
-                        # Skip hidden/system files
-                        if file.startswith(".") or file.startswith("~"):
-                            logger.debug(f"Skipping hidden/system file: {file}")
-                            continue
-
-                        if any(filepath.lower().endswith(ext) for ext in formatted_extensions):
-                            files_found += 1
-                            logger.info(f"Found existing file: {filepath}")
-
-                            # Check if file is already uploaded
-                            is_uploaded, reason = self.is_file_already_uploaded(filepath)
-                            if is_uploaded:
-                                # Add to table as "Completed" - already uploaded
-                                self.add_completed_file_to_table(filepath, reason)
-                                logger.debug(f"File already uploaded: {os.path.basename(filepath)} ({reason})")
-                            else:
-                                # Check for duplicates before queueing
-                                if self._should_queue_file_scan_new(filepath):
-                                    self.file_queue.put(filepath)
-                                    logger.info(f"Queued existing file: {filepath}")
-                                    # Add to transfer table with "Queued" status
-                                    self.add_queued_file_to_table(filepath)
-                                else:
-                                    logger.debug(f"File already queued or processing, skipping: {filepath}")
-                        else:
-                            logger.debug(f"File {filepath} doesn't match extensions")
-            else:
-                # Scan only the top-level directory
-                logger.info("Starting non-recursive scan")
-                try:
-                    for item in os.listdir(directory):
-                        filepath = os.path.join(directory, item)
-                        if os.path.isfile(filepath):
-                            # Skip hidden/system files
-                            if item.startswith(".") or item.startswith("~"):
-                                logger.debug(f"Skipping hidden/system file: {item}")
-                                continue
-
-                            if any(filepath.lower().endswith(ext) for ext in formatted_extensions):
-                                files_found += 1
-                                logger.info(f"Found existing file: {filepath}")
-
-                                # Check if file is already uploaded
-                                is_uploaded, reason = self.is_file_already_uploaded(filepath)
-                                if is_uploaded:
-                                    # Add to table as "Completed" - already uploaded
-                                    self.add_completed_file_to_table(filepath, reason)
-                                    logger.debug(f"File already uploaded: {os.path.basename(filepath)} ({reason})")
-                                else:
-                                    # Check for duplicates before queueing
-                                    if self._should_queue_file_scan_new(filepath):
-                                        self.file_queue.put(filepath)
-                                        logger.info(f"Queued existing file: {filepath}")
-                                        # Add to transfer table with "Queued" status
-                                        self.add_queued_file_to_table(filepath)
-                                    else:
-                                        logger.debug(f"File already queued or processing, skipping: {filepath}")
-                except OSError as e:
-                    logger.error(f"Error listing directory {directory}: {e}")
-        except Exception as e:
-            logger.error(f"Error scanning directory {directory}: {e}")
+            for filepath, is_uploaded, reason in batch:
+                if is_uploaded:
+                    # Add to table as "Completed" - already uploaded
+                    self.add_completed_file_to_table(filepath, reason)
+                    logger.debug(f"File already uploaded: {os.path.basename(filepath)} ({reason})")
+                elif self._should_queue_file_scan_new(filepath):
+                    # Check for duplicates before queueing
+                    self.queue_file(filepath)
+                    logger.info(f"Queued existing file: {filepath}")
+                    # Add to transfer table with "Queued" status
+                    self.add_queued_file_to_table(filepath)
+                else:
+                    logger.debug(f"File already queued or processing, skipping: {filepath}")
+        finally:
+            self.transfer_table.setUpdatesEnabled(True)
 
-        logger.info(f"Scan complete: {files_found} existing files found")
+    def on_existing_file_scan_finished(self, files_found, entries_scanned, elapsed):
+        """Report the result of the scan of existing files"""
+        if self.sender() is not self.scan_thread:
+            return
 
         if files_found > 0:
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Found {files_found} existing files matching criteria"
+            self.append_log(
+                f"{_clock_hms()} - Found {files_found} existing files matching criteria"
             )
             logger.info(f"Scan complete: {files_found} existing files found")
         else:
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - No existing files found matching criteria"
+            self.append_log(
+                f"{_clock_hms()} - No existing files found matching criteria"
             )
             logger.info("Scan complete: no existing files found")
 
@@ -3537,8 +4692,8 @@ class MainWindow(QMainWindow):
             return
 
         logger.info("Starting remote integrity verification for previously uploaded files")
-        self.log_text.append(
-            f"{datetime.now().strftime('%H:%M:%S')} - Verifying remote file integrity..."
+        self.append_log(
+            f"{_clock_hms()} - Verifying remote file integrity..."
         )
 
         files_to_reupload = []
@@ -3546,7 +4701,9 @@ class MainWindow(QMainWindow):
         files_checked = 0
 
         # Check each file in upload history that might be in the current monitoring scope
-        for filepath, history_entry in list(self.upload_history.items()):  # Use list() to avoid dict change during iteration
+        with self.upload_history_lock:
+            history_entries = list(self.upload_history.items())  # Copy so upload workers can keep recording
+        for filepath, history_entry in history_entries:
             try:
                 # Check if file is within the monitoring directory and matches extensions
                 if not self._is_file_in_monitoring_scope(filepath, directory, extensions, recursive):
@@ -3557,7 +4714,7 @@ class MainWindow(QMainWindow):
                 # Check if local file still exists
                 if not os.path.exists(filepath):
                     logger.info(f"Local file no longer exists, removing from history: {filepath}")
-                    del self.upload_history[filepath]
+                    self.forget_upload(filepath)
                     continue
 
                 remote_path = history_entry.get("remote_path")
@@ -3589,7 +4746,7 @@ class MainWindow(QMainWindow):
         requeued_count = 0
         for filepath, reason in files_to_reupload:
             if self._should_queue_file_for_reupload(filepath):
-                self.file_queue.put(filepath)
+                self.queue_file(filepath)
                 self.add_queued_file_to_table(filepath)
                 requeued_count += 1
                 logger.info(f"Re-queued file with remote issues: {os.path.basename(filepath)} ({reason})")
@@ -3600,8 +4757,8 @@ class MainWindow(QMainWindow):
 
         # Log summary
         if files_checked > 0:
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Integrity check complete: {files_verified} verified, {requeued_count} re-queued"
+            self.append_log(
+                f"{_clock_hms()} - Integrity check complete: {files_verified} verified, {requeued_count} re-queued"
             )
             logger.info(f"Remote integrity check complete: checked={files_checked}, verified={files_verified}, requeued={requeued_count}")
         else:
@@ -3624,11 +4781,7 @@ class MainWindow(QMainWindow):
                     return False
 
             # Check if file extension matches
-            formatted_extensions = [
-                ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions
-            ]
-
-            return any(filepath_abs.lower().endswith(ext) for ext in formatted_extensions)
+            return filepath_abs.lower().endswith(_normalize_extensions(extensions))
 
         except Exception as e:
             logger.error(f"Error checking monitoring scope for {filepath}: {e}")
@@ -3736,7 +4889,7 @@ class MainWindow(QMainWindow):
     def add_file_to_table_with_status(self, filepath: str, relative_path: str, status: str, message: str):
         """Helper method to add a file to the transfer table with specific status"""
         # Avoid duplicates
-        file_key = f"{relative_path}|{filepath}"
+        file_key = self.get_transfer_table_key(os.path.basename(filepath), filepath)
         if file_key in self.transfer_rows:
             logger.debug(f"File already in transfer table: {relative_path} with status {self.transfer_table.item(self.transfer_rows[file_key], 1).text()}")
             return False
@@ -3770,21 +4923,30 @@ class MainWindow(QMainWindow):
 
         return True
 
+    def queue_file(self, item):
+        """Put a file (or a conflict-resolution dict) on the upload queue and refresh the queue display"""
+        self.file_queue.put(item)
+        self.queue_changed.emit()
+
+    def schedule_queue_size_update(self):
+        """Refresh the queue size display shortly, coalescing bursts of queue changes into one update"""
+        if not self.queue_update_pending:
+            self.queue_update_pending = True
+            QTimer.singleShot(200, self.update_queue_size)
+
     def update_queue_size(self):
         """Update queue size display with enhanced debugging"""
+        self.queue_update_pending = False
         size = self.file_queue.qsize()
         queued_count = len(self.queued_files)
         processing_count = len(self.processing_files)
 
         self.queue_label.setText(f"{size} files")
 
-        # Add diagnostic logging every 10 seconds (timer runs every 1 second)
-        if not hasattr(self, "queue_debug_counter"):
-            self.queue_debug_counter = 0
-        self.queue_debug_counter += 1
-
-        if self.queue_debug_counter >= 10:  # Every 10 seconds
-            self.queue_debug_counter = 0
+        # Add diagnostic logging at most every 10 seconds
+        now = time.monotonic()
+        if now - self.queue_status_logged_at >= 10:
+            self.queue_status_logged_at = now
             if size > 0 or queued_count > 0 or processing_count > 0:
                 logger.info(
                     f"Queue status: queue={size}, queued_files={queued_count}, processing_files={processing_count}"
@@ -3853,74 +5015,63 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            directory = self.dir_input.text()
-            extensions = [e.strip() for e in self.extensions_input.text().split(",") if e.strip()]
+            # Poll what the observer watches, even if the settings fields were edited since
+            directory = self.monitored_directory
+            formatted_extensions = self.monitored_extensions
 
-            if not directory or not extensions:
+            if not directory or not formatted_extensions:
                 return
 
-            # Convert extensions to the same format as FileMonitorHandler
-            formatted_extensions = [
-                ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions
-            ]
-
             logger.debug(f"Backup polling scan: {directory}")
             files_found = 0
 
-            if self.subdirs_check.isChecked():
-                # Recursively scan all subdirectories
-                for root, dirs, files in os.walk(directory):
-                    for file in files:
-                        filepath = os.path.join(root, file)
-
-                        # Skip hidden/system files
-                        if file.startswith(".") or file.startswith("~"):
-                            continue
-
-                        if any(filepath.lower().endswith(ext) for ext in formatted_extensions):
-                            # Check if this is a new file we haven't seen
-                            if self._should_queue_file_poll(filepath):
-                                # Check if file is stable (not being written)
-                                if self._is_file_stable(filepath):
-                                    self.file_queue.put(filepath)
-                                    files_found += 1
-                                    logger.info(
-                                        f"Polling backup found file (OS events missed): {filepath}"
-                                    )
-                                    # Add to transfer table with "Queued" status
-                                    self.add_queued_file_to_table(filepath)
-            else:
-                # Scan only the main directory
-                try:
-                    files = os.listdir(directory)
-                    for file in files:
-                        filepath = os.path.join(directory, file)
+            try:
+                for entry in _iter_directory_files(directory, self.monitored_recursive):
+                    name = entry.name
 
-                        # Skip directories, hidden files, system files
-                        if os.path.isdir(filepath) or file.startswith(".") or file.startswith("~"):
-                            continue
+                    # Skip hidden/system files
+                    if name.startswith(_SKIP_FILE_PREFIXES):
+                        continue
 
-                        if any(filepath.lower().endswith(ext) for ext in formatted_extensions):
-                            if self._should_queue_file_poll(filepath):
-                                if self._is_file_stable(filepath):
-                                    self.file_queue.put(filepath)
-                                    files_found += 1
-                                    logger.info(
-                                        f"Polling backup found file (OS events missed): {filepath}"
-                                    )
-                                    # Add to transfer table with "Queued" status
-                                    self.add_queued_file_to_table(filepath)
-                except Exception as e:
-                    logger.error(f"Error scanning directory {directory}: {e}")
+                    if name.lower().endswith(formatted_extensions):
+                        filepath = entry.path
+                        # Check if this is a new file we haven't seen
+                        if self._should_queue_file_poll(filepath):
+                            # Check if file is stable (not being written)
+                            if self._is_file_stable(filepath):
+                                self.queue_file(filepath)
+                                files_found += 1
+                                logger.info(f"Polling backup found file (OS events missed): {filepath}")
+                                # Add to transfer table with "Queued" status
+                                self.add_queued_file_to_table(filepath)
+            except OSError as e:
+                logger.error(f"Error scanning directory {directory}: {e}")
 
             if files_found > 0:
                 logger.info(f"Backup polling found {files_found} files that OS events missed")
             else:
                 logger.debug("Backup polling scan complete - no new files found")
 
+            # Back off while the directory is quiet, snap back once files show up
+            scheduler = getattr(self, "poll_scheduler", None)
+            if scheduler is not None:
+                delay_ms = scheduler.reset() if files_found > 0 else scheduler.next_delay()
+                if int(delay_ms) != self.poll_timer.interval():
+                    self.poll_timer.setInterval(int(delay_ms))
+                    logger.debug(f"Next backup poll in {delay_ms / 60000:.1f} minutes")
+
         except Exception as e:
             logger.error(f"Error in backup polling: {e}")
 
+    def reset_poll_backoff(self):
+        """Return backup polling to the user's interval after any queue activity"""
+        scheduler = getattr(self, "poll_scheduler", None)
+        if scheduler is None or scheduler.current_delay == scheduler.poll_backoff_min:
+            return
+        delay_ms = scheduler.reset()
+        self.poll_timer.setInterval(int(delay_ms))
+        logger.debug(f"Queue activity, next backup poll in {delay_ms / 60000:.1f} minutes")
+
     def _should_queue_file_poll(self, filepath: str) -> bool:
         """
         Check if a file should be queued during polling, preventing duplicates and avoiding re-upload of unchanged files.
@@ -3931,11 +5082,12 @@ class MainWindow(QMainWindow):
         Returns:
             True if file should be queued, False if already queued/processing or unchanged
         """
-        # Check if file is already queued or being processed
-        if filepath in self.queued_files:
+        # Claim the file up front; the watchdog thread may be checking the same path
+        busy = _claim_queue_slot(self.queued_files, self.processing_files, filepath)
+        if busy == "queued":
             logger.debug(f"Polling: File already queued, skipping: {filepath}")
             return False
-        if filepath in self.processing_files:
+        if busy == "processing":
             logger.debug(f"Polling: File currently processing, skipping: {filepath}")
             return False
 
@@ -3949,6 +5101,7 @@ class MainWindow(QMainWindow):
 
                 if current_checksum == stored_checksum:
                     logger.info(f"Polling: File unchanged since last upload, skipping: {filepath}")
+                    self.queued_files.discard(filepath)
                     return False
                 else:
                     logger.info(f"Polling: File modified since last upload, will re-upload: {filepath}")
@@ -3956,8 +5109,6 @@ class MainWindow(QMainWindow):
                 logger.warning(f"Polling: Error checking file checksum for {filepath}: {e}")
                 # Continue with upload if we can't verify the checksum
 
-        # Add to queued files tracking
-        self.queued_files.add(filepath)
         return True
 
     def _is_file_stable(self, filepath: str, stability_time: float = 2.0) -> bool:
@@ -4002,27 +5153,20 @@ class MainWindow(QMainWindow):
             self.transfer_table.insertRow(row_count)
 
             # Calculate relative path for display (use full relative path including filename)
-            display_path = filepath
-            if self.dir_input.text() and filepath.startswith(self.dir_input.text()):
-                relative_path = os.path.relpath(filepath, self.dir_input.text())
-                if not relative_path.startswith(".."):
-                    display_path = relative_path
+            display_path = self._display_path(filepath)
 
             # Use display_path in File column (combines path and filename)
             self.transfer_table.setItem(row_count, 0, QTableWidgetItem(display_path))
             # Column 1 is now Status (was Path)
             self.transfer_table.setItem(row_count, 1, QTableWidgetItem(status))
 
-            progress_bar = QProgressBar()
-            progress_bar.setMinimum(0)
-            progress_bar.setMaximum(100)  # Always use percentage for consistency
-            progress_bar.setValue(0)
-            # Show progress bar only for active processing states
+            # Progress is always a percentage; show the bar only for active processing states
+            progress_item = QTableWidgetItem()
             if status in ["Queued", "Starting", "Pending"]:
-                progress_bar.setVisible(False)
+                progress_item.setData(PROGRESS_ROLE, None)
             else:
-                progress_bar.setVisible(True)
-            self.transfer_table.setCellWidget(row_count, 2, progress_bar)
+                progress_item.setData(PROGRESS_ROLE, 0)
+            self.transfer_table.setItem(row_count, 2, progress_item)
 
             self.transfer_table.setItem(row_count, 3, QTableWidgetItem(""))
 
@@ -4043,11 +5187,10 @@ class MainWindow(QMainWindow):
 
                 # Show progress bar when transitioning from queued to active processing
                 if current_status == "Queued" and status not in ["Queued", "Starting", "Pending"]:
-                    progress_bar = self.transfer_table.cellWidget(
-                        row, 2
-                    )  # Progress is now column 2
-                    if progress_bar and hasattr(progress_bar, "setVisible"):
-                        progress_bar.setVisible(True)
+                    progress_item = self.transfer_table.item(row, 2)  # Progress is now column 2
+                    if progress_item:
+                        if progress_item.data(PROGRESS_ROLE) is None:
+                            progress_item.setData(PROGRESS_ROLE, 0)
                         # Scroll to show the file that just started processing
                         self.transfer_table.scrollToItem(self.transfer_table.item(row, 0))
 
@@ -4059,14 +5202,14 @@ class MainWindow(QMainWindow):
         if unique_key in self.transfer_rows:
             row = self.transfer_rows[unique_key]
             if row < self.transfer_table.rowCount():
-                progress_bar = self.transfer_table.cellWidget(row, 2)  # Progress is now column 2
-                if progress_bar and hasattr(progress_bar, "setValue"):
+                progress_item = self.transfer_table.item(row, 2)  # Progress is now column 2
+                if progress_item:
                     # Always use percentage (0 - 100) for consistent progress bar display
                     if total > 0:
                         percentage = int((current / total) * 100)
-                        progress_bar.setValue(min(percentage, 100))  # Ensure it doesn't exceed 100
+                        progress_item.setData(PROGRESS_ROLE, min(percentage, 100))  # Ensure it doesn't exceed 100
                     else:
-                        progress_bar.setValue(0)
+                        progress_item.setData(PROGRESS_ROLE, 0)
 
     @pyqtSlot(str, str, bool, str)
     def on_transfer_complete(self, filename: str, filepath: str, success: bool, message: str):
@@ -4102,19 +5245,19 @@ class MainWindow(QMainWindow):
                     del self.file_remote_paths[filepath]
 
                 # Update progress bar - ensure it shows 100% when complete
-                progress_bar = self.transfer_table.cellWidget(row, 2)  # Progress is now column 2
-                if progress_bar and hasattr(progress_bar, "setValue"):
+                progress_item = self.transfer_table.item(row, 2)  # Progress is now column 2
+                if progress_item and progress_item.data(PROGRESS_ROLE) is not None:
                     if success:
-                        progress_bar.setValue(100)  # Always show 100% for successful completion
+                        progress_item.setData(PROGRESS_ROLE, 100)  # Always show 100% for successful completion
                     else:
-                        progress_bar.setStyleSheet("QProgressBar::chunk { background-color: red; }")
+                        progress_item.setData(PROGRESS_FAILED_ROLE, True)
 
         # Log the event
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = _clock_hms()
         if success:
-            self.log_text.append(f"{timestamp} - [OK] {filename}: {message}")
+            self.append_log(f"{timestamp} - [OK] {filename}: {message}")
         else:
-            self.log_text.append(f"{timestamp} - [FAIL] {filename}: {message}")
+            self.append_log(f"{timestamp} - [FAIL] {filename}: {message}")
 
     @pyqtSlot(str, str, str, dict)
     def on_conflict_resolution_needed(
@@ -4136,7 +5279,7 @@ class MainWindow(QMainWindow):
             # Check for duplicates before re-queueing
             if filepath not in self.queued_files and filepath not in self.processing_files:
                 # Re-queue the file for processing with the resolution
-                self.file_queue.put(
+                self.queue_file(
                     {
                         "filepath": filepath,
                         "filename": filename,
@@ -4154,30 +5297,30 @@ class MainWindow(QMainWindow):
                 )
 
                 # Log the resolution
-                timestamp = datetime.now().strftime("%H:%M:%S")
+                timestamp = _clock_hms()
                 action_text = {
                     "overwrite": "overwrite remote file",
                     "rename": "rename and upload",
                     "skip": "skip upload",
                 }.get(resolution, resolution)
 
-                self.log_text.append(
+                self.append_log(
                     f"{timestamp} - Conflict resolved for {filename}: {action_text}"
                 )
                 if apply_to_all:
-                    self.log_text.append(
+                    self.append_log(
                         f"{timestamp} - Resolution will be applied to all future conflicts"
                     )
             else:
                 # File already being processed
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                self.log_text.append(
+                timestamp = _clock_hms()
+                self.append_log(
                     f"{timestamp} - Conflict resolution skipped for {filename}: already being processed"
                 )
         else:
             # User cancelled - skip this file
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.log_text.append(
+            timestamp = _clock_hms()
+            self.append_log(
                 f"{timestamp} - Conflict resolution cancelled for {filename}: skipped"
             )
 
@@ -4193,18 +5336,25 @@ class MainWindow(QMainWindow):
         # Sort in reverse order to remove from bottom up
         rows_to_remove.sort(reverse=True)
 
-        for row, unique_key in rows_to_remove:
-            self.transfer_table.removeRow(row)
-            del self.transfer_rows[unique_key]
+        # Repaint once after all removals rather than once per removed row
+        self.transfer_table.setUpdatesEnabled(False)
+        try:
+            for row, unique_key in rows_to_remove:
+                self.transfer_table.removeRow(row)
+                del self.transfer_rows[unique_key]
 
-            # Remove from failed files tracking if present
-            if unique_key in self.failed_files:
-                del self.failed_files[unique_key]
+                # Remove from failed files tracking if present
+                if unique_key in self.failed_files:
+                    del self.failed_files[unique_key]
+        finally:
+            self.transfer_table.setUpdatesEnabled(True)
 
-            # Update remaining row numbers
+        # Update remaining row numbers in one pass: each row moves up by the number of
+        # removed rows above it (renumbering after every removal was quadratic)
+        removed_rows = sorted(row for row, _ in rows_to_remove)
+        if removed_rows:
             for key, r in self.transfer_rows.items():
-                if r > row:
-                    self.transfer_rows[key] = r - 1
+                self.transfer_rows[key] = r - bisect.bisect_left(removed_rows, r)
 
     def reupload_failed_files(self):
         """Re-upload all files that failed verification"""
@@ -4244,15 +5394,13 @@ class MainWindow(QMainWindow):
                                 message_item.setText("Re-upload requested")
 
                             # Reset progress bar
-                            progress_bar = self.transfer_table.cellWidget(
-                                row, 2
-                            )  # Progress is now column 2
-                            if progress_bar:
-                                progress_bar.setValue(0)
-                                progress_bar.setStyleSheet("")  # Clear any error styling
+                            progress_item = self.transfer_table.item(row, 2)  # Progress is now column 2
+                            if progress_item and progress_item.data(PROGRESS_ROLE) is not None:
+                                progress_item.setData(PROGRESS_ROLE, 0)
+                                progress_item.setData(PROGRESS_FAILED_ROLE, False)  # Clear any error styling
 
                         # Add to queue for re-processing and tracking
-                        self.file_queue.put(filepath)
+                        self.queue_file(filepath)
                         self.queued_files.add(filepath)  # Add to tracking
                         requeued += 1
 
@@ -4265,8 +5413,8 @@ class MainWindow(QMainWindow):
                     # File no longer exists, remove from tracking
                     del self.failed_files[unique_key]
 
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.log_text.append(f"{timestamp} - Re-queued {requeued} failed file(s) for upload")
+            timestamp = _clock_hms()
+            self.append_log(f"{timestamp} - Re-queued {requeued} failed file(s) for upload")
 
     def show_transfer_context_menu(self, position):
         """Show context menu for transfer table"""
@@ -4341,20 +5489,20 @@ class MainWindow(QMainWindow):
                 message_item.setText("Re-upload requested")
 
             # Reset progress bar
-            progress_bar = self.transfer_table.cellWidget(row, 2)  # Progress is now column 2
-            if progress_bar:
-                progress_bar.setValue(0)
-                progress_bar.setStyleSheet("")  # Clear any error styling
+            progress_item = self.transfer_table.item(row, 2)  # Progress is now column 2
+            if progress_item and progress_item.data(PROGRESS_ROLE) is not None:
+                progress_item.setData(PROGRESS_ROLE, 0)
+                progress_item.setData(PROGRESS_FAILED_ROLE, False)  # Clear any error styling
 
         # Add to queue for re-processing and tracking
-        self.file_queue.put(filepath)
+        self.queue_file(filepath)
         self.queued_files.add(filepath)  # Add to tracking
 
         # Remove from failed files (will be re-added if it fails again)
         del self.failed_files[unique_key]
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"{timestamp} - Re-queued {filename} for upload")
+        timestamp = _clock_hms()
+        self.append_log(f"{timestamp} - Re-queued {filename} for upload")
 
     def get_conflict_resolution_setting(self) -> str:
         """Get the current conflict resolution setting"""
@@ -4421,6 +5569,13 @@ class MainWindow(QMainWindow):
         config_dir.mkdir(exist_ok=True)
         config_file = config_dir / "config.json"
 
+        # Upload, hashing and verification threads keep writing to the caches. Copying
+        # their items with list() is a single step under the GIL, so the JSON-ready dicts
+        # below are built from snapshots rather than by iterating the live dicts
+        def snapshot(name):
+            cache = getattr(self, name, None)
+            return list(cache.items()) if isinstance(cache, dict) else []
+
         config = {
             "local_directory": self.dir_input.text(),
             "monitor_subdirs": self.subdirs_check.isChecked(),
@@ -4435,14 +5590,28 @@ class MainWindow(QMainWindow):
             "verify_uploads": self.verify_uploads_check.isChecked(),
             "save_credentials": self.save_creds_check.isChecked(),
             "conflict_resolution": self.get_conflict_resolution_setting(),
-            "local_checksum_cache": (
-                dict(self.local_checksum_cache) if hasattr(self, "local_checksum_cache") else {}
-            ),
+            "local_checksum_cache": dict(snapshot("local_checksum_cache")),
+            # Digests and verified remote states are keyed by file stat, so they stay valid across runs
+            "local_digest_cache": {key: dict(digests) for key, digests in snapshot("local_digest_cache")},
+            "remote_verification_cache": {
+                path: list(state) for path, state in snapshot("remote_verification_cache")
+            },
         }
 
+        # Skip the rewrite entirely when nothing changed since the last save
+        # (the periodic cache timer calls this every few minutes)
+        if config == getattr(self, "_last_saved_config", None):
+            logger.debug("Config unchanged since last save, skipping write")
+            return
+
         try:
-            with open(config_file, "w") as f:
+            # Write to a temporary file and swap it in so a crash mid-write
+            # can never leave a truncated config.json behind
+            temp_file = config_file.with_name(config_file.name + ".tmp")
+            with open(temp_file, "w") as f:
                 json.dump(config, f, indent=2)
+            os.replace(temp_file, config_file)
+            self._last_saved_config = config
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
 
@@ -4465,21 +5634,41 @@ class MainWindow(QMainWindow):
         """Save persistent upload history to disk"""
         history_file = os.path.join(os.path.expanduser("~"), ".panoramabridge_history.pkl")
         try:
-            with open(history_file, "wb") as f:
-                pickle.dump(self.upload_history, f)
-            logger.debug(f"Saved upload history: {len(self.upload_history)} files tracked")
+            with self.upload_history_lock:
+                # Write to a temporary file and swap it in so a crash mid-write
+                # can never leave a truncated history behind
+                temp_file = history_file + ".tmp"
+                with open(temp_file, "wb") as f:
+                    pickle.dump(self.upload_history, f)
+                os.replace(temp_file, history_file)
+                logger.debug(f"Saved upload history: {len(self.upload_history)} files tracked")
         except Exception as e:
             logger.error(f"Failed to save upload history: {e}")
 
+    def forget_upload(self, filepath: str):
+        """Remove a file from the upload history so it is uploaded again"""
+        with self.upload_history_lock:
+            self.upload_history.pop(filepath, None)
+
     def record_successful_upload(self, filepath: str, remote_path: str, checksum: str):
         """Record a successful upload in persistent history"""
-        self.upload_history[filepath] = {
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            stat = None
+        entry = {
             "checksum": checksum,
             "remote_path": remote_path,
             "timestamp": datetime.now().isoformat(),
-            "file_size": os.path.getsize(filepath) if os.path.exists(filepath) else 0,
+            "file_size": stat.st_size if stat else 0,
         }
-        self.save_upload_history()
+        # Remember the mtime only if the checksum is known to describe the file as it is now,
+        # so calculate_checksum() can reuse it after a restart without re-reading the file
+        if stat and self.local_checksum_cache.get(_checksum_cache_key(filepath, stat)) == checksum:
+            entry["file_mtime_ns"] = stat.st_mtime_ns
+        with self.upload_history_lock:
+            self.upload_history[filepath] = entry
+            self.save_upload_history()
         logger.info(f"Recorded successful upload: {os.path.basename(filepath)} -> {remote_path}")
 
     def verify_remote_file_integrity(self, local_filepath: str, remote_path: str, expected_checksum: str) -> tuple[bool, str]:
@@ -4487,24 +5676,56 @@ class MainWindow(QMainWindow):
         First checks that file sizes match.
         If a remote checksum file exists (.checksum). If found, downloads and compares checksums.
         If the remote checksum file is not found or cannot be read, falls back to accessibility check.
-        (ie can read first 8KB of remote file).
+        (ie can read first 8KB of remote file, which is also compared with the local file's first 8KB).
+        If the local (size, mtime), the remote ETag and the expected checksum all match the
+        last successful verification, the cached verdict is returned without further requests.
         Returns: (is_intact, reason)
         """
         logger.debug(f"Verifying remote file integrity for {remote_path}")
         try:
+            # One stat gives both size and mtime; a missing local file can't be verified
+            try:
+                local_stat = os.stat(local_filepath)
+            except FileNotFoundError:
+                return False, "local file missing"
+            local_size = local_stat.st_size
+            local_mtime = local_stat.st_mtime
+
             # Get remote file info
             remote_info = self.webdav_client.get_file_info(remote_path)
             if not remote_info or not remote_info.get("exists", False):
+                self.remote_verification_cache.pop(local_filepath, None)
                 return False, "remote file not found"
 
             # Level 1: Size comparison (fastest - immediate)
-            local_size = os.path.getsize(local_filepath) if os.path.exists(local_filepath) else 0
             remote_size = remote_info.get("size", 0)
 
             if local_size != remote_size:
                 logger.debug(f"Size mismatch for {remote_path}: local {local_size}, remote {remote_size}")
                 return False, f"size mismatch (local: {local_size}, remote: {remote_size})"
 
+            # Early exit: nothing changed on either side since the last successful verification
+            remote_etag = remote_info.get("etag")
+            verified_state = (local_size, local_mtime, remote_etag, expected_checksum)
+            cached = self.remote_verification_cache.get(local_filepath)
+            if remote_etag:
+                if cached and cached[:4] == verified_state:
+                    logger.debug(f"Using cached verification for {remote_path}: {cached[4]}")
+                    return True, cached[4]
+
+            # Level 2a: A SHA256 ETag is compared with the known checksum at no cost,
+            # sparing the checksum file lookup and download below. Local digests are
+            # always lowercase hexdigest() output, so only the server's side is folded.
+            if (
+                remote_etag
+                and expected_checksum
+                and len(remote_etag) == 64
+                and remote_etag.lower() == expected_checksum
+            ):
+                logger.debug(f"SHA256 ETag matches for {remote_path}")
+                self.remote_verification_cache[local_filepath] = (*verified_state, "Size + ETag verified")
+                return True, "Size + ETag verified"
+
             # Level 2: Checksum verification (if checksum file exists)
             checksum_path = remote_path + ".checksum"
             checksum_info = self.webdav_client.get_file_info(checksum_path)
@@ -4520,6 +5741,8 @@ class MainWindow(QMainWindow):
                         # Compare checksums
                         if expected_checksum == remote_checksum:
                             logger.debug("Checksums match")
+                            if remote_etag:
+                                self.remote_verification_cache[local_filepath] = (*verified_state, "Size + checksum verified")
                             return True, "Size + checksum verified"
                         else:
                             logger.debug(f"Checksum mismatch: local {expected_checksum}, remote {remote_checksum}")
@@ -4529,18 +5752,56 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     logger.warning(f"Error during checksum verification for {remote_path}: {e}, falling back to accessibility check")
 
-            # Level 3: Accessibility check (download first 8KB)
+            # Level 2b: Servers that expose another content digest as ETag let us verify
+            # without a sidecar (SHA256 was Level 2a). Only a digest cached from the upload
+            # is used; re-reading the whole file here would cost more than Level 3
+            etag_algorithm = _ETAG_DIGEST_ALGORITHMS.get(len(remote_etag)) if remote_etag else None
+            if etag_algorithm and etag_algorithm != "sha256" and _HEX_DIGITS.issuperset(remote_etag):
+                local_digest = self.file_processor.get_cached_digest(
+                    local_filepath, etag_algorithm, local_stat
+                )
+                if local_digest and local_digest == remote_etag.lower():
+                    logger.debug(f"{etag_algorithm.upper()} ETag matches for {remote_path}")
+                    self.remote_verification_cache[local_filepath] = (*verified_state, "Size + ETag verified")
+                    return True, "Size + ETag verified"
+                # Not conclusive: many servers use opaque hex ETags of the same length
+
+            # Level 3: Accessibility check (conditional GET, else download first 8KB)
             try:
                 logger.debug(f"Performing accessibility check for {remote_path}")
                 if self.webdav_client is not None:
+                    # The remote copy was verified against this checksum before, under the ETag
+                    # stored with that verdict. A 304 for the stored ETag proves the server still
+                    # has those bytes and can read them, with no body transfer. Any other ETag
+                    # means a different version, which needs the content check below
+                    last_etag = cached[2] if cached and cached[3] == expected_checksum else None
+                    if (
+                        last_etag
+                        and last_etag == remote_etag
+                        and self.webdav_client.verify_unchanged(remote_path, last_etag)
+                    ):
+                        logger.debug(f"Accessibility check passed for {remote_path} (ETag unchanged since last verification)")
+                        self.remote_verification_cache[local_filepath] = (*verified_state, cached[4])
+                        return True, cached[4]
+
                     # Download just the first 8KB to check if file is accessible
                     head_data = self.webdav_client.download_file_head(remote_path, 8192)
                     if head_data is None:
                         logger.debug(f"Failed to read remote file {remote_path} during accessibility check")
                         return False, "cannot read remote file"
 
+                    # The bytes are already here, so compare them with the start of the local file
+                    with open(local_filepath, "rb") as f:
+                        local_head = f.read(len(head_data))
+                    if head_data and local_head != head_data:
+                        logger.debug(f"First {len(head_data)} bytes differ for {remote_path}")
+                        return False, f"content mismatch in first {len(head_data)} bytes"
+
                     logger.debug(f"Accessibility check passed for {remote_path}")
-                    return True, "Size + accessibility"
+                    reason = "Size + prefix verified" if head_data else "Size + accessibility"
+                    if remote_etag:
+                        self.remote_verification_cache[local_filepath] = (*verified_state, reason)
+                    return True, reason
             except Exception as e:
                 logger.debug(f"Accessibility check failed for {remote_path}: {e}")
                 return False, f"accessibility check failed: {str(e)}"
@@ -4559,13 +5820,9 @@ class MainWindow(QMainWindow):
 
         history_entry = self.upload_history[filepath]
 
-        # Check if local file still exists
-        if not os.path.exists(filepath):
-            return False, "local file no longer exists"
-
         try:
-            # Quick size check first (very fast)
-            current_size = os.path.getsize(filepath)
+            # Quick size check first (very fast); the stat also shows the file still exists
+            current_size = os.stat(filepath).st_size
             stored_size = history_entry.get("file_size", 0)
             if stored_size > 0 and current_size != stored_size:
                 return False, "file size changed"
@@ -4575,20 +5832,16 @@ class MainWindow(QMainWindow):
             if not stored_checksum:
                 return False, "no stored checksum"
 
-            # Check if we have a cached checksum to avoid recalculation
-            cache_key = f"{filepath}_{current_size}_{os.path.getmtime(filepath)}"
-            if cache_key in self.local_checksum_cache:
-                current_checksum = self.local_checksum_cache[cache_key]
-            else:
-                # Calculate and cache the checksum
-                current_checksum = self.file_processor.calculate_checksum(filepath)
-                self.local_checksum_cache[cache_key] = current_checksum
+            # calculate_checksum() serves unchanged files from local_checksum_cache
+            current_checksum = self.file_processor.calculate_checksum(filepath)
 
             if current_checksum != stored_checksum:
                 return False, "file content changed"
 
             return True, f"already uploaded on {history_entry.get('timestamp', 'unknown date')}"
 
+        except FileNotFoundError:
+            return False, "local file no longer exists"
         except Exception as e:
             logger.warning(f"Error in quick upload check for {filepath}: {e}")
             return False, "error checking history"
@@ -4602,13 +5855,9 @@ class MainWindow(QMainWindow):
 
         history_entry = self.upload_history[filepath]
 
-        # Check if local file still exists and hasn't changed
-        if not os.path.exists(filepath):
-            return False, "local file no longer exists"
-
         try:
-            # Quick size check first
-            current_size = os.path.getsize(filepath)
+            # Check the local file still exists and hasn't changed, size first
+            current_size = os.stat(filepath).st_size
             if current_size != history_entry.get("file_size", 0):
                 return False, "file size changed"
 
@@ -4624,11 +5873,14 @@ class MainWindow(QMainWindow):
                 if not remote_ok:
                     # Remove from history since remote file is compromised
                     logger.warning(f"Remote file integrity failed for {filepath}: {remote_reason}")
-                    del self.upload_history[filepath]
-                    self.save_upload_history()
+                    with self.upload_history_lock:
+                        self.forget_upload(filepath)
+                        self.save_upload_history()
                     return False, f"remote file issue: {remote_reason}"
 
             return True, f"already uploaded on {history_entry.get('timestamp', 'unknown date')}"
+        except FileNotFoundError:
+            return False, "local file no longer exists"
         except Exception as e:
             logger.warning(f"Error checking upload history for {filepath}: {e}")
             return False, "error checking history"
@@ -4672,6 +5924,17 @@ class MainWindow(QMainWindow):
         if cached_checksums:
             logger.info(f"Loaded {len(cached_checksums)} cached checksums from previous session")
 
+        if not hasattr(self, "local_digest_cache"):
+            self.local_digest_cache = {}
+        self.local_digest_cache.update(self.config.get("local_digest_cache", {}))
+
+        # JSON stores the (size, mtime, etag, checksum, reason) states as lists
+        if not hasattr(self, "remote_verification_cache"):
+            self.remote_verification_cache = {}
+        for path, state in self.config.get("remote_verification_cache", {}).items():
+            if isinstance(state, list) and len(state) == 5:
+                self.remote_verification_cache[path] = tuple(state)
+
         # Try to load saved credentials if enabled
         if self.save_creds_check.isChecked() and self.url_input.text():
             if KEYRING_AVAILABLE and keyring is not None:
@@ -4702,10 +5965,10 @@ class MainWindow(QMainWindow):
     def queue_file_for_upload(self, filepath, reason):
         """Add a file to the upload queue with a reason"""
         try:
-            self.file_queue.put(filepath)
+            self.queue_file(filepath)
             logger.info(f"Queued file for upload: {os.path.basename(filepath)} - {reason}")
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - File queued for upload: "
+            self.append_log(
+                f"{_clock_hms()} - File queued for upload: "
                 f"{os.path.basename(filepath)} ({reason})"
             )
         except Exception as e:
@@ -4716,12 +5979,7 @@ class MainWindow(QMainWindow):
         # Note: We can't directly check the queue contents without consuming items,
         # so we check if the file is currently in the transfer table (which indicates
         # it's being processed or was recently processed)
-        for file_key in self.transfer_rows:
-            if '|' in file_key:
-                _, absolute_path = file_key.split('|', 1)
-                if absolute_path == filepath:
-                    return True
-        return False
+        return self.get_transfer_table_key(os.path.basename(filepath), filepath) in self.transfer_rows
 
     def get_remote_path_for_file(self, filepath):
         """Determine the remote path where a local file should be uploaded"""
@@ -4744,7 +6002,7 @@ class MainWindow(QMainWindow):
                 return None
 
             # Combine remote base with relative path, using forward slashes for WebDAV
-            remote_path = remote_base.rstrip('/') + '/' + relative_path.replace('\\', '/')
+            remote_path = _remote_join(remote_base, relative_path)
             return remote_path
 
         except Exception as e:
@@ -4762,14 +6020,8 @@ class MainWindow(QMainWindow):
             return
 
         # Get all files currently in the Transfer Status table
-        # Extract absolute paths from the transfer_rows dictionary keys
-        files_in_table = []
-        for file_key in self.transfer_rows:
-            # file_key format is "relative_path|absolute_path"
-            if '|' in file_key:
-                _, absolute_path = file_key.split('|', 1)
-                if absolute_path and os.path.exists(absolute_path):
-                    files_in_table.append(absolute_path)
+        # (transfer_rows is keyed by absolute path)
+        files_in_table = [filepath for filepath in self.transfer_rows if os.path.exists(filepath)]
 
         if not files_in_table:
             QMessageBox.information(
@@ -4804,8 +6056,8 @@ class MainWindow(QMainWindow):
 
         # Temporarily stop monitoring if it's active
         if self.monitoring_was_active:
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Temporarily pausing monitoring for integrity check"
+            self.append_log(
+                f"{_clock_hms()} - Temporarily pausing monitoring for integrity check"
             )
             if self.observer:
                 self.observer.stop()
@@ -4826,15 +6078,15 @@ class MainWindow(QMainWindow):
         self.integrity_check_thread.file_issue_signal.connect(self.on_integrity_check_file_issue)
         self.integrity_check_thread.start()
 
-        self.log_text.append(
-            f"{datetime.now().strftime('%H:%M:%S')} - Starting remote integrity check for {len(files_in_table)} files"
+        self.append_log(
+            f"{_clock_hms()} - Starting remote integrity check for {len(files_in_table)} files"
         )
 
     def on_integrity_check_progress(self, current_file, checked_count, total_count, status):
         """Handle progress updates from integrity check thread"""
         self.verify_btn.setText(f"Checking... ({checked_count}/{total_count})")
-        self.log_text.append(
-            f"{datetime.now().strftime('%H:%M:%S')} - [{checked_count}/{total_count}] {os.path.basename(current_file)}: {status}"
+        self.append_log(
+            f"{_clock_hms()} - [{checked_count}/{total_count}] {os.path.basename(current_file)}: {status}"
         )
 
         # Update the table status message for verified files
@@ -4845,22 +6097,21 @@ class MainWindow(QMainWindow):
         """Handle file issues found during integrity check"""
         if issue_type == "missing":
             # File is missing from remote - queue for re-upload
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Missing from remote: {os.path.basename(filepath)} - queuing for upload"
+            self.append_log(
+                f"{_clock_hms()} - Missing from remote: {os.path.basename(filepath)} - queuing for upload"
             )
-            self.file_queue.put(filepath)
+            self.queue_file(filepath)
             # Update the table message to show it's queued for re-upload
             self.update_file_message_in_table(filepath, "Queued - missing from remote server")
 
         elif issue_type == "corrupted":
             # File exists but is corrupted - queue for re-upload
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Corrupted on remote: {os.path.basename(filepath)} ({details}) - queuing for re-upload"
+            self.append_log(
+                f"{_clock_hms()} - Corrupted on remote: {os.path.basename(filepath)} ({details}) - queuing for re-upload"
             )
             # Remove from upload history so it gets uploaded fresh
-            if filepath in self.upload_history:
-                del self.upload_history[filepath]
-            self.file_queue.put(filepath)
+            self.forget_upload(filepath)
+            self.queue_file(filepath)
             self.update_file_message_in_table(filepath, f"Queued - remote file corrupted ({details})")
 
         elif issue_type == "changed":
@@ -4872,26 +6123,24 @@ class MainWindow(QMainWindow):
                 self.show_file_conflict_resolution(filepath, details)
             elif conflict_setting == "overwrite":
                 # Remove from history and re-upload (overwrite)
-                self.log_text.append(
-                    f"{datetime.now().strftime('%H:%M:%S')} - File changed locally: {os.path.basename(filepath)} - queuing for overwrite upload"
+                self.append_log(
+                    f"{_clock_hms()} - File changed locally: {os.path.basename(filepath)} - queuing for overwrite upload"
                 )
-                if filepath in self.upload_history:
-                    del self.upload_history[filepath]
-                self.file_queue.put(filepath)
+                self.forget_upload(filepath)
+                self.queue_file(filepath)
                 self.update_file_message_in_table(filepath, "Queued - file changed, will overwrite remote")
             elif conflict_setting == "rename":
                 # Queue for rename upload
-                self.log_text.append(
-                    f"{datetime.now().strftime('%H:%M:%S')} - File changed locally: {os.path.basename(filepath)} - queuing for rename upload"
+                self.append_log(
+                    f"{_clock_hms()} - File changed locally: {os.path.basename(filepath)} - queuing for rename upload"
                 )
-                if filepath in self.upload_history:
-                    del self.upload_history[filepath]
-                self.file_queue.put(filepath)
+                self.forget_upload(filepath)
+                self.queue_file(filepath)
                 self.update_file_message_in_table(filepath, "Queued - file changed, will rename remote")
             elif conflict_setting == "skip":
                 # Skip - just log it
-                self.log_text.append(
-                    f"{datetime.now().strftime('%H:%M:%S')} - File changed locally: {os.path.basename(filepath)} - skipped per conflict resolution setting"
+                self.append_log(
+                    f"{_clock_hms()} - File changed locally: {os.path.basename(filepath)} - skipped per conflict resolution setting"
                 )
                 self.update_file_message_in_table(filepath, "Skipped - file changed locally")
 
@@ -4910,8 +6159,8 @@ class MainWindow(QMainWindow):
         self.start_btn.setEnabled(True)
 
         # Log results
-        self.log_text.append(
-            f"{datetime.now().strftime('%H:%M:%S')} - Integrity check complete: "
+        self.append_log(
+            f"{_clock_hms()} - Integrity check complete: "
             f"{verified_count} verified, {missing_count} missing, {corrupted_count} corrupted, "
             f"{changed_count} changed locally, {error_count} errors"
         )
@@ -5026,8 +6275,8 @@ class MainWindow(QMainWindow):
         """Restart monitoring if it was active before integrity check"""
         # Restart monitoring if it was active before
         if self.monitoring_was_active:
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - Resuming file monitoring"
+            self.append_log(
+                f"{_clock_hms()} - Resuming file monitoring"
             )
             # Restart monitoring with current settings
             directory = self.dir_input.text()
@@ -5045,9 +6294,11 @@ class MainWindow(QMainWindow):
                 self.observer = Observer()
                 self.observer.schedule(self.monitor_handler, directory, recursive=recursive)
                 self.observer.start()
+                self.set_monitored_settings(directory, extensions, recursive)
 
                 if self.enable_polling_check.isChecked():
                     polling_interval_ms = self.polling_interval_spin.value() * 60 * 1000
+                    self.poll_scheduler = PollScheduler(polling_interval_ms)
                     self.poll_timer.start(polling_interval_ms)
 
                 self.start_btn.setText("Stop Monitoring")
@@ -5056,8 +6307,8 @@ class MainWindow(QMainWindow):
 
             except Exception as e:
                 logger.error(f"Failed to restart monitoring after integrity check: {e}")
-                self.log_text.append(
-                    f"{datetime.now().strftime('%H:%M:%S')} - Error restarting monitoring: {e}"
+                self.append_log(
+                    f"{_clock_hms()} - Error restarting monitoring: {e}"
                 )
 
         # Save any history updates
@@ -5082,29 +6333,29 @@ class MainWindow(QMainWindow):
         clicked_button = dialog.clickedButton()
 
         if clicked_button == overwrite_btn:
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - User chose to upload new version of {filename}"
+            self.append_log(
+                f"{_clock_hms()} - User chose to upload new version of {filename}"
             )
             # Remove from history and re-queue
-            if filepath in self.upload_history:
-                del self.upload_history[filepath]
-            self.file_queue.put(filepath)
+            self.forget_upload(filepath)
+            self.queue_file(filepath)
             self.update_file_status_in_table(filepath, "Queued")
 
         elif clicked_button == keep_remote_btn:
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - User chose to keep remote version of {filename}"
+            self.append_log(
+                f"{_clock_hms()} - User chose to keep remote version of {filename}"
             )
             # Update local history with current local file checksum to match
             if os.path.exists(filepath):
                 current_checksum = self.file_processor.calculate_checksum(filepath)
-                if filepath in self.upload_history:
-                    self.upload_history[filepath]["checksum"] = current_checksum
-                    self.upload_history[filepath]["timestamp"] = datetime.now().isoformat()
+                with self.upload_history_lock:
+                    if filepath in self.upload_history:
+                        self.upload_history[filepath]["checksum"] = current_checksum
+                        self.upload_history[filepath]["timestamp"] = datetime.now().isoformat()
 
         else:  # skip
-            self.log_text.append(
-                f"{datetime.now().strftime('%H:%M:%S')} - User chose to skip {filename}"
+            self.append_log(
+                f"{_clock_hms()} - User chose to skip {filename}"
             )
 
     def update_file_status_in_table(self, filepath, status):
@@ -5126,17 +6377,11 @@ class MainWindow(QMainWindow):
 
     def update_file_message_in_table(self, filepath, message):
         """Update the message of a file in the Transfer Status table"""
-        # Need to find the file using the transfer_rows dictionary
-        for file_key, row in self.transfer_rows.items():
-            # file_key format is "relative_path|absolute_path"
-            if '|' in file_key:
-                _, absolute_path = file_key.split('|', 1)
-                if absolute_path == filepath:
-                    if row < self.transfer_table.rowCount():
-                        message_item = self.transfer_table.item(row, 3)  # Message is in column 3
-                        if message_item:
-                            message_item.setText(message)
-                    break
+        row = self.transfer_rows.get(self.get_transfer_table_key(os.path.basename(filepath), filepath))
+        if row is not None and row < self.transfer_table.rowCount():
+            message_item = self.transfer_table.item(row, 3)  # Message is in column 3
+            if message_item:
+                message_item.setText(message)
 
     def closeEvent(self, event):
         """Handle application close"""
@@ -5144,6 +6389,7 @@ class MainWindow(QMainWindow):
         if self.observer and self.observer.is_alive():
             self.observer.stop()
             self.observer.join()
+        self.stop_existing_file_scan()
 
         # Stop processor
         self.file_processor.stop()
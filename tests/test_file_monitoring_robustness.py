@@ -110,8 +110,8 @@ class TestFileMonitoringRobustness:
         with open(test_file, "w") as f:
             f.write("test content")
 
-        # Mock os.path.getsize to raise permission error
-        with patch("os.path.getsize", side_effect=PermissionError("Access denied")):
+        # Mock os.stat to raise permission error
+        with patch("os.stat", side_effect=PermissionError("Access denied")):
             # This should not crash
             self.monitor._handle_file(test_file)
 
@@ -127,8 +127,8 @@ class TestFileMonitoringRobustness:
         with open(test_file, "w") as f:
             f.write("test content")
 
-        # Mock os.path.getsize to raise IO error
-        with patch("os.path.getsize", side_effect=OSError("File locked")):
+        # Mock os.stat to raise IO error
+        with patch("os.stat", side_effect=OSError("File locked")):
             # This should not crash
             self.monitor._handle_file(test_file)
 
@@ -299,6 +299,27 @@ class TestFileMonitoringRobustness:
         # Should have attempted retry
         assert len(retry_attempts) >= 1, "Should have attempted retry"
 
+    def test_repeat_events_do_not_reset_stability_window(self):
+        """Test that events for an unchanged pending file keep its first-seen time"""
+        test_file = os.path.join(self.temp_dir, "stable_file.raw")
+        with open(test_file, "w") as f:
+            f.write("stable content")
+        stat = os.stat(test_file)
+
+        first_seen = time.time() - 0.5
+        self.monitor.pending_files[test_file] = (stat.st_size, first_seen, stat.st_mtime_ns)
+
+        # Not stable long enough yet, and the event must not push the window back
+        self.monitor._handle_file(test_file)
+        assert self.file_queue.empty()
+        assert self.monitor.pending_files[test_file][1] == first_seen
+
+        # A same-size rewrite is a change and restarts the window
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.monitor._handle_file(test_file)
+        assert self.file_queue.empty()
+        assert self.monitor.pending_files[test_file][1] > first_seen
+
 
 if __name__ == "__main__":
     # Run tests
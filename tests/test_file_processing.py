@@ -51,6 +51,65 @@ class TestFileProcessor:
         assert len(checksum) == 64
         assert isinstance(checksum, str)
 
+    def test_calculate_checksum_partial_final_chunk(self, temp_dir, mock_app_instance, file_queue):
+        """Test streamed checksum matches hashlib when the file is not a multiple of chunk_size."""
+        import hashlib
+
+        file_path = os.path.join(temp_dir, "odd_size.raw")
+        content = os.urandom(10 * 1024 + 123)
+        with open(file_path, "wb") as f:
+            f.write(content)
+
+        processor = FileProcessor(file_queue, mock_app_instance)
+        checksum = processor.calculate_checksum(file_path, chunk_size=4096)
+
+        assert checksum == hashlib.sha256(content).hexdigest()
+
+    def test_calculate_checksum_mmap_path(self, large_sample_file, mock_app_instance, file_queue):
+        """Test the memory-mapped hashing path gives the same checksum as streaming."""
+        file_path, expected_size = large_sample_file
+        # Only files left alone for MMAP_QUIET_SECONDS are mapped
+        old_time = time.time() - 3600
+        os.utime(file_path, (old_time, old_time))
+
+        with patch("panoramabridge.MMAP_HASH_THRESHOLD", 1), patch("panoramabridge._MMAP_HASH_WINDOW", 4096):
+            mapped = FileProcessor(file_queue, mock_app_instance).calculate_checksum(file_path)
+
+        mock_app_instance.local_checksum_cache.clear()
+        streamed = FileProcessor(file_queue, mock_app_instance).calculate_checksum(file_path)
+
+        assert mapped == streamed
+
+    def test_recently_modified_file_not_mapped(self, large_sample_file, mock_app_instance, file_queue):
+        """Test a file that may still be written is hashed with reads, so a truncation cannot SIGBUS."""
+        file_path, expected_size = large_sample_file
+
+        with patch("panoramabridge.MMAP_HASH_THRESHOLD", 1), patch("panoramabridge.mmap.mmap") as mock_mmap:
+            FileProcessor(file_queue, mock_app_instance).calculate_checksum(file_path)
+
+        mock_mmap.assert_not_called()
+
+    def test_calculate_digests_single_pass(self, sample_file, mock_app_instance, file_queue):
+        """Test SHA256 and MD5 are computed together and cached for reuse."""
+        import hashlib
+
+        file_path, expected_size = sample_file
+        with open(file_path, "rb") as f:
+            content = f.read()
+        mock_app_instance.local_digest_cache = {}
+
+        processor = FileProcessor(file_queue, mock_app_instance)
+        digests = processor.calculate_digests(file_path, ("sha256", "md5"))
+
+        assert digests["sha256"] == hashlib.sha256(content).hexdigest()
+        assert digests["md5"] == hashlib.md5(content).hexdigest()
+
+        # Both digests are now cached, so no further file reads are needed
+        with patch("panoramabridge._hash_file_digests") as mock_hash:
+            assert processor.calculate_digests(file_path, ("md5",)) == {"md5": digests["md5"]}
+            assert processor.calculate_checksum(file_path) == digests["sha256"]
+            mock_hash.assert_not_called()
+
     def test_checksum_caching(self, sample_file, mock_app_instance, file_queue):
         """Test checksum caching functionality."""
         file_path, expected_size = sample_file
@@ -69,6 +128,189 @@ class TestFileProcessor:
 
         assert checksum1 == checksum2
 
+    def test_checksum_cache_hashes_unchanged_file_once(self, sample_file, mock_app_instance, file_queue):
+        """Test repeated checksum requests for an unchanged file only read it once."""
+        import panoramabridge
+
+        file_path, _ = sample_file
+        processor = FileProcessor(file_queue, mock_app_instance)
+
+        with patch("panoramabridge._hash_file", wraps=panoramabridge._hash_file) as mock_hash:
+            checksums = {processor.calculate_checksum(file_path) for _ in range(10)}
+            assert len(checksums) == 1
+            assert mock_hash.call_count == 1
+
+            # A same-size rewrite within the same second must still be re-hashed
+            stat = os.stat(file_path)
+            os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            processor.calculate_checksum(file_path)
+            assert mock_hash.call_count == 2
+
+    def test_checksum_reused_from_upload_history_after_restart(
+        self, sample_file, mock_app_instance, file_queue
+    ):
+        """Test an empty in-memory cache falls back to the persisted upload history entry."""
+        file_path, content = sample_file
+        stat = os.stat(file_path)
+        mock_app_instance.upload_history[file_path] = {
+            "checksum": "a" * 64,
+            "file_size": stat.st_size,
+            "file_mtime_ns": stat.st_mtime_ns,
+        }
+
+        processor = FileProcessor(file_queue, mock_app_instance)
+        with patch("panoramabridge._hash_file") as mock_hash:
+            assert processor.calculate_checksum(file_path) == "a" * 64
+            mock_hash.assert_not_called()
+
+        # Once the file changes, the history entry no longer applies
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert processor.calculate_checksum(file_path) != "a" * 64
+
+    def test_next_file_item_hashes_queued_files_ahead(self, temp_dir, mock_app_instance, file_queue):
+        """Test queued files that exist remotely are hashed into the cache in the background."""
+        paths = []
+        for i in range(3):
+            path = os.path.join(temp_dir, f"lookahead_{i}.raw")
+            with open(path, "wb") as f:
+                f.write(os.urandom(2048))
+            paths.append(path)
+            file_queue.put(path)
+
+        processor = FileProcessor(file_queue, mock_app_instance)
+        processor.webdav_client = Mock()
+        processor.webdav_client.get_file_info.return_value = {"exists": True}
+        try:
+            assert processor._next_file_item() == (paths[0], None)
+            assert [item for item, _ in processor._lookahead] == paths[1:]
+
+            # The second file's checksum is ready once its future completes
+            item, checksum_future = processor._next_file_item()
+            assert item == paths[1]
+            checksum_future.result(timeout=5)
+            with patch("panoramabridge._hash_file") as mock_hash:
+                processor.calculate_checksum(paths[1])
+                mock_hash.assert_not_called()
+        finally:
+            processor.stop()
+
+    def test_next_file_item_skips_hashing_new_remote_files(self, temp_dir, mock_app_instance, file_queue):
+        """Test files with no remote copy are left to be hashed during their upload."""
+        for i in range(2):
+            file_queue.put(os.path.join(temp_dir, f"new_{i}.raw"))
+
+        processor = FileProcessor(file_queue, mock_app_instance)
+        processor.webdav_client = Mock()
+        processor.webdav_client.get_file_info.return_value = {"exists": False}
+        try:
+            with patch.object(processor, "calculate_checksum") as mock_checksum:
+                processor._next_file_item()
+                _, checksum_future = processor._next_file_item()
+                checksum_future.result(timeout=5)
+                mock_checksum.assert_not_called()
+        finally:
+            processor.stop()
+
+    def test_run_processes_queued_files_concurrently(self, temp_dir, mock_app_instance, file_queue):
+        """Test the run loop hands queued files to concurrent workers."""
+        processor = FileProcessor(file_queue, mock_app_instance)
+        processor.webdav_client = Mock()
+        started = []
+        both_started = threading.Event()
+        release = threading.Event()
+
+        def blocking_process_file(filepath):
+            started.append(filepath)
+            if len(started) == 2:
+                both_started.set()
+            release.wait(timeout=5)
+
+        processor.process_file = blocking_process_file
+        for i in range(2):
+            file_queue.put(os.path.join(temp_dir, f"concurrent_{i}.raw"))
+
+        loop = threading.Thread(target=processor.run, daemon=True)
+        loop.start()
+        try:
+            # The first file is still in progress when the second one starts
+            assert both_started.wait(timeout=5)
+        finally:
+            release.set()
+            processor.stop()
+            loop.join(timeout=5)
+
+    def test_stop_wakes_idle_run_loop(self, mock_app_instance, file_queue):
+        """Test stop() ends a run loop that is blocked on an empty queue."""
+        processor = FileProcessor(file_queue, mock_app_instance)
+        loop = threading.Thread(target=processor.run, daemon=True)
+        loop.start()
+        time.sleep(0.1)
+
+        processor.stop()
+        loop.join(timeout=0.5)
+
+        assert not loop.is_alive()
+
+    def test_run_waits_for_running_uploads_after_stop(self, temp_dir, mock_app_instance, file_queue):
+        """Test run() does not return while an upload that already started is still going."""
+        processor = FileProcessor(file_queue, mock_app_instance)
+        processor.webdav_client = Mock()
+        started = threading.Event()
+        release = threading.Event()
+        finished = []
+
+        def blocking_process_file(filepath):
+            started.set()
+            release.wait(timeout=5)
+            finished.append(filepath)
+
+        processor.process_file = blocking_process_file
+        file_queue.put(os.path.join(temp_dir, "in_flight.raw"))
+
+        loop = threading.Thread(target=processor.run, daemon=True)
+        loop.start()
+        try:
+            assert started.wait(timeout=5)
+            processor.stop()
+            loop.join(timeout=0.3)
+            assert loop.is_alive()
+        finally:
+            release.set()
+            loop.join(timeout=5)
+
+        assert not loop.is_alive()
+        assert finished == [os.path.join(temp_dir, "in_flight.raw")]
+
+    def test_locked_file_retries_scheduled_from_upload_workers(
+        self, qtbot, mock_app_instance, file_queue
+    ):
+        """Test concurrent locked-file retries keep their count and start timers on the GUI thread."""
+        mock_app_instance.max_retries_spin.value.return_value = 100
+        processor = FileProcessor(file_queue, mock_app_instance)
+        timer_threads = []
+
+        def make_timer(*args):
+            timer_threads.append(threading.current_thread())
+            return MagicMock()
+
+        workers = [
+            threading.Thread(
+                target=processor.schedule_locked_file_retry,
+                args=("/data/locked.raw", "/remote/locked.raw", "locked.raw", "locked"),
+            )
+            for _ in range(50)
+        ]
+        with patch("panoramabridge.QTimer", side_effect=make_timer):
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(timeout=5)
+            # 50 retry timers plus the progress countdown started for the first attempt
+            qtbot.waitUntil(lambda: len(timer_threads) == 51, timeout=5000)
+
+        assert processor.locked_file_retries["/data/locked.raw"] == 50
+        assert all(thread is threading.main_thread() for thread in timer_threads)
+
     def test_set_webdav_client(self, mock_webdav_client, mock_app_instance, file_queue):
         """Test setting WebDAV client."""
         processor = FileProcessor(file_queue, mock_app_instance)
@@ -86,6 +328,17 @@ class TestFileProcessor:
 
         assert processor.local_base_path == "/local/path"
 
+    def test_created_directory_marks_parents(self, mock_app_instance, file_queue):
+        """Test a created remote directory also spares MKCOL for its parents."""
+        processor = FileProcessor(file_queue, mock_app_instance)
+
+        processor._mark_directory_created("/remote/run1/day2")
+
+        assert processor._should_create_directory("/remote/run1/day2") is False
+        assert processor._should_create_directory("/remote/run1") is False
+        assert processor._should_create_directory("/remote") is False
+        assert processor._should_create_directory("/remote/run2") is True
+
 
 class TestFileMonitorHandler:
     """Test file monitoring functionality."""
@@ -364,6 +364,27 @@ class TestInfiniteLoopFix:
         # All threads should return False (file unchanged)
         assert all(result is False for result in results)
 
+    def test_concurrent_new_file_queued_once(self, file_monitor_handler, mock_app_instance, sample_file):
+        """Test that concurrent events for a new file queue it exactly once."""
+        import threading
+
+        filepath, _ = sample_file
+        results = []
+        barrier = threading.Barrier(32)
+
+        def test_thread():
+            barrier.wait()
+            results.append(file_monitor_handler._should_queue_file(filepath))
+
+        threads = [threading.Thread(target=test_thread) for _ in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 1
+        assert filepath in mock_app_instance.queued_files
+
 
 class TestFileSystemEventIntegration:
     """Integration tests for file system events with infinite loop fix."""
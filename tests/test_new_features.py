@@ -26,17 +26,13 @@ def test_add_queued_file_to_table_method():
     mock_main_window.dir_input.text.return_value = "/test/directory"
 
     # Mock PyQt classes to avoid crashes in test environment
-    mock_progress_bar = Mock()
     mock_table_item = Mock()
 
     # Test the method logic without creating actual GUI components
     filepath = "/test/directory/test_file.raw"
 
     # Mock all PyQt components that the method uses
-    with (
-        patch("panoramabridge.QProgressBar", return_value=mock_progress_bar),
-        patch("panoramabridge.QTableWidgetItem", return_value=mock_table_item),
-    ):
+    with patch("panoramabridge.QTableWidgetItem", return_value=mock_table_item):
         # Create a simplified version of the method that avoids PyQt calls
         def mock_add_queued_file_to_table(self, filepath):
             # Simulate the core logic without actual GUI operations
@@ -119,6 +115,54 @@ def test_save_config_includes_checksum_cache():
         assert config_dict["local_checksum_cache"] == mock_main_window.local_checksum_cache
 
 
+def test_save_config_while_caches_change():
+    """Test save_config copes with worker threads writing to the caches during the save"""
+    import threading
+
+    from panoramabridge import MainWindow
+
+    mock_main_window = Mock()
+    for widget, value in [("dir_input", "/test/dir"), ("extensions_input", "raw"),
+                          ("url_input", "https://test.com"), ("username_input", "testuser"),
+                          ("remote_path_input", "/_webdav")]:
+        getattr(mock_main_window, widget).text.return_value = value
+    for check in ("subdirs_check", "save_creds_check", "verify_uploads_check"):
+        getattr(mock_main_window, check).isChecked.return_value = True
+    mock_main_window.auth_combo.currentText.return_value = "Basic"
+    mock_main_window.get_conflict_resolution_setting.return_value = "ask"
+    mock_main_window.local_checksum_cache = {f"file{i}|1|1": "abc" for i in range(20000)}
+    mock_main_window.local_digest_cache = {f"file{i}|1|1": {"md5": "def"} for i in range(20000)}
+    mock_main_window.remote_verification_cache = {
+        f"file{i}": (1, 1.0, "etag", "abc", "verified") for i in range(20000)
+    }
+    mock_main_window.save_config = MainWindow.save_config.__get__(mock_main_window)
+
+    stop = threading.Event()
+
+    def keep_writing():
+        # Like the upload and verification workers: insert new entries, trim old ones
+        i = 20000
+        while not stop.is_set():
+            mock_main_window.local_digest_cache[f"file{i}|1|1"] = {"md5": "def"}
+            mock_main_window.remote_verification_cache[f"file{i}"] = (1, 1.0, "etag", "abc", "verified")
+            mock_main_window.local_digest_cache.pop(f"file{i - 20000}|1|1", None)
+            mock_main_window.remote_verification_cache.pop(f"file{i - 20000}", None)
+            i += 1
+
+    writer = threading.Thread(target=keep_writing, daemon=True)
+    with patch("builtins.open"), patch("json.dump") as mock_json_dump, patch("os.replace"), \
+            patch("pathlib.Path.mkdir"):
+        writer.start()
+        try:
+            for _ in range(20):
+                mock_main_window.save_config()
+        finally:
+            stop.set()
+            writer.join(timeout=5)
+
+    assert mock_json_dump.call_count == 20
+
+
 def test_load_settings_loads_checksum_cache():
     """Test that load_settings loads checksum cache from config"""
     from panoramabridge import MainWindow
@@ -15,7 +15,13 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from panoramabridge import FileMonitorHandler, FileProcessor, MainWindow
+from panoramabridge import (
+    ExistingFileScanThread,
+    FileMonitorHandler,
+    FileProcessor,
+    MainWindow,
+    PollScheduler,
+)
 
 
 class TestChecksumCaching:
@@ -88,6 +94,65 @@ class TestFileMonitoringPerformance:
             assert test_file in queued_files, f"File {test_file} should have been queued"
 
 
+class TestExistingFileScan:
+    """Test the background scan for files present when monitoring starts."""
+
+    def test_scan_thread_reports_matching_files_in_batches(self, temp_dir):
+        """Test the scan skips hidden and non-matching files and batches the rest."""
+        for name in ["a.raw", "b.RAW", ".hidden.raw", "~lock.raw", "notes.txt"]:
+            with open(os.path.join(temp_dir, name), "w", encoding="utf-8") as f:
+                f.write("data")
+        os.makedirs(os.path.join(temp_dir, "sub"))
+        with open(os.path.join(temp_dir, "sub", "c.raw"), "w", encoding="utf-8") as f:
+            f.write("data")
+
+        main_window = Mock()
+        main_window.is_file_already_uploaded.return_value = (False, "not in history")
+
+        thread = ExistingFileScanThread(temp_dir, ["raw"], True, main_window)
+        thread.batch_size = 2
+        thread.batch_interval = 60
+        batches = []
+        finished = []
+        thread.files_found_signal.connect(batches.append)
+        thread.finished_signal.connect(lambda *args: finished.append(args))
+
+        # Run the thread synchronously
+        thread.run()
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        found = sorted(os.path.basename(filepath) for batch in batches for filepath, _, _ in batch)
+        assert found == ["a.raw", "b.RAW", "c.raw"]
+        assert finished[0][:2] == (3, 6)
+
+
+class TestPollScheduler:
+    """Test backoff of the backup polling timer."""
+
+    def test_idle_polls_back_off_geometrically_and_reset_on_activity(self):
+        """Test idle polls grow the delay up to the cap and a productive poll resets it."""
+        scheduler = PollScheduler(60_000, poll_backoff_max=240_000, poll_backoff_base=2.0)
+
+        delays = [scheduler.next_delay() for _ in range(4)]
+        assert delays == [120_000, 240_000, 240_000, 240_000]
+
+        assert scheduler.reset() == 60_000
+        assert scheduler.next_delay() == 120_000
+
+    def test_queue_activity_resets_backed_off_poll_timer(self):
+        """Test files queued outside polling bring the timer back to the user's interval."""
+        mock_window = Mock()
+        mock_window.poll_scheduler = PollScheduler(60_000)
+        mock_window.poll_scheduler.next_delay()
+        mock_window.poll_scheduler.next_delay()
+
+        MainWindow.reset_poll_backoff(mock_window)
+        MainWindow.reset_poll_backoff(mock_window)
+
+        assert mock_window.poll_scheduler.current_delay == 60_000
+        mock_window.poll_timer.setInterval.assert_called_once_with(60_000)
+
+
 class TestFileConflictResolution:
     """Test file conflict detection and resolution mechanisms."""
 
@@ -210,6 +275,150 @@ class TestFileConflictResolution:
         assert is_intact is False
         assert reason == "remote file not found"
 
+    def test_unchanged_file_uses_cached_verification(self, temp_dir, file_queue, mock_app_instance):
+        """Test that re-verifying an unchanged file with the same ETag skips the checksum download."""
+        test_file = os.path.join(temp_dir, "cached_test.raw")
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write("cached content for testing")
+
+        processor = FileProcessor(file_queue, mock_app_instance)
+        local_checksum = processor.calculate_checksum(test_file)
+        remote_path = "/remote/path/cached_test.raw"
+
+        mock_window = Mock()
+        mock_window.remote_verification_cache = {}
+        mock_window.verify_remote_file_integrity = MainWindow.verify_remote_file_integrity.__get__(mock_window, MainWindow)
+
+        mock_webdav = Mock()
+        mock_window.webdav_client = mock_webdav
+        mock_webdav.get_file_info.side_effect = lambda path: (
+            {"exists": True, "size": os.path.getsize(test_file), "etag": "abc123"}
+            if path == remote_path
+            else {"exists": True, "size": 64}
+        )
+        mock_webdav.download_file_head.return_value = local_checksum.encode("utf-8")
+
+        assert mock_window.verify_remote_file_integrity(test_file, remote_path, local_checksum) == (
+            True,
+            "Size + checksum verified",
+        )
+        mock_webdav.download_file_head.reset_mock()
+
+        # Second verification should be answered from the cache
+        is_intact, reason = mock_window.verify_remote_file_integrity(test_file, remote_path, local_checksum)
+
+        assert is_intact is True
+        assert reason == "Size + checksum verified"
+        mock_webdav.download_file_head.assert_not_called()
+
+    def test_sha256_etag_skips_checksum_file(self, temp_dir, file_queue, mock_app_instance):
+        """Test a SHA256 ETag equal to the local checksum verifies without touching the sidecar."""
+        test_file = os.path.join(temp_dir, "etag_test.raw")
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write("etag content for testing")
+
+        processor = FileProcessor(file_queue, mock_app_instance)
+        local_checksum = processor.calculate_checksum(test_file)
+        remote_path = "/remote/path/etag_test.raw"
+
+        mock_window = Mock()
+        mock_window.remote_verification_cache = {}
+        mock_window.verify_remote_file_integrity = MainWindow.verify_remote_file_integrity.__get__(mock_window, MainWindow)
+
+        mock_webdav = Mock()
+        mock_window.webdav_client = mock_webdav
+        mock_webdav.get_file_info.return_value = {
+            "exists": True,
+            "size": os.path.getsize(test_file),
+            "etag": local_checksum.upper(),
+        }
+
+        is_intact, reason = mock_window.verify_remote_file_integrity(test_file, remote_path, local_checksum)
+
+        assert is_intact is True
+        assert reason == "Size + ETag verified"
+        mock_webdav.get_file_info.assert_called_once_with(remote_path)
+        mock_webdav.download_file_head.assert_not_called()
+
+    def test_md5_etag_verified_from_upload_digest(self, temp_dir, file_queue, mock_app_instance):
+        """Test an MD5 ETag is compared with the digest cached at upload time, not a fresh read."""
+        import hashlib
+
+        test_file = os.path.join(temp_dir, "md5_etag_test.raw")
+        content = b"md5 etag content for testing"
+        with open(test_file, "wb") as f:
+            f.write(content)
+        md5_digest = hashlib.md5(content).hexdigest()
+
+        mock_app_instance.local_digest_cache = {}
+        processor = FileProcessor(file_queue, mock_app_instance)
+        cache_key = f"{test_file}|{len(content)}|{os.stat(test_file).st_mtime_ns}"
+        processor._cache_digests(test_file, cache_key, {"sha256": hashlib.sha256(content).hexdigest(), "md5": md5_digest})
+
+        mock_window = Mock()
+        mock_window.remote_verification_cache = {}
+        mock_window.file_processor = processor
+        mock_window.verify_remote_file_integrity = MainWindow.verify_remote_file_integrity.__get__(mock_window, MainWindow)
+
+        mock_webdav = Mock()
+        mock_window.webdav_client = mock_webdav
+        mock_webdav.get_file_info.side_effect = lambda path: (
+            {"exists": True, "size": len(content), "etag": md5_digest}
+            if path == "/remote/md5_etag_test.raw"
+            else {"exists": False}
+        )
+
+        with patch("panoramabridge._hash_file_digests") as mock_hash:
+            is_intact, reason = mock_window.verify_remote_file_integrity(
+                test_file, "/remote/md5_etag_test.raw", hashlib.sha256(content).hexdigest()
+            )
+            mock_hash.assert_not_called()
+
+        assert (is_intact, reason) == (True, "Size + ETag verified")
+
+    def test_conditional_get_uses_last_verified_etag(self, temp_dir, file_queue, mock_app_instance):
+        """Test the 304 shortcut only applies when the ETag matches the one stored at the last verification."""
+        test_file = os.path.join(temp_dir, "conditional_test.raw")
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write("conditional content for testing")
+        local_size = os.path.getsize(test_file)
+        remote_path = "/remote/path/conditional_test.raw"
+
+        mock_window = Mock()
+        mock_window.verify_remote_file_integrity = MainWindow.verify_remote_file_integrity.__get__(mock_window, MainWindow)
+        mock_webdav = Mock()
+        mock_window.webdav_client = mock_webdav
+        mock_webdav.verify_unchanged.return_value = True
+        with open(test_file, "rb") as f:
+            mock_webdav.download_file_head.return_value = f.read()
+
+        def remote_with_etag(etag):
+            return lambda path: (
+                {"exists": True, "size": local_size, "etag": etag} if path == remote_path else {"exists": False}
+            )
+
+        # Verified before under "abc123"; the local mtime has changed since
+        mock_window.remote_verification_cache = {
+            test_file: (local_size, 0.0, "abc123", "checksum", "Size + checksum verified")
+        }
+        mock_webdav.get_file_info.side_effect = remote_with_etag("abc123")
+        assert mock_window.verify_remote_file_integrity(test_file, remote_path, "checksum") == (
+            True,
+            "Size + checksum verified",
+        )
+        mock_webdav.verify_unchanged.assert_called_once_with(remote_path, "abc123")
+        mock_webdav.download_file_head.assert_not_called()
+
+        # A different ETag is a different remote version, so the content is checked
+        mock_webdav.verify_unchanged.reset_mock()
+        mock_webdav.get_file_info.side_effect = remote_with_etag("def456")
+        assert mock_window.verify_remote_file_integrity(test_file, remote_path, "checksum") == (
+            True,
+            "Size + prefix verified",
+        )
+        mock_webdav.verify_unchanged.assert_not_called()
+        mock_webdav.download_file_head.assert_called_once_with(remote_path, 8192)
+
 
 class TestErrorHandling:
     """Test error handling and recovery mechanisms."""
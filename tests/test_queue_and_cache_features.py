@@ -39,11 +39,8 @@ class TestQueueTableIntegration:
 
         return mock_window
 
-    @patch("panoramabridge.QProgressBar")
     @patch("panoramabridge.QTableWidgetItem")
-    def test_add_queued_file_to_table_basic(
-        self, mock_table_item, mock_progress_bar, mock_main_window
-    ):
+    def test_add_queued_file_to_table_basic(self, mock_table_item, mock_main_window):
         """Test that queued files are added to the transfer table"""
         filepath = "/test/directory/test_file.raw"
 
@@ -67,17 +64,13 @@ class TestQueueTableIntegration:
         assert mock_main_window.transfer_rows[expected_key] == 0
 
         # Verify table items were created
-        assert mock_table_item.call_count >= 3  # filename, status, message (removed path column)
-        assert mock_progress_bar.called  # progress bar was created
+        assert mock_table_item.call_count == 4  # filename, status, progress, message
 
-        # Verify setCellWidget was called for progress bar
-        mock_main_window.transfer_table.setCellWidget.assert_called_once()
+        # Progress is painted from item data, not a per-row cell widget
+        mock_main_window.transfer_table.setCellWidget.assert_not_called()
 
-    @patch("panoramabridge.QProgressBar")
     @patch("panoramabridge.QTableWidgetItem")
-    def test_add_queued_file_duplicate_prevention(
-        self, mock_table_item, mock_progress_bar, mock_main_window
-    ):
+    def test_add_queued_file_duplicate_prevention(self, mock_table_item, mock_main_window):
         """Test that duplicate files are not added to the table"""
         filepath = "/test/directory/test_file.raw"
         filename = os.path.basename(filepath)
@@ -108,13 +101,9 @@ class TestQueueTableIntegration:
 
         # Verify no table items were created
         mock_table_item.assert_not_called()
-        mock_progress_bar.assert_not_called()
 
-    @patch("panoramabridge.QProgressBar")
     @patch("panoramabridge.QTableWidgetItem")
-    def test_add_queued_file_relative_path_display(
-        self, mock_table_item, mock_progress_bar, mock_main_window
-    ):
+    def test_add_queued_file_relative_path_display(self, mock_table_item, mock_main_window):
         """Test that relative paths are calculated correctly"""
         base_dir = "/test/directory"
         filepath = "/test/directory/subfolder/test_file.raw"
@@ -132,26 +121,40 @@ class TestQueueTableIntegration:
         # Check that setItem was called for each column
         assert mock_main_window.transfer_table.setItem.call_count >= 3
 
-    @patch("panoramabridge.QProgressBar")
     @patch("panoramabridge.QTableWidgetItem")
-    def test_add_queued_file_progress_bar_hidden(
-        self, mock_table_item, mock_progress_bar, mock_main_window
-    ):
-        """Test that progress bar is created but hidden for queued files"""
+    def test_add_queued_file_progress_bar_hidden(self, mock_table_item, mock_main_window):
+        """Test that the progress cell is created without a bar for queued files"""
         filepath = "/test/directory/test_file.raw"
 
-        # Mock the progress bar instance
-        mock_progress_instance = Mock()
-        mock_progress_bar.return_value = mock_progress_instance
+        # Mock the table item instances
+        mock_item_instance = Mock()
+        mock_table_item.return_value = mock_item_instance
 
         # Call the method
         mock_main_window.add_queued_file_to_table(filepath)
 
-        # Verify progress bar was configured correctly
-        mock_progress_instance.setValue.assert_called_with(0)
-        mock_progress_instance.setVisible.assert_called_with(
-            False
-        )  # Should be hidden for queued files
+        # A progress of None tells ProgressBarDelegate not to draw a bar
+        mock_item_instance.setData.assert_called_with(panoramabridge.PROGRESS_ROLE, None)
+
+
+    def test_clear_completed_transfers_renumbers_remaining_rows(self, mock_main_window):
+        """Test that clearing finished rows keeps the remaining rows' indexes in step"""
+        statuses = ["Complete", "Queued", "Failed", "Failed", "Uploading", "Complete"]
+        mock_main_window.transfer_rows = {f"file{row}": row for row in range(len(statuses))}
+        mock_main_window.failed_files = {"file2": {"row": 2}}
+        mock_main_window.transfer_table.item.side_effect = lambda row, column: Mock(
+            text=Mock(return_value=statuses[row])
+        )
+        mock_main_window.clear_completed_transfers = (
+            panoramabridge.MainWindow.clear_completed_transfers.__get__(mock_main_window)
+        )
+
+        mock_main_window.clear_completed_transfers()
+
+        removed = [call.args[0] for call in mock_main_window.transfer_table.removeRow.call_args_list]
+        assert removed == [5, 3, 2, 0]
+        assert mock_main_window.transfer_rows == {"file1": 0, "file4": 1}
+        assert mock_main_window.failed_files == {}
 
 
 class TestPersistentChecksumCaching:
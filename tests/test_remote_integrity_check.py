@@ -17,6 +17,7 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -368,6 +369,53 @@ class TestRemoteIntegrityCheck:
 
         print("Error handling test passed!")
 
+    def test_worker_pool_verifies_many_files_with_shared_caches(self):
+        """Test the verification pool across more files than workers, sharing the real caches"""
+        files = [
+            create_test_file(os.path.join(self.local_dir, "pool", f"pool_{i}.txt"), f"Pool file {i}")
+            for i in range(IntegrityCheckThread.max_workers + 4)
+        ]
+        removed_file = os.path.join(self.local_dir, "pool", "removed.txt")
+        checksums = {path: calculate_file_checksum(path) for path in files}
+
+        main_window = Mock()
+        main_window.upload_history = {
+            path: {"remote_path": f"/remote/{os.path.basename(path)}", "checksum": checksum}
+            for path, checksum in checksums.items()
+        }
+        main_window.upload_history[removed_file] = {"remote_path": "/remote/removed.txt", "checksum": "gone"}
+        main_window.upload_history_lock = threading.RLock()
+        main_window.forget_upload = MainWindow.forget_upload.__get__(main_window, MainWindow)
+        main_window.remote_verification_cache = {}
+        main_window.verify_remote_file_integrity = MainWindow.verify_remote_file_integrity.__get__(
+            main_window, MainWindow
+        )
+        main_window.file_processor = Mock(spec=FileProcessor)
+        main_window.file_processor.calculate_checksum.side_effect = calculate_file_checksum
+
+        remote_files = {f"/remote/{os.path.basename(path)}": path for path in files}
+
+        def get_file_info(path, prefetch_directory=False):
+            if path in remote_files:
+                return {"exists": True, "size": os.path.getsize(remote_files[path]), "etag": f"etag-{path}"}
+            return {"exists": path.endswith(".checksum")}
+
+        main_window.webdav_client = Mock()
+        main_window.webdav_client.get_file_info.side_effect = get_file_info
+        main_window.webdav_client.download_file_head.side_effect = (
+            lambda path, size: checksums[remote_files[path[: -len(".checksum")]]].encode("utf-8")
+        )
+
+        thread = IntegrityCheckThread(files + [removed_file], main_window)
+        finished = []
+        thread.finished_signal.connect(lambda results, details: finished.append(results))
+        thread.run()
+
+        assert finished[0]["verified"] == len(files)
+        assert finished[0]["errors"] == 0
+        assert removed_file not in main_window.upload_history
+        assert set(main_window.remote_verification_cache) == set(files)
+
 def run_all_tests():
     """Run all tests"""
     test_instance = TestRemoteIntegrityCheck()
@@ -381,6 +429,7 @@ def run_all_tests():
         test_instance.test_startup_integrity_verification_logic()
         test_instance.test_missing_file_handling()
         test_instance.test_verification_error_handling()
+        test_instance.test_worker_pool_verifies_many_files_with_shared_caches()
 
         print("\nALL TESTS PASSED!")
         print("\nRemote Integrity Check implementation is working correctly:")
@@ -402,6 +451,7 @@ def run_all_tests():
     finally:
         test_instance.teardown_method()
 
+
 if __name__ == "__main__":
     print("Remote Integrity Check Test Suite")
     print("=" * 50)
@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import QApplication
 # Add the parent directory to the path to import panoramabridge
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from panoramabridge import FileMonitorHandler
+from panoramabridge import FileMonitorHandler, MainWindow
 
 
 class TestThreadSafeUIUpdates(unittest.TestCase):
@@ -247,6 +247,11 @@ class TestThreadSafeUIUpdates(unittest.TestCase):
             # Verify UI update was attempted
             self.assertGreater(len(invoke_calls), 0, "UI update should have been attempted")
 
+    def test_add_queued_file_to_table_is_registered_slot(self):
+        """Test that the invokeMethod target is a slot Qt can resolve by name"""
+        index = MainWindow.staticMetaObject.indexOfMethod("add_queued_file_to_table(QString)")
+        self.assertNotEqual(index, -1, "add_queued_file_to_table must keep its @pyqtSlot(str)")
+
 
 if __name__ == "__main__":
     unittest.main()
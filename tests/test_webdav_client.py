@@ -7,6 +7,7 @@ import os
 # Import the module under test
 import sys
 import tempfile
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -34,6 +35,15 @@ class TestWebDAVClient:
         assert client.password == webdav_test_config["password"]
         # Chunk size is now dynamically determined per upload, not a fixed attribute
 
+    def test_session_uses_pooled_adapter(self, webdav_test_config):
+        """Test the session keeps a larger connection pool and retries only safe methods."""
+        client = WebDAVClient(**webdav_test_config)
+
+        adapter = client.session.get_adapter(webdav_test_config["url"])
+        assert adapter._pool_maxsize == 32
+        assert "PROPFIND" in adapter.max_retries.allowed_methods
+        assert "PUT" not in adapter.max_retries.allowed_methods
+
     @patch("panoramabridge.requests.Session.request")
     def test_connection_success(self, mock_request, webdav_test_config):
         """Test successful connection."""
@@ -81,7 +91,7 @@ class TestWebDAVClient:
         # Mock PROPFIND response
         mock_response = Mock()
         mock_response.status_code = 207
-        mock_response.text = """<?xml version="1.0"?>
+        mock_response.content = b"""<?xml version="1.0"?>
         <multistatus xmlns="DAV:">
             <response>
                 <href>/test/file1.raw</href>
@@ -104,6 +114,90 @@ class TestWebDAVClient:
         assert items[0]["size"] == 1024
         assert items[0]["is_dir"] is False
 
+        # Revisiting the folder within the TTL is answered from the cache
+        assert client.list_directory("/test/") == items
+        assert mock_request.call_count == 1
+
+    @patch("panoramabridge.requests.Session.request")
+    def test_walk_caches_subtree_listings(self, mock_request, webdav_test_config):
+        """Test one Depth infinity PROPFIND answers list_directory for every folder below it."""
+        mock_response = Mock()
+        mock_response.status_code = 207
+        mock_response.content = b"""<?xml version="1.0"?>
+        <multistatus xmlns="DAV:">
+            <response>
+                <href>/test/</href>
+                <propstat><prop><resourcetype><collection/></resourcetype></prop></propstat>
+            </response>
+            <response>
+                <href>/test/run1/</href>
+                <propstat><prop><resourcetype><collection/></resourcetype></prop></propstat>
+            </response>
+            <response>
+                <href>/test/run1/file1.raw</href>
+                <propstat><prop><getcontentlength>1024</getcontentlength><resourcetype/></prop></propstat>
+            </response>
+        </multistatus>"""
+        mock_request.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+        # A folder changed while the walk was in flight keeps its newer listing
+        new_dir = {"name": "new_dir", "path": "/test/new_dir", "is_dir": True, "size": 0}
+        client._listing_cache["/test/run1"] = (time.monotonic(), [new_dir])
+        assert client.walk("/test") is True
+        assert mock_request.call_args.kwargs["headers"]["Depth"] == "infinity"
+        assert client.list_directory("/test/run1") == [new_dir]
+        del client._listing_cache["/test/run1"]
+        assert client.walk("/test") is True
+
+        assert [item["name"] for item in client.list_directory("/test")] == ["run1"]
+        run1_items = client.list_directory("/test/run1")
+        assert run1_items[0]["name"] == "file1.raw"
+        assert run1_items[0]["size"] == 1024
+        assert mock_request.call_count == 2
+
+    @patch("panoramabridge.requests.Session.request")
+    def test_mkcol_updates_cached_listing(self, mock_request, webdav_test_config):
+        """Test a created directory appears in the cached parent listing without a re-list."""
+        mock_request.return_value = Mock(status_code=201, reason="Created")
+        client = WebDAVClient(**webdav_test_config)
+        client._listing_cache["/test"] = (time.monotonic(), [])
+
+        assert client.create_directory("/test/new_dir") is True
+        mock_request.reset_mock()
+
+        items = client.list_directory("/test")
+        assert [(item["name"], item["is_dir"]) for item in items] == [("new_dir", True)]
+        assert client.list_directory("/test/new_dir") == []
+        mock_request.assert_not_called()
+
+    @patch("panoramabridge.requests.Session.request")
+    def test_digest_auth_negotiated_once_per_thread(self, mock_request, webdav_test_config):
+        """Test a Digest client settles the challenge before streaming, and only until one succeeded."""
+        challenged = Mock(status_code=200, history=[Mock(status_code=401)])
+        mock_request.return_value = challenged
+        client = WebDAVClient(**{**webdav_test_config, "auth_type": "digest"})
+        assert client._note_auth_round_trip in client.session.hooks["response"]
+
+        client._ensure_auth_negotiated()
+        assert mock_request.call_args.args[0] == "OPTIONS"
+
+        # requests runs the session hook on the response that answered the challenge
+        mock_request.reset_mock()
+        client._note_auth_round_trip(challenged)
+        client._ensure_auth_negotiated()
+        mock_request.assert_not_called()
+
+    @patch("panoramabridge.requests.Session.request")
+    def test_digest_warm_up_skipped_when_options_unchallenged(self, mock_request, webdav_test_config):
+        """Test no OPTIONS is sent before each upload when the server never challenges it."""
+        mock_request.return_value = Mock(status_code=200, history=[])
+        client = WebDAVClient(**{**webdav_test_config, "auth_type": "digest"})
+
+        client._ensure_auth_negotiated()
+        client._ensure_auth_negotiated()
+        assert mock_request.call_count == 1
+
     @patch("panoramabridge.requests.Session.get")
     def test_download_file(self, mock_get, webdav_test_config, temp_dir):
         """Test file download."""
@@ -165,6 +259,18 @@ class TestWebDAVClient:
         assert result is True
         mock_request.assert_called_once_with("MKCOL", f"{webdav_test_config['url']}/test/new_dir")
 
+    @patch("panoramabridge.requests.Session.request")
+    def test_create_directory_reports_status(self, mock_request, webdav_test_config):
+        """Test a refused MKCOL reports its HTTP status."""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_request.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+
+        assert client.create_directory_with_status("/test/new_dir") == (False, 403)
+        assert client.create_directory("/test/new_dir") is False
+
     def test_should_show_item_filtering(self, webdav_test_config):
         """Test file/directory filtering logic."""
         client = WebDAVClient(**webdav_test_config)
@@ -227,7 +333,7 @@ class TestWebDAVClient:
         # Mock PROPFIND response
         mock_response = Mock()
         mock_response.status_code = 207
-        mock_response.text = """<?xml version="1.0" encoding="utf-8"?>
+        mock_response.content = b"""<?xml version="1.0" encoding="utf-8"?>
         <multistatus xmlns="DAV:">
             <response>
                 <href>/test/file.raw</href>
@@ -261,8 +367,27 @@ class TestWebDAVClient:
 
         # Verify XML body has correct encoding (no spaces around dash)
         xml_body = call_args[1]["data"]
-        assert 'encoding="utf-8"' in xml_body
-        assert 'encoding="utf - 8"' not in xml_body  # Ensure malformed version is not present
+        assert b'encoding="utf-8"' in xml_body
+        assert b'encoding="utf - 8"' not in xml_body  # Ensure malformed version is not present
+
+    @patch("panoramabridge.requests.Session.request")
+    def test_get_file_info_weak_etag(self, mock_request, webdav_test_config):
+        """Test that weak ETags are normalized to their opaque value."""
+        mock_response = Mock()
+        mock_response.status_code = 207
+        mock_response.content = b"""<?xml version="1.0" encoding="utf-8"?>
+        <multistatus xmlns="DAV:">
+            <response>
+                <href>/test/file.raw</href>
+                <propstat><prop><getetag>W/"abc123"</getetag></prop></propstat>
+            </response>
+        </multistatus>"""
+        mock_request.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+        info = client.get_file_info("/test/file.raw")
+
+        assert info["etag"] == "abc123"
 
     @patch("panoramabridge.requests.Session.request")
     def test_get_file_info_not_found(self, mock_request, webdav_test_config):
@@ -290,6 +415,115 @@ class TestWebDAVClient:
 
         assert info is None
 
+    @patch("panoramabridge.requests.Session.request")
+    def test_prefetch_directory_info_serves_get_file_info(self, mock_request, webdav_test_config):
+        """Test that a directory prefetch answers get_file_info without further requests."""
+        mock_response = Mock()
+        mock_response.status_code = 207
+        mock_response.content = b"""<?xml version="1.0" encoding="utf-8"?>
+        <multistatus xmlns="DAV:">
+            <response>
+                <href>/test/</href>
+                <propstat><prop><displayname>test</displayname></prop></propstat>
+            </response>
+            <response>
+                <href>/test/file.raw</href>
+                <propstat>
+                    <prop>
+                        <getcontentlength>1024</getcontentlength>
+                        <getetag>"abc123"</getetag>
+                    </prop>
+                </propstat>
+            </response>
+        </multistatus>"""
+        mock_request.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+        assert client.prefetch_directory_info("/test") is True
+        assert mock_request.call_args[1]["headers"]["Depth"] == "1"
+
+        info = client.get_file_info("/test/file.raw")
+        missing = client.get_file_info("/test/file.raw.checksum")
+
+        assert info["exists"] is True
+        assert info["size"] == 1024
+        assert info["etag"] == "abc123"
+        assert missing["exists"] is False
+        mock_request.assert_called_once()
+
+    @patch("panoramabridge.requests.Session.request")
+    def test_get_file_info_prefetches_parent_directory(self, mock_request, webdav_test_config):
+        """Test that lookups for files in one directory share a single Depth 1 PROPFIND."""
+        mock_response = Mock()
+        mock_response.status_code = 207
+        mock_response.content = b"""<?xml version="1.0" encoding="utf-8"?>
+        <multistatus xmlns="DAV:">
+            <response>
+                <href>/test/</href>
+                <propstat><prop><displayname>test</displayname></prop></propstat>
+            </response>
+            <response>
+                <href>/test/a.raw</href>
+                <propstat><prop><getcontentlength>10</getcontentlength></prop></propstat>
+            </response>
+        </multistatus>"""
+        mock_request.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+        assert client.get_file_info("/test/a.raw", prefetch_directory=True)["size"] == 10
+        assert client.get_file_info("/test/b.raw", prefetch_directory=True)["exists"] is False
+        mock_request.assert_called_once()
+        assert mock_request.call_args[1]["headers"]["Depth"] == "1"
+
+        # An upload forgets only its own entry, which is then looked up on its own
+        client.invalidate_file_info("/test/b.raw")
+        client.get_file_info("/test/b.raw", prefetch_directory=True)
+        assert mock_request.call_args[1]["headers"]["Depth"] == "0"
+        client.get_file_info("/test/a.raw", prefetch_directory=True)
+        assert mock_request.call_count == 2
+
+    @patch("panoramabridge.requests.Session.get")
+    def test_download_file_head_streams_partial_read(self, mock_get, webdav_test_config):
+        """Test that only the requested bytes are read even if the server ignores Range."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.raw.read.return_value = b"x" * 8192
+        mock_get.return_value.__enter__.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+        data = client.download_file_head("/test/file.raw", 8192)
+
+        assert data == b"x" * 8192
+        mock_response.raw.read.assert_called_once_with(8192, decode_content=True)
+        assert mock_get.call_args[1]["stream"] is True
+        assert mock_get.call_args[1]["headers"]["Range"] == "bytes=0-8191"
+
+    @patch("panoramabridge.requests.Session.get")
+    def test_verify_unchanged_not_modified(self, mock_get, webdav_test_config):
+        """Test that a 304 response to the conditional GET confirms the file."""
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_get.return_value.__enter__.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+
+        assert client.verify_unchanged("/test/file.raw", "abc123") is True
+        headers = mock_get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == '"abc123"'
+        assert headers["Range"] == "bytes=0-0"
+
+    @patch("panoramabridge.requests.Session.get")
+    def test_verify_unchanged_etag_changed(self, mock_get, webdav_test_config):
+        """Test that a different ETag on a full response is reported as changed."""
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.headers = {"ETag": '"other"'}
+        mock_get.return_value.__enter__.return_value = mock_response
+
+        client = WebDAVClient(**webdav_test_config)
+
+        assert client.verify_unchanged("/test/file.raw", "abc123") is False
+
     @patch("panoramabridge.requests.Session.put")
     def test_upload_403_forbidden_chunked(self, mock_put, webdav_test_config, sample_file):
         """Test that HTTP 403 on chunked upload fails immediately with error message."""
@@ -344,6 +578,66 @@ class TestWebDAVClient:
         # Should have called put 3 times (2 failures + 1 success)
         assert mock_put.call_count == 3
 
+    @patch("panoramabridge.requests.Session.put")
+    def test_upload_reports_checksum_of_sent_bytes(self, mock_put, webdav_test_config, sample_file):
+        """Test that the upload digests the bytes it sends when a checksum callback is given."""
+        import hashlib
+
+        file_path, content = sample_file
+
+        def consume_body(url, data=None, headers=None, timeout=None):
+            # Small files arrive as a mapped memoryview, larger ones as a readable stream
+            while hasattr(data, "read") and data.read():
+                pass
+            return Mock(status_code=201)
+
+        mock_put.side_effect = consume_body
+
+        client = WebDAVClient(**webdav_test_config)
+        checksums = []
+        success, error = client.upload_file_chunked(
+            file_path, "/test/file.raw", checksum_callback=checksums.append
+        )
+
+        assert success is True
+        assert checksums == [
+            {"sha256": hashlib.sha256(content).hexdigest(), "md5": hashlib.md5(content).hexdigest()}
+        ]
+
+    @patch("panoramabridge.requests.Session.put")
+    def test_small_file_sent_from_memory_map(self, mock_put, webdav_test_config, sample_file):
+        """Test files up to MMAP_UPLOAD_THRESHOLD are sent as one memoryview with a Content-Length."""
+        file_path, content = sample_file
+        old_time = time.time() - 3600
+        os.utime(file_path, (old_time, old_time))
+        sent = []
+
+        def capture_body(url, data=None, headers=None, timeout=None):
+            sent.append((type(data), bytes(data), headers["Content-Length"]))
+            return Mock(status_code=201)
+
+        mock_put.side_effect = capture_body
+
+        client = WebDAVClient(**webdav_test_config)
+        success, error = client.upload_file_chunked(file_path, "/test/file.raw")
+
+        assert success is True
+        assert sent == [(memoryview, content, str(len(content)))]
+
+    @patch("panoramabridge.requests.Session.put")
+    def test_recently_modified_small_file_not_mapped(self, mock_put, webdav_test_config, sample_file):
+        """Test a small file that may still be written is streamed rather than memory-mapped."""
+        file_path, content = sample_file
+        mock_put.return_value = Mock(status_code=201)
+
+        client = WebDAVClient(**webdav_test_config)
+        with patch("panoramabridge.mmap.mmap") as mock_mmap:
+            success, error = client.upload_file_chunked(file_path, "/test/file.raw")
+
+        assert success is True
+        mock_mmap.assert_not_called()
+        assert not isinstance(mock_put.call_args.kwargs["data"], memoryview)
+
     @patch("panoramabridge.requests.Session.put")
     def test_upload_502_max_retries_exceeded(self, mock_put, webdav_test_config, sample_file):
         """Test that upload fails after max retries with 502."""